@@ -0,0 +1,52 @@
+# alembic/env.py
+# 마이그레이션 실행 환경. 모델 메타데이터와 DB 주소는 앱 코드에서 가져옵니다.
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.database import Base, SQLALCHEMY_DATABASE_URL, get_engine
+from app import models  # noqa: F401  (autogenerate 를 위해 테이블 메타데이터 등록)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def _url() -> str:
+    return config.get_main_option("sqlalchemy.url") or SQLALCHEMY_DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트만 출력합니다. (alembic upgrade head --sql)"""
+    url = _url()
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        # SQLite 는 ALTER TABLE 이 제한적이라 batch 모드(테이블 재생성)로 변경합니다.
+        render_as_batch=url.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connectable = get_engine()
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
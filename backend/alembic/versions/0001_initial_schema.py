@@ -0,0 +1,211 @@
+"""initial schema (기존 create_all 로 만들던 테이블)
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-19
+
+기존 개발용 DB 는 이미 이 스키마를 가지고 있으므로 'alembic stamp 0001_initial_schema' 후
+'alembic upgrade head' 를 실행하면 됩니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_initial_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# 모델의 Enum 과 같은 이름/값 (SQLAlchemy 기본 이름: 클래스명 소문자)
+clothing_category = sa.Enum("티셔츠", "바지", "드레스", "자켓", "악세서리", name="clothingcategoryenum")
+party_submission_status = sa.Enum("PENDING", "APPROVED", "REJECTED", name="partysubmissionstatusenum")
+credit_type = sa.Enum(
+    "EARNED_CLOTHING", "EARNED_EVENT", "SPENT_REWARD", "SPENT_OFFSET", "SPENT_MAKER_PURCHASE",
+    name="credittypeenum",
+)
+reward_type = sa.Enum("GOODS", "SERVICE", name="rewardtypeenum")
+participant_status = sa.Enum("PENDING", "ACCEPTED", "REJECTED", "ATTENDED", name="partyparticipantstatusenum")
+party_status = sa.Enum("PENDING_APPROVAL", "UPCOMING", "COMPLETED", "REJECTED", name="partystatusenum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("nickname", sa.String(), nullable=False, unique=True),
+        sa.Column("email", sa.String(), nullable=False, unique=True),
+        sa.Column("phone_number", sa.String(), nullable=True),
+        sa.Column("is_admin", sa.Boolean(), nullable=True),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+    )
+    op.create_table(
+        "makers",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("specialty", sa.String()),
+        sa.Column("location", sa.String()),
+        sa.Column("bio", sa.Text()),
+        sa.Column("image_url", sa.String()),
+    )
+    op.create_table(
+        "rewards",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("cost", sa.Integer(), nullable=False),
+        sa.Column("image_url", sa.String()),
+        sa.Column("type", reward_type, nullable=False),
+    )
+    op.create_table(
+        "tags",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(), nullable=False, unique=True),
+    )
+    op.create_table(
+        "performance_reports",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("excerpt", sa.Text()),
+    )
+    op.create_table(
+        "table_versions",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_table(
+        "user_neighbors",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("neighbor_id", sa.String(), sa.ForeignKey("users.id"), primary_key=True),
+    )
+    op.create_table(
+        "parties",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("location", sa.String()),
+        sa.Column("image_url", sa.String()),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.Column("status", party_status, nullable=False),
+        sa.Column("invitation_code", sa.String(), nullable=False, unique=True),
+        sa.Column("host_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("impact_items_exchanged", sa.Integer(), nullable=True),
+        sa.Column("impact_water_saved", sa.Integer(), nullable=True),
+        sa.Column("impact_co2_reduced", sa.Integer(), nullable=True),
+        sa.Column("kit_participants", sa.Integer(), nullable=True),
+        sa.Column("kit_items_per_person", sa.Integer(), nullable=True),
+        sa.Column("kit_cost", sa.Integer(), nullable=True),
+    )
+    op.create_table(
+        "clothing_items",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("category", clothing_category, nullable=False),
+        sa.Column("size", sa.String(), nullable=True),
+        sa.Column("image_url", sa.String(), nullable=False),
+        sa.Column("user_nickname", sa.String(), nullable=False),
+        sa.Column("is_listed_for_exchange", sa.Boolean(), nullable=False),
+        sa.Column("party_submission_status", party_submission_status, nullable=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("submitted_party_id", sa.String(), sa.ForeignKey("parties.id"), nullable=True),
+    )
+    op.create_table(
+        "goodbye_tags",
+        sa.Column("clothing_item_id", sa.String(), sa.ForeignKey("clothing_items.id"), primary_key=True),
+        sa.Column("met_when", sa.String()),
+        sa.Column("met_where", sa.String()),
+        sa.Column("why_got", sa.Text()),
+        sa.Column("worn_count", sa.Integer()),
+        sa.Column("why_let_go", sa.Text()),
+        sa.Column("final_message", sa.Text()),
+    )
+    op.create_table(
+        "hello_tags",
+        sa.Column("clothing_item_id", sa.String(), sa.ForeignKey("clothing_items.id"), primary_key=True),
+        sa.Column("received_from", sa.String()),
+        sa.Column("received_at", sa.String()),
+        sa.Column("first_impression", sa.Text()),
+        sa.Column("hello_message", sa.Text()),
+    )
+    op.create_table(
+        "credits",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("date", sa.DateTime()),
+        sa.Column("activity_name", sa.String(), nullable=False),
+        sa.Column("type", credit_type, nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+    )
+    op.create_table(
+        "stories",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("author", sa.String(), nullable=False),
+        sa.Column("excerpt", sa.Text()),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("image_url", sa.String()),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("party_id", sa.String(), sa.ForeignKey("parties.id"), nullable=False),
+    )
+    op.create_table(
+        "story_likes",
+        sa.Column("story_id", sa.String(), sa.ForeignKey("stories.id"), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), primary_key=True),
+    )
+    op.create_table(
+        "story_tags",
+        sa.Column("story_id", sa.String(), sa.ForeignKey("stories.id"), primary_key=True),
+        sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id"), primary_key=True),
+    )
+    op.create_table(
+        "comments",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("author_nickname", sa.String(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("timestamp", sa.DateTime()),
+        sa.Column("story_id", sa.String(), sa.ForeignKey("stories.id"), nullable=False),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+    )
+    op.create_table(
+        "maker_products",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("price", sa.Integer(), nullable=False),
+        sa.Column("image_url", sa.String()),
+        sa.Column("maker_id", sa.String(), sa.ForeignKey("makers.id"), nullable=False),
+    )
+    op.create_table(
+        "party_participations",
+        sa.Column("party_id", sa.String(), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("status", participant_status, nullable=False),
+    )
+    op.create_table(
+        "posts",
+        sa.Column("post_id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("image_url", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_posts_post_id", "posts", ["post_id"])
+    op.create_index("ix_posts_created_at", "posts", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_created_at", table_name="posts")
+    op.drop_index("ix_posts_post_id", table_name="posts")
+    for table in (
+        "posts", "party_participations", "maker_products", "comments", "story_tags", "story_likes",
+        "stories", "credits", "hello_tags", "goodbye_tags", "clothing_items", "parties",
+        "user_neighbors", "table_versions", "performance_reports", "tags", "rewards", "makers", "users",
+    ):
+        op.drop_table(table)
+    for enum_type in (party_status, participant_status, reward_type, credit_type,
+                      party_submission_status, clothing_category):
+        enum_type.drop(op.get_bind(), checkfirst=True)
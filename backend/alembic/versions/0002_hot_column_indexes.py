@@ -0,0 +1,43 @@
+"""hot foreign-key / filter column indexes
+
+Revision ID: 0002_hot_column_indexes
+Revises: 0001_initial_schema
+Create Date: 2026-10-19
+
+CRUD 에서 필터/정렬에 쓰이지만 인덱스가 없던 컬럼에 인덱스를 추가합니다.
+(검증: python -m bench.explain --database-url sqlite:///./bench.db)
+"""
+from alembic import op
+
+revision = "0002_hot_column_indexes"
+down_revision = "0001_initial_schema"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_clothing_items_user_id_id", "clothing_items", ["user_id", "id"]),
+    ("ix_clothing_items_party_submission_status", "clothing_items", ["party_submission_status"]),
+    ("ix_clothing_items_submitted_party_id_status", "clothing_items", ["submitted_party_id", "party_submission_status"]),
+    ("ix_clothing_items_is_listed_for_exchange", "clothing_items", ["is_listed_for_exchange"]),
+    ("ix_credits_user_id_date", "credits", ["user_id", "date"]),
+    ("ix_credits_date", "credits", ["date"]),
+    ("ix_stories_party_id", "stories", ["party_id"]),
+    ("ix_stories_user_id", "stories", ["user_id"]),
+    ("ix_comments_story_id_timestamp", "comments", ["story_id", "timestamp"]),
+    ("ix_maker_products_maker_id", "maker_products", ["maker_id"]),
+    ("ix_party_participations_user_id_status", "party_participations", ["user_id", "status"]),
+    ("ix_parties_status_date", "parties", ["status", "date"]),
+    ("ix_parties_date", "parties", ["date"]),
+    ("ix_parties_host_id", "parties", ["host_id"]),
+    ("ix_posts_user_id", "posts", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
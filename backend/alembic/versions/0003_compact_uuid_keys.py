@@ -0,0 +1,124 @@
+"""compact uuid keys (36자 문자열 -> 16바이트)
+
+Revision ID: 0003_compact_uuid_keys
+Revises: 0002_hot_column_indexes
+Create Date: 2026-10-19
+
+모든 String id / 외래 키 컬럼을 16바이트 BLOB(models.CompactUUID)으로 바꿉니다.
+API 에 노출되는 id 문자열은 그대로입니다. (같은 UUID 를 바이너리로 저장할 뿐)
+UUID 형식이 아닌 기존 id 가 있으면 새 UUIDv7 을 발급하여 참조하는 모든 컬럼에 같은 값으로 반영합니다.
+
+현재 배포 DB(SQLite) 기준으로 작성되었습니다.
+"""
+import os
+import time
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_compact_uuid_keys"
+down_revision = "0002_hot_column_indexes"
+branch_labels = None
+depends_on = None
+
+# (테이블, [(컬럼, nullable)]) - 참조 무결성을 위해 모든 id 컬럼을 한 번에 변환합니다.
+ID_COLUMNS = [
+    ("users", [("id", False)]),
+    ("user_neighbors", [("user_id", False), ("neighbor_id", False)]),
+    ("parties", [("id", False), ("host_id", False)]),
+    ("clothing_items", [("id", False), ("user_id", False), ("submitted_party_id", True)]),
+    ("goodbye_tags", [("clothing_item_id", False)]),
+    ("hello_tags", [("clothing_item_id", False)]),
+    ("credits", [("id", False), ("user_id", False)]),
+    ("stories", [("id", False), ("user_id", False), ("party_id", False)]),
+    ("story_likes", [("story_id", False), ("user_id", False)]),
+    ("story_tags", [("story_id", False)]),
+    ("rewards", [("id", False)]),
+    ("comments", [("id", False), ("story_id", False), ("user_id", False)]),
+    ("makers", [("id", False)]),
+    ("maker_products", [("id", False), ("maker_id", False)]),
+    ("party_participations", [("party_id", False), ("user_id", False)]),
+    ("performance_reports", [("id", False)]),
+    ("posts", [("post_id", False), ("user_id", False)]),
+]
+
+CHUNK_SIZE = 10_000
+
+
+def _uuid7_bytes() -> bytes:
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = ms << 80 | 0x7 << 76 | (rand >> 64 & 0xFFF) << 64 | 0b10 << 62 | (rand & ((1 << 62) - 1))
+    return uuid.UUID(int=value).bytes
+
+
+def _require_sqlite(bind) -> None:
+    if bind.dialect.name != "sqlite":
+        raise RuntimeError(
+            "0003_compact_uuid_keys 는 SQLite 전용입니다. "
+            "PostgreSQL 은 FK 제약을 내린 뒤 'ALTER COLUMN ... TYPE uuid USING col::uuid' 로 변환하세요."
+        )
+
+
+def _rewrite(bind, convert) -> None:
+    """모든 id 컬럼 값을 convert(value) 로 바꿉니다. (rowid 기준 chunk 단위 update)"""
+    for table, columns in ID_COLUMNS:
+        names = [name for name, _ in columns]
+        select_sql = sa.text(
+            f"SELECT rowid, {', '.join(names)} FROM {table} WHERE rowid > :after ORDER BY rowid LIMIT {CHUNK_SIZE}"
+        )
+        update_sql = sa.text(
+            f"UPDATE {table} SET {', '.join(f'{n} = :{n}' for n in names)} WHERE rowid = :rid"
+        )
+        after = 0
+        while True:
+            rows = bind.execute(select_sql, {"after": after}).fetchall()
+            if not rows:
+                break
+            bind.execute(update_sql, [
+                {"rid": row[0], **{name: convert(value) for name, value in zip(names, row[1:])}}
+                for row in rows
+            ])
+            after = rows[-1][0]
+
+
+def _alter_types(type_, existing_type) -> None:
+    for table, columns in ID_COLUMNS:
+        with op.batch_alter_table(table, recreate="always") as batch:
+            for name, nullable in columns:
+                batch.alter_column(name, type_=type_, existing_type=existing_type, existing_nullable=nullable)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _require_sqlite(bind)
+
+    remapped: dict[str, bytes] = {}
+
+    def to_bytes(value):
+        if value is None or isinstance(value, bytes):
+            return value
+        try:
+            return uuid.UUID(value).bytes
+        except ValueError:
+            # UUID 가 아닌 기존 id: 같은 문자열은 어느 테이블에서든 같은 새 id 로 바꿉니다.
+            if value not in remapped:
+                remapped[value] = _uuid7_bytes()
+            return remapped[value]
+
+    _rewrite(bind, to_bytes)
+    _alter_types(sa.LargeBinary(length=16), sa.String())
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    _require_sqlite(bind)
+
+    def to_str(value):
+        if isinstance(value, bytes) and len(value) == 16:
+            return str(uuid.UUID(bytes=value))
+        return value
+
+    _rewrite(bind, to_str)
+    _alter_types(sa.String(), sa.LargeBinary(length=16))
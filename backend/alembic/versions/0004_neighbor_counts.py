@@ -0,0 +1,35 @@
+"""neighbor counts and reverse neighbor index
+
+Revision ID: 0004_neighbor_counts
+Revises: 0003_compact_uuid_keys
+Create Date: 2026-10-19
+
+users 에 이웃 수 컬럼(following_count / follower_count)을 추가하고 기존 관계로 채웁니다.
+user_neighbors 에 (neighbor_id, user_id) 인덱스를 추가합니다. (나를 추가한 사용자 / 서로이웃 조회)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_neighbor_counts"
+down_revision = "0003_compact_uuid_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users") as batch:
+        batch.add_column(sa.Column("following_count", sa.Integer(), nullable=False, server_default="0"))
+        batch.add_column(sa.Column("follower_count", sa.Integer(), nullable=False, server_default="0"))
+    op.create_index("ix_user_neighbors_neighbor_id_user_id", "user_neighbors", ["neighbor_id", "user_id"])
+    op.execute(
+        "UPDATE users SET "
+        "following_count = (SELECT COUNT(*) FROM user_neighbors WHERE user_neighbors.user_id = users.id), "
+        "follower_count = (SELECT COUNT(*) FROM user_neighbors WHERE user_neighbors.neighbor_id = users.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_neighbors_neighbor_id_user_id", table_name="user_neighbors")
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("follower_count")
+        batch.drop_column("following_count")
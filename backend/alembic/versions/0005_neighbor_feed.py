@@ -0,0 +1,43 @@
+"""neighbor activity feed (activities, feed_entries)
+
+Revision ID: 0005_neighbor_feed
+Revises: 0004_neighbor_counts
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_neighbor_feed"
+down_revision = "0004_neighbor_counts"
+branch_labels = None
+depends_on = None
+
+feed_verb = sa.Enum("STORY_CREATED", "ITEM_LISTED", "POST_CREATED", "PARTY_JOINED", name="feedverbenum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "activities",
+        sa.Column("id", sa.LargeBinary(length=16), primary_key=True),
+        sa.Column("actor_id", sa.LargeBinary(length=16), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("verb", feed_verb, nullable=False),
+        sa.Column("object_id", sa.LargeBinary(length=16), nullable=False),
+        sa.Column("summary", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("fanned_out", sa.Boolean(), nullable=False),
+    )
+    op.create_index("ix_activities_actor_id_id", "activities", ["actor_id", "id"])
+    op.create_index("ix_activities_object_id", "activities", ["object_id"])
+    op.create_table(
+        "feed_entries",
+        sa.Column("owner_id", sa.LargeBinary(length=16), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("activity_id", sa.LargeBinary(length=16), primary_key=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("feed_entries")
+    op.drop_index("ix_activities_object_id", table_name="activities")
+    op.drop_index("ix_activities_actor_id_id", table_name="activities")
+    op.drop_table("activities")
+    feed_verb.drop(op.get_bind(), checkfirst=True)
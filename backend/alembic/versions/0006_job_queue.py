@@ -0,0 +1,49 @@
+"""background job queue (jobs, stat_rollups)
+
+Revision ID: 0006_job_queue
+Revises: 0005_neighbor_feed
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_job_queue"
+down_revision = "0005_neighbor_feed"
+branch_labels = None
+depends_on = None
+
+job_status = sa.Enum("QUEUED", "RUNNING", "DONE", "FAILED", name="jobstatusenum")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.LargeBinary(length=16), primary_key=True),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("priority", sa.Integer(), nullable=False),
+        sa.Column("status", job_status, nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("locked_by", sa.String(), nullable=True),
+        sa.Column("dedupe_key", sa.String(), nullable=True, unique=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_jobs_status_priority_run_at", "jobs", ["status", "priority", "run_at"])
+    op.create_table(
+        "stat_rollups",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stat_rollups")
+    op.drop_index("ix_jobs_status_priority_run_at", table_name="jobs")
+    op.drop_table("jobs")
+    job_status.drop(op.get_bind(), checkfirst=True)
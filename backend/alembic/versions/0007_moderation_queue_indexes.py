@@ -0,0 +1,35 @@
+"""moderation queue indexes (status + id keyset pagination)
+
+Revision ID: 0007_moderation_queue_indexes
+Revises: 0006_job_queue
+Create Date: 2026-10-19
+
+출품 승인 대기 목록을 id 순 keyset 으로 페이지네이션하므로 정렬 컬럼(id)을 인덱스 끝에 붙입니다.
+기존 인덱스는 새 인덱스의 앞부분과 같아 삭제합니다.
+"""
+from alembic import op
+
+revision = "0007_moderation_queue_indexes"
+down_revision = "0006_job_queue"
+branch_labels = None
+depends_on = None
+
+REPLACED = [
+    # (기존 인덱스, 새 인덱스, 테이블, 새 컬럼, 기존 컬럼)
+    ("ix_clothing_items_party_submission_status", "ix_clothing_items_submission_status_id", "clothing_items",
+     ["party_submission_status", "id"], ["party_submission_status"]),
+    ("ix_clothing_items_submitted_party_id_status", "ix_clothing_items_submitted_party_id_status_id", "clothing_items",
+     ["submitted_party_id", "party_submission_status", "id"], ["submitted_party_id", "party_submission_status"]),
+]
+
+
+def upgrade() -> None:
+    for old_name, new_name, table, new_columns, _ in REPLACED:
+        op.create_index(new_name, table, new_columns)
+        op.drop_index(old_name, table_name=table)
+
+
+def downgrade() -> None:
+    for old_name, new_name, table, _, old_columns in REPLACED:
+        op.create_index(old_name, table, old_columns)
+        op.drop_index(new_name, table_name=table)
@@ -0,0 +1,41 @@
+"""append-only credit ledger (reversals, monthly snapshots, archives)
+
+Revision ID: 0009_credit_ledger
+Revises: 0008_idempotency_keys
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009_credit_ledger"
+down_revision = "0008_idempotency_keys"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("credits") as batch:
+        batch.add_column(sa.Column("reverses_id", sa.LargeBinary(length=16), nullable=True))
+    op.create_index("ix_credits_reverses_id", "credits", ["reverses_id"], unique=True)
+    op.create_table(
+        "credit_snapshots",
+        sa.Column("user_id", sa.LargeBinary(length=16), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("period_end", sa.DateTime(), primary_key=True),
+        sa.Column("balance", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "credit_archives",
+        sa.Column("period_start", sa.DateTime(), primary_key=True),
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("entries", sa.Integer(), nullable=False),
+        sa.Column("total_amount", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("credit_archives")
+    op.drop_table("credit_snapshots")
+    op.drop_index("ix_credits_reverses_id", table_name="credits")
+    with op.batch_alter_table("credits") as batch:
+        batch.drop_column("reverses_id")
@@ -0,0 +1,36 @@
+"""party attendance payout markers
+
+Revision ID: 0010_party_payouts
+Revises: 0009_credit_ledger
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_party_payouts"
+down_revision = "0009_credit_ledger"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "party_payouts",
+        sa.Column("party_id", sa.LargeBinary(length=16), sa.ForeignKey("parties.id"), primary_key=True),
+        sa.Column("user_id", sa.LargeBinary(length=16), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("credit_id", sa.LargeBinary(length=16), nullable=False),
+        sa.Column("paid_at", sa.DateTime(), nullable=False),
+    )
+    # 이미 지급된 파티 참가 크레딧을 지급 기록으로 옮깁니다. (보관되지 않은 credits 의 활동 이름 기준)
+    op.execute(
+        "INSERT OR IGNORE INTO party_payouts (party_id, user_id, credit_id, paid_at) "
+        "SELECT p.party_id, c.user_id, c.id, c.date FROM credits c "
+        "JOIN parties pa ON c.activity_name = '파티 참가: ' || pa.title "
+        "JOIN party_participations p ON p.party_id = pa.id AND p.user_id = c.user_id "
+        "WHERE c.type = 'EARNED_EVENT' AND c.reverses_id IS NULL "
+        "AND pa.status = 'COMPLETED' AND p.status = 'ATTENDED'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("party_payouts")
@@ -0,0 +1,46 @@
+"""fill party impact columns for parties that were never computed
+
+Revision ID: 0011_party_impact_backfill
+Revises: 0010_party_payouts
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011_party_impact_backfill"
+down_revision = "0010_party_payouts"
+branch_labels = None
+depends_on = None
+
+# 이 리비전 시점의 app/core/impact.py 계수 (물 리터, CO2 kg / 한 벌)
+COEFFICIENTS = {
+    "티셔츠": (2700, 7),
+    "바지": (7500, 33),
+    "드레스": (9000, 25),
+    "자켓": (8000, 30),
+    "악세서리": (1000, 3),
+}
+DEFAULT_COEFFICIENT = (3000, 10)
+
+
+def _coefficient_case(index: int) -> str:
+    whens = " ".join(f"WHEN '{category}' THEN {values[index]}" for category, values in COEFFICIENTS.items())
+    return f"CASE ci.category {whens} ELSE {DEFAULT_COEFFICIENT[index]} END"
+
+
+def upgrade() -> None:
+    # 증분 갱신(apply_changes)은 계산된 값에만 더하므로, 한 번도 계산되지 않은(NULL) 파티를
+    # 승인된 출품 아이템 기준으로 전부 채워 둡니다. (app.crud.impact.recompute_all 과 같은 계산)
+    approved = "FROM clothing_items ci WHERE ci.submitted_party_id = parties.id AND ci.party_submission_status = 'APPROVED'"
+    op.execute(
+        "UPDATE parties SET "
+        f"impact_items_exchanged = (SELECT COUNT(*) {approved}), "
+        f"impact_water_saved = (SELECT COALESCE(SUM({_coefficient_case(0)}), 0) {approved}), "
+        f"impact_co2_reduced = (SELECT COALESCE(SUM({_coefficient_case(1)}), 0) {approved}) "
+        "WHERE impact_items_exchanged IS NULL"
+    )
+
+
+def downgrade() -> None:
+    # 채운 값은 계산 결과이므로 되돌리지 않습니다.
+    pass
@@ -1,14 +1,18 @@
-from fastapi import Depends, HTTPException, status
+import datetime
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from jose import jwt, JWTError
 
-from app.database import SessionLocal
+from app.database import SessionLocal, get_engine
 from app.models import User
 from app.crud import user as crud_user
 
 # [수정됨] security.py에서 SECRET_KEY와 ALGORITHM을 가져옵니다.
 from app.core.security import SECRET_KEY, ALGORITHM
+from app.core import etag, fields as fieldsets
 
 # OAuth2PasswordBearer 설정 (중복 제거함)
 # tokenUrl은 실제 로그인 엔드포인트 경로와 일치해야 합니다.
@@ -21,6 +25,7 @@ def get_db():
     요청마다 새로운 DB 세션을 생성하고,
     요청이 완료되면 세션을 닫습니다.
     """
+    get_engine()  # lifespan 없이 구동된 경우(테스트 클라이언트 등)에도 엔진을 준비
     db = SessionLocal()
     try:
         yield db  # API 엔드포인트 함수로 db 세션을 '주입'
@@ -91,4 +96,46 @@ class PaginationParams:
         if limit < 1 or limit > 100:
              raise HTTPException(status_code=400, detail="limit은 1과 100 사이여야 합니다.")
         self.skip = skip
-        self.limit = limit
\ No newline at end of file
+        self.limit = limit
+
+
+# --- 4. Conditional GET (ETag) ---
+def conditional_get(*tables: str):
+    """
+    조회 결과가 tables 의 데이터에만 의존하는 GET 엔드포인트용 의존성.
+    If-None-Match / If-Modified-Since 가 현재 버전과 같으면 본 쿼리 전에 304 를 반환합니다.
+
+        @router.get("/", dependencies=[Depends(conditional_get("rewards"))])
+    """
+    etag.check_tracked(tables)
+
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db)) -> dict:
+        return etag.validate(request, response, db, tables)
+
+    return dependency
+
+
+# --- 5. Sparse fieldsets (?fields=) ---
+def sparse_fields(model, always=("id",)):
+    """
+    ?fields=a,b,c 를 model 의 필드 이름 집합으로 검증하는 의존성. 생략하면 None (전체 필드)
+
+        fields: Optional[frozenset] = Depends(sparse_fields(StoryResponse))
+    """
+    def dependency(
+        fields: Optional[str] = Query(None, description=fieldsets.DESCRIPTION)
+    ) -> Optional[frozenset]:
+        try:
+            return fieldsets.parse(fields, model, always)
+        except fieldsets.FieldsError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    return dependency
+
+
+# --- 6. 시각 쿼리 파라미터 ---
+def naive_utc(value: Optional[datetime.datetime]) -> Optional[datetime.datetime]:
+    """DB 의 시각 컬럼은 UTC naive 로 저장되므로, 오프셋이 있는 조회 시각(...Z, +09:00)은 UTC naive 로 맞춥니다."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
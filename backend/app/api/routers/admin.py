@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.api.deps import get_db, get_current_admin_user
+from app.api.deps import get_db, get_current_admin_user, naive_utc
 from app.schemas import (
     AdminOverallStats, 
     PartyResponse, 
@@ -10,10 +13,16 @@ from app.schemas import (
     AdminGroupPerformance,
     DailyActivity,
     CategoryDistribution,
-    PartyParticipantResponse
+    PartyParticipantResponse,
+    PendingItemPage,
+    ItemModerationBatch,
+    ParticipantModerationBatch,
+    ModerationBatchResult,
 )
-from app.models import User
-from app.crud import admin as crud_admin, party as crud_party, item as crud_item
+from app.models import User, PartySubmissionStatusEnum, PartyParticipantStatusEnum
+from app.crud import admin as crud_admin, party as crud_party, item as crud_item, impact as crud_impact, export as crud_export
+from app.core import export, metrics
+from app.core.responses import ORJSONResponse
 
 router = APIRouter()
 
@@ -21,19 +30,58 @@ router = APIRouter()
 
 @router.get("/stats", response_model=AdminOverallStats, summary="관리자 대시보드 전체 통계")
 def get_admin_stats(db: Session = Depends(get_db), admin_user: User = Depends(get_current_admin_user)):
-    return crud_admin.get_overall_stats(db)
+    return crud_admin.get_rollup(db, "overall_stats")
 
 @router.get("/stats/group-performance", response_model=List[AdminGroupPerformance], summary="그룹(지역)별 성과 통계")
 def get_group_performance_stats(db: Session = Depends(get_db), admin_user: User = Depends(get_current_admin_user)):
-    return crud_admin.get_group_performance(db)
+    return crud_admin.get_rollup(db, "group_performance")
 
 @router.get("/stats/daily-activity", response_model=List[DailyActivity], summary="일일 활동 추이")
 def get_daily_activity_stats(db: Session = Depends(get_db), admin_user: User = Depends(get_current_admin_user)):
-    return crud_admin.get_daily_activity(db)
+    return crud_admin.get_rollup(db, "daily_activity")
 
 @router.get("/stats/category-distribution", response_model=List[CategoryDistribution], summary="카테고리별 분포")
 def get_category_distribution_stats(db: Session = Depends(get_db), admin_user: User = Depends(get_current_admin_user)):
-    return crud_admin.get_category_distribution(db)
+    return crud_admin.get_rollup(db, "category_distribution")
+
+
+@router.get("/metrics", summary="서버 내부 메트릭 (캐시/ETag 적중률 등)")
+def get_metrics(admin_user: User = Depends(get_current_admin_user)):
+    """현재 워커 프로세스의 카운터, 게이지, 수집기 값을 반환합니다."""
+    return metrics.snapshot()
+
+
+# --- 내보내기 ---
+
+@router.get("/export/{dataset}", summary="크레딧/아이템/참가자 내보내기 (CSV / NDJSON 스트리밍)")
+def export_dataset(
+    dataset: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    gzip: bool = False,
+    since: Optional[datetime.datetime] = None,
+    until: Optional[datetime.datetime] = None,
+    party_id: Optional[str] = None,
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    dataset: credits / items / participants
+    - 행을 DB 커서에서 조금씩 읽어 바로 보내므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+    - gzip=true 면 .gz 파일로 압축해 보냅니다.
+    - credits 는 since/until(기간), participants 는 party_id 로 거를 수 있습니다.
+    """
+    spec = crud_export.DATASETS.get(dataset)
+    if spec is None:
+        raise HTTPException(status_code=404, detail="Unknown dataset")
+    media_type, extension = export.FORMATS[format]
+    filename = f"{dataset}-{datetime.date.today():%Y%m%d}.{extension}"
+
+    rows = crud_export.iter_rows(dataset, since=naive_utc(since), until=naive_utc(until), party_id=party_id)
+    body = export.encode_rows(rows, spec.column_names, format)
+    if gzip:
+        body = export.gzip_chunks(body)
+        media_type, filename = "application/gzip", f"{filename}.gz"
+    return StreamingResponse(body, media_type=media_type,
+                             headers={"Content-Disposition": f'attachment; filename="{filename}"'})
 
 
 # --- 파티 관리 ---
@@ -55,6 +103,20 @@ def update_party_approval_status(
         raise HTTPException(status_code=404, detail="Party not found")
     return updated_party
 
+@router.post("/parties/complete-due", summary="날짜가 지난 파티 종료 처리 (스케줄러 즉시 실행)")
+def complete_due_parties(db: Session = Depends(get_db), admin_user: User = Depends(get_current_admin_user)):
+    """날짜가 지난 UPCOMING 파티를 COMPLETED 로 바꾸고 종료 후 작업(크레딧/임팩트/출품 정리)을 넣습니다."""
+    completed = crud_party.complete_due_parties(db)
+    db.commit()
+    return {"completed": completed}
+
+@router.post("/parties/impact/recompute", summary="모든 파티 임팩트 다시 계산")
+def recompute_party_impact(db: Session = Depends(get_db), admin_user: User = Depends(get_current_admin_user)):
+    """출품 데이터로 모든 파티의 임팩트를 다시 계산해 저장합니다. (계수 변경 / 기존 데이터 채우기용)"""
+    recomputed = crud_impact.recompute_all(db)
+    db.commit()
+    return {"parties": recomputed}
+
 @router.delete("/parties/{party_id}", status_code=status.HTTP_204_NO_CONTENT, summary="파티 삭제")
 def delete_party(
     party_id: str,
@@ -94,14 +156,51 @@ def update_participant_status(
     }
     return response_data
 
+@router.post("/parties/{party_id}/participants/status/bulk", response_model=ModerationBatchResult,
+             summary="참가자 상태 일괄 변경")
+def bulk_update_participant_status(
+        party_id: str,
+        batch: ParticipantModerationBatch,
+        db: Session = Depends(get_db),
+        admin_user: User = Depends(get_current_admin_user)
+):
+    """여러 참가자를 한 번에 수락/거절합니다. 목표 상태별로 UPDATE 한 번이며 참가자 id 별 결과를 반환합니다."""
+    if not crud_party.get_party(db, party_id):
+        raise HTTPException(status_code=404, detail="Party not found")
+    moderations = [(entry.user_id, PartyParticipantStatusEnum(entry.status.value)) for entry in batch.participants]
+    return crud_admin.bulk_update_participant_status(db, party_id, moderations)
+
 # --- 아이템 검수 ---
 
-@router.get("/items/pending", response_model=List[ClothingItemResponse], summary="승인 대기 아이템 목록")
+@router.get("/items/pending", response_model=PendingItemPage, summary="승인 대기 아이템 목록")
 def get_pending_items(
+    party_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    tags: str = Query("full", pattern=crud_item.TAG_FIELDS_PATTERN, description="full | summary | none"),
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_current_admin_user)
 ):
-    return crud_admin.get_pending_party_items(db)
+    """
+    승인 대기 아이템 (id 순). 다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨 조회합니다.
+    tags 는 GET /items/ 와 같습니다. (심사 목록은 summary 로 보고 상세에서 사연 확인)
+    """
+    page = crud_admin.get_pending_party_items(db, party_id=party_id, cursor=cursor, limit=limit, tags=tags)
+    if tags != "full":
+        return ORJSONResponse(page)
+    return page
+
+@router.post("/items/status/bulk", response_model=ModerationBatchResult, summary="아이템 출품 상태 일괄 변경")
+def bulk_update_item_status(
+    batch: ItemModerationBatch,
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """여러 아이템을 한 번에 승인/거절합니다. 목표 상태별로 UPDATE 한 번이며 id 별 결과를 반환합니다."""
+    if any(entry.status.value not in ["APPROVED", "REJECTED"] for entry in batch.items):
+        raise HTTPException(status_code=400, detail="Invalid status")
+    moderations = [(entry.item_id, PartySubmissionStatusEnum(entry.status.value)) for entry in batch.items]
+    return crud_admin.bulk_update_item_submission_status(db, moderations)
 
 @router.post("/items/{item_id}/status", response_model=ClothingItemResponse, summary="아이템 출품 상태 변경")
 def update_item_status(
@@ -3,12 +3,28 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from app.api.deps import get_db, get_current_user
-from app.schemas import ClothingItemResponse, ClothingItemCreate, GoodbyeTagCreate
+from app.schemas import ClothingItemResponse, ClothingItemCreate, GoodbyeTagCreate, GoodbyeTagResponse, QRTokenResponse
 from app.models import User
-from app.crud import clothing as crud_clothing
+from app.core import qr
+from app.crud import item as crud_item
 
 router = APIRouter()
 
+@router.get("/scan/{token}", response_model=ClothingItemResponse, summary="의류 QR 스캔 (서명 토큰)")
+def scan_clothing_item(token: str, db: Session = Depends(get_db)):
+    """
+    의류 태그 QR 의 서명 토큰으로 상세 정보와 태그를 조회합니다.
+    위조/만료 토큰은 DB 조회 없이 거절되고, 연속 스캔은 상세 응답 캐시에서 바로 반환됩니다.
+    """
+    try:
+        item_id = qr.verify_item(token)
+    except qr.QRTokenError as exc:
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 QR 코드입니다. ({exc.reason})")
+    item = crud_item.get_item_detail(db, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
 @router.get("/{item_id}", response_model=ClothingItemResponse, summary="의류 상세 정보 및 태그 조회")
 def read_clothing_item(
     item_id: str,
@@ -18,21 +34,36 @@ def read_clothing_item(
     의류 아이템의 상세 정보를 조회합니다. 
     Goodbye Tag와 Hello Tag 정보가 포함되어 반환됩니다 (QR 스캔 시 사용).
     """
-    item = crud_clothing.get_clothing_item(db, item_id)
+    item = crud_item.get_item_detail(db, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     return item
 
+@router.get("/{item_id}/qr-token", response_model=QRTokenResponse, summary="의류 태그 QR 토큰 발급")
+def read_clothing_qr_token(
+    item_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """의류 태그에 인쇄할 서명 토큰을 발급합니다. (QR_ITEM_TOKEN_DAYS 동안 유효, 소유자만)"""
+    item = crud_item.get_item(db, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    if item.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Permission denied")
+    expires_at = qr.item_token_expires_at()
+    return {"token": qr.item_token(item.id, expires_at), "expires_at": expires_at}
+
 @router.post("/", response_model=ClothingItemResponse, status_code=status.HTTP_201_CREATED, summary="의류 등록")
 def create_item(
     item_in: ClothingItemCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """새로운 의류를 등록합니다."""
-    return crud_clothing.create_clothing_item(db, item_in, current_user.id, current_user.nickname)
+    """새로운 의류를 등록합니다. (/items/add 와 같은 등록 경로)"""
+    return crud_item.create_user_item(db, item_in, current_user.id, current_user.nickname)
 
-@router.post("/{item_id}/goodbye-tag", summary="Goodbye Tag 등록")
+@router.post("/{item_id}/goodbye-tag", response_model=GoodbyeTagResponse, summary="Goodbye Tag 등록")
 def create_goodbye_tag(
     item_id: str,
     tag_in: GoodbyeTagCreate,
@@ -42,10 +73,12 @@ def create_goodbye_tag(
     """
     등록된 의류에 Goodbye Tag(사연)를 추가합니다.
     """
-    item = crud_clothing.get_clothing_item(db, item_id)
+    item = crud_item.get_item(db, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     if item.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Permission denied")
-        
-    return crud_clothing.create_goodbye_tag(db, item_id, tag_in.model_dump())
\ No newline at end of file
+    if item.goodbye_tag:
+        raise HTTPException(status_code=400, detail="Goodbye Tag already exists for this item")
+
+    return crud_item.create_goodbye_tag(db, item, tag_in).goodbye_tag
\ No newline at end of file
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.api.deps import get_db, get_current_user
-from app.schemas import CreditResponse, UserCreditBalanceResponse, EarnRequest
+from app.api.deps import get_db, get_current_user, naive_utc
+from app.schemas import CreditResponse, UserCreditBalanceResponse, EarnRequest, CreditStatementResponse
 from app.models import User
 from app.crud import credit as crud_credit
 
 router = APIRouter()
 
+
 @router.post(
     "/earn",
     response_model=CreditResponse,
@@ -45,15 +49,16 @@ def earn_credit(
 )
 # 필요한 리소스 명시
 def read_my_credit_balance(
+    at: Optional[datetime.datetime] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     현재 인증된 사용자의 크레딧 잔액을 조회합니다.
-    (크레딧 내역을 합산하는 로직 필요)
+    at 을 주면 그 시점의 잔액을 반환합니다. (월말 스냅샷 + 이후 기록만 합산)
     """
     # 크래딧 갯수 확인하는 함수에서 user_id에 해당하는 매개변수에 현재 인증된 사용자의 id 전달
-    balance = crud_credit.get_user_credit_balance(db, user_id=current_user.id)
+    balance = crud_credit.get_user_credit_balance(db, user_id=current_user.id, at=naive_utc(at))
     return {"user_id": current_user.id, "balance": balance}
 
 @router.get(
@@ -62,19 +67,39 @@ def read_my_credit_balance(
     summary="내 크레딧 변동 내역 조회"
 )
 def read_my_credit_history(
+    limit: int = Query(100, ge=1, le=500),
+    before: Optional[datetime.datetime] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    현재 인증된 사용자의 모든 크레딧 적립/사용 내역을 조회합니다.
+    현재 인증된 사용자의 크레딧 적립/사용 내역을 최신순으로 조회합니다.
+    다음 페이지는 마지막 기록의 date 를 before 로 넘겨 조회합니다. (보관된 달은 /my-statement 로 조회)
     """
-    credits = crud_credit.get_credits_by_user(db, user_id=current_user.id)
+    credits = crud_credit.get_credits_by_user(db, user_id=current_user.id, limit=limit, before=naive_utc(before))
     return credits
 
+@router.get(
+    "/my-statement",
+    response_model=CreditStatementResponse,
+    summary="내 월별 크레딧 명세 조회"
+)
+def read_my_credit_statement(
+    month: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="YYYY-MM"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """기초 잔액(월말 스냅샷 기준) + 그 달의 기록 + 기말 잔액"""
+    try:
+        period = datetime.datetime.strptime(month, "%Y-%m")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="month 는 YYYY-MM 형식이어야 합니다.")
+    return crud_credit.get_monthly_statement(db, user_id=current_user.id, month=period)
+
 @router.delete(
     "/{credit_id}",
     status_code=status.HTTP_204_NO_CONTENT, # 성공적으로 삭제 시 일반적으로 204 반환
-    summary="특정 ID의 크레딧 기록 삭제"
+    summary="특정 ID의 크레딧 기록 취소"
 )
 def delete_credit(
     credit_id: str,
@@ -82,23 +107,28 @@ def delete_credit(
     current_user: User = Depends(get_current_user) # 사용자 인증 필수
 ):
     """
-    인증된 사용자가 소유한 특정 크레딧 기록을 영구적으로 삭제합니다.
+    인증된 사용자가 소유한 크레딧 기록을 취소합니다.
+    원장은 추가만 하므로 원래 기록은 지우지 않고 반대 금액의 취소 기록을 남깁니다.
     """
     user_id = current_user.id
     
     try:
-        crud_credit.delete_credit_record(db, credit_id, user_id)
-        db.commit() # 최종적으로 삭제를 데이터베이스에 반영
+        crud_credit.reverse_credit_record(db, credit_id, user_id)
+        db.commit() # 최종적으로 취소 기록을 데이터베이스에 반영
         
     except HTTPException:
         # 404와 같은 의도된 예외는 그대로 다시 발생
         raise
+    except IntegrityError:
+        # 같은 기록을 동시에 두 번 취소한 경우 (ix_credits_reverses_id)
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 취소된 크레딧 기록입니다.")
     except Exception as e:
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"크레딧 삭제 트랜잭션 실패: {e}"
+            detail=f"크레딧 취소 트랜잭션 실패: {e}"
         )
         
     # HTTP 204 No Content는 응답 본문이 없어야 함
-    return
\ No newline at end of file
+    return
@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import io
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.api.deps import get_db, get_current_user, get_current_admin_user
-from app.schemas import ClothingItemCreate, ClothingItemResponse, ClothingItemUpdate, PartySubmissionStatusEnum, GoodbyeTagCreate, HelloTagCreate
-from app.models import User, ClothingItem
+from app.core import config, item_import, fields as fieldsets
+from app.core.responses import ORJSONResponse
+from app.api.deps import get_db, get_current_user, get_current_admin_user, sparse_fields
+from app.schemas import ClothingItemCreate, ClothingItemResponse, ClothingItemUpdate, PartySubmissionStatusEnum, GoodbyeTagCreate, HelloTagCreate, ItemImportResult
+from app.models import User, ClothingItem, PartyStatusEnum
 from app.crud import item as crud_item
+from app.crud import party as crud_party
 
 router = APIRouter()
 
@@ -17,12 +22,22 @@ router = APIRouter()
 def read_items(
     db: Session = Depends(get_db),
     skip: int = 0,
-    limit: int = 20
+    limit: int = 20,
+    tags: str = Query("full", pattern=crud_item.TAG_FIELDS_PATTERN, description="full | summary | none"),
+    fields: Optional[frozenset] = Depends(sparse_fields(ClothingItemResponse))
 ):
     """
     교환을 위해 등록된 (is_listed_for_exchange=True) 모든 아이템 목록을 조회합니다.
+    - tags=summary 는 태그의 긴 사연/메시지를 빼고, tags=none 은 태그를 아예 싣지 않습니다. (전체는 상세 조회)
+    - fields=id,name,image_url 처럼 필요한 필드만 고르면 그 컬럼만 조회합니다.
     - 필터링, 정렬, 검색 기능 추가 필요
     """
+    if config.FAST_JSON or tags != "full" or fields is not None:
+        rows = crud_item.get_items_for_exchange_rows(db, skip=skip, limit=limit, tags=tags, fields=fields)
+        # 태그를 줄인(summary) 행은 전체 태그 모델로 검증할 수 없으므로 프로젝션 결과를 그대로 보냅니다.
+        if fields is not None and tags == "full":
+            rows = fieldsets.serialize(ClothingItemResponse, fields, rows)
+        return ORJSONResponse(rows)
     items = crud_item.get_items_for_exchange(db, skip=skip, limit=limit)
     return items
 
@@ -49,18 +64,62 @@ def create_item(
     )
 
 
+@router.post(
+    "/import",
+    response_model=ItemImportResult,
+    summary="아이템 일괄 등록 (CSV / JSON lines)"
+)
+def import_items(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$", description="생략하면 파일 확장자로 판단"),
+    party_id: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    파일의 아이템(+ 선택적 Goodbye Tag)을 현재 사용자의 옷장에 한 번에 등록합니다.
+    party_id 를 주면 그 파티에 출품(PENDING)된 상태로 등록합니다. (파티 현장 접수)
+    검증에 실패한 행은 건너뛰고 행 번호와 오류를 errors 로 돌려줍니다.
+    한 요청에서는 IMPORT_MAX_ROWS 행까지만 읽습니다. (넘으면 truncated=true)
+    """
+    fmt = format or item_import.format_for(file.filename)
+    if fmt is None:
+        raise HTTPException(status_code=400, detail="format 을 지정하거나 .csv / .ndjson / .jsonl 파일을 올려주세요.")
+    if party_id is not None:
+        party = crud_party.get_party(db, party_id)
+        if party is None:
+            raise HTTPException(status_code=404, detail="Party not found")
+        if party.status != PartyStatusEnum.UPCOMING:
+            raise HTTPException(status_code=400, detail="진행 예정인 파티에만 출품할 수 있습니다.")
+
+    # 업로드 파일을 줄 단위로 읽어 바로 검증/저장합니다. (엑셀 CSV 의 BOM 은 utf-8-sig 가 제거)
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", errors="replace", newline="")
+    return crud_item.import_items(
+        db,
+        item_import.parse_records(lines, fmt),
+        user_id=current_user.id,
+        user_nickname=current_user.nickname,
+        party_id=party_id,
+        max_rows=config.IMPORT_MAX_ROWS,
+    )
+
+
 @router.get(
     "/my-items", 
     response_model=List[ClothingItemResponse],
     summary="내 옷장 아이템 목록 조회"
 )
 def read_my_items(
+    tags: str = Query("full", pattern=crud_item.TAG_FIELDS_PATTERN, description="full | summary | none"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     현재 인증된 사용자가 등록한 모든 아이템 목록을 조회합니다.
+    tags 는 GET /items/ 와 같습니다.
     """
+    if config.FAST_JSON or tags != "full":
+        return ORJSONResponse(crud_item.get_items_by_user_rows(db, user_id=current_user.id, tags=tags))
     items = crud_item.get_items_by_user(db, user_id=current_user.id)
     return items
 
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.api.deps import get_db, get_current_admin_user
+from app.api.deps import get_db, get_current_admin_user, conditional_get, sparse_fields
+from app.core import fields as fieldsets
+from app.core.responses import ORJSONResponse
 from app.schemas import (
     MakerResponse, MakerCreate, MakerUpdate,
     MakerProductResponse, MakerProductCreate, MakerProductUpdate
@@ -14,11 +16,22 @@ router = APIRouter()
 
 # --- 조회 (Public) ---
 
-@router.get("/", response_model=List[MakerResponse], summary="메이커 목록 조회")
-def read_makers(db: Session = Depends(get_db)):
+# 메이커 응답에는 상품 목록이 포함되므로 두 테이블의 버전을 함께 사용합니다.
+MAKER_TABLES = ("makers", "maker_products")
+
+@router.get("/", response_model=List[MakerResponse], summary="메이커 목록 조회",
+            dependencies=[Depends(conditional_get(*MAKER_TABLES))])
+def read_makers(
+    db: Session = Depends(get_db),
+    fields: Optional[frozenset] = Depends(sparse_fields(MakerResponse))
+):
+    """fields=id,name,image_url 처럼 고르면 소개(bio)와 굿즈 목록 조회를 건너뜁니다."""
+    if fields is not None:
+        return ORJSONResponse(fieldsets.serialize(MakerResponse, fields, crud_maker.get_makers_rows(db, fields)))
     return crud_maker.get_makers(db)
 
-@router.get("/{maker_id}", response_model=MakerResponse, summary="메이커 상세 조회")
+@router.get("/{maker_id}", response_model=MakerResponse, summary="메이커 상세 조회",
+            dependencies=[Depends(conditional_get(*MAKER_TABLES))])
 def read_maker(maker_id: str, db: Session = Depends(get_db)):
     maker = crud_maker.get_maker(db, maker_id)
     if not maker:
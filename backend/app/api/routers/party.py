@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -9,15 +12,30 @@ from app.schemas import (
     PartyParticipantResponse,
     PartyUpdate,
     PartyStatusEnum,
+    MatchResponse,
+    PartyTicketResponse,
+    CheckInRosterResponse,
+    CheckInBatch,
+    CheckInBatchResult,
+    ClothingCategoryEnum,
     ImpactStatsBase, # 스키마에 정의되어 있다고 가정
     KitDetailsBase   # 스키마에 정의되어 있다고 가정
 )
-from app.models import User
-from app.api.deps import get_db, get_current_user, get_current_admin_user
+from app.models import User, PartyParticipantStatusEnum
+from app.core import config, fields as fieldsets
+from app.core.responses import ORJSONResponse
+from app.api.deps import get_db, get_current_user, get_current_admin_user, conditional_get, sparse_fields
 from app.crud import party as crud_party
+from app.crud import matching as crud_matching
+from app.core import etag, events, qr
 
 router = APIRouter()
 
+# 파티 상세/참가자 응답이 의존하는 테이블
+# users 는 넣지 않습니다. (이웃 수 갱신 등 모든 사용자 쓰기가 파티 ETag 를 무효화하므로)
+# 참가자 닉네임이 바뀌면 crud/user.update_user 가 party_participations 버전을 올립니다.
+PARTY_DETAIL_TABLES = ("parties", "party_participations")
+
 
 # 1. 파티 목록 조회 (검색 기능 포함)
 @router.get(
@@ -28,19 +46,32 @@ router = APIRouter()
 def read_parties(
     db: Session = Depends(get_db),
     status_filter: Optional[PartyStatusEnum] = PartyStatusEnum.UPCOMING,
-    search_query: Optional[str] = None
+    search_query: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    fields: Optional[frozenset] = Depends(sparse_fields(PartyResponse))
 ):
     """
     파티 목록을 조회합니다.
 
     - `status_filter`: 'UPCOMING', 'COMPLETED' 등 Enum 상태로 필터링합니다.
     - `search_query`: 파티의 제목 또는 설명을 기준으로 검색합니다.
+    - `skip` / `limit`: 페이지 (기본 100개)
+    - `fields`: id,title,date,image_url 처럼 필요한 필드만 조회합니다. (participants 를 빼면 참가자 쿼리 생략)
     """
     # Enum 값을 문자열로 변환하여 전달하거나 None 처리
     status_value = status_filter.value if status_filter else None
+
+    if fields is not None:
+        rows = crud_party.get_parties_rows(db, skip=skip, limit=limit, status=status_value, search=search_query, fields=fields)
+        return ORJSONResponse(fieldsets.serialize(PartyResponse, fields, rows))
+    if config.FAST_JSON:
+        return ORJSONResponse(crud_party.get_parties_rows(db, skip=skip, limit=limit, status=status_value, search=search_query))
     
     parties = crud_party.get_parties(
         db,
+        skip=skip,
+        limit=limit,
         status=status_value,
         search=search_query
     )
@@ -94,7 +125,8 @@ def join_party(
 @router.get(
     "/{party_id}",
     response_model=PartyResponse,
-    summary="파티 상세 정보 조회"
+    summary="파티 상세 정보 조회",
+    dependencies=[Depends(conditional_get(*PARTY_DETAIL_TABLES))]
 )
 def read_party(
     party_id: str,
@@ -117,6 +149,8 @@ def read_party(
 )
 def read_party_participants(
     party_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -133,6 +167,9 @@ def read_party_participants(
             detail="파티 호스트만 참가자 목록을 조회할 수 있습니다."
         )
 
+    # 호스트 확인 후에 조건부 GET 검사 (변경 없으면 304)
+    etag.validate(request, response, db, PARTY_DETAIL_TABLES)
+
     participants = crud_party.get_participants(db, party_id=party_id)
     return participants
 
@@ -287,14 +324,24 @@ def admin_approve_party(
 @router.post("/{party_id}/check-in", response_model=PartyParticipantResponse, summary="파티 체크인 (QR 스캔)")
 def check_in(
     party_id: str,
-    user_id: str, # 실제로는 QR 코드에서 읽은 유저 ID를 body로 받거나, 관리자가 스캔하여 전송
+    token: Optional[str] = None, # 참가자 입장권 QR 의 서명 토큰 (GET /{party_id}/ticket)
+    user_id: Optional[str] = None, # (이전 방식) QR 코드에서 읽은 유저 ID
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     파티 호스트가 참가자의 QR 코드를 스캔하여 'ATTENDED' 상태로 변경합니다.
-    (보안을 위해 호스트 권한 체크 로직을 추가하는 것이 좋습니다)
+    token 으로 보내면 위조/만료/다른 파티의 입장권은 DB 조회 없이 거절됩니다.
     """
+    # 0. 입장권 검증 (서명/만료만 확인)
+    if token is not None:
+        try:
+            user_id = qr.verify_participation(token, party_id)
+        except qr.QRTokenError as exc:
+            raise HTTPException(status_code=400, detail=f"유효하지 않은 입장권입니다. ({exc.reason})")
+    if user_id is None:
+        raise HTTPException(status_code=422, detail="token 또는 user_id 가 필요합니다.")
+
     # 1. 권한 체크 (현재 유저가 호스트인지)
     db_party = crud_party.get_party(db, party_id)
     if not db_party:
@@ -308,5 +355,201 @@ def check_in(
     
     if not updated_participation:
          raise HTTPException(status_code=404, detail="참가자 명단에 없거나 신청하지 않은 유저입니다.")
+    if updated_participation.status != PartyParticipantStatusEnum.ATTENDED:
+        raise HTTPException(status_code=409, detail="승인되지 않은 참가자는 체크인할 수 없습니다.")
          
-    return updated_participation
\ No newline at end of file
+    return updated_participation
+
+
+# 12. 교환 매칭 후보 조회
+@router.get(
+    "/{party_id}/matches",
+    response_model=List[MatchResponse],
+    summary="파티 교환 매칭 후보 조회"
+)
+def read_party_matches(
+    party_id: str,
+    sizes: Optional[List[str]] = Query(None, description="원하는 사이즈 (생략 시 내가 내놓은 옷들의 사이즈)"),
+    categories: Optional[List[ClothingCategoryEnum]] = Query(None, description="선호 카테고리 (순서대로 가산점)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    파티에 나온 아이템 중 내 사이즈/카테고리에 맞는 교환 후보를 점수순으로 조회합니다.
+    상대도 내가 내놓은 옷을 입을 수 있는 경우(서로 교환) 더 높은 순위로 보여줍니다.
+    """
+    matches = crud_matching.get_matches(
+        db,
+        party_id=party_id,
+        user_id=str(current_user.id),
+        sizes=sizes,
+        categories=[category.value for category in categories] if categories else None,
+        limit=limit,
+    )
+    if matches is None:
+        raise HTTPException(status_code=404, detail="파티를 찾을 수 없습니다.")
+    return matches
+
+
+# 13. 내 입장권 (참가자 QR 토큰)
+@router.get(
+    "/{party_id}/ticket",
+    response_model=PartyTicketResponse,
+    summary="내 파티 입장권 QR 토큰"
+)
+def read_my_ticket(
+    party_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    체크인 때 보여줄 서명된 입장권 토큰을 발급합니다.
+    파티 날짜가 끝난 뒤 QR_TICKET_GRACE_HOURS 까지 유효하며, 같은 참가자에게는 항상 같은 토큰입니다.
+    """
+    db_party = crud_party.get_party(db, party_id)
+    if not db_party:
+        raise HTTPException(status_code=404, detail="파티를 찾을 수 없습니다.")
+
+    participation = crud_party.get_participation(db, db_party.id, current_user.id)
+    if participation is None or participation.status == PartyParticipantStatusEnum.REJECTED:
+        raise HTTPException(status_code=403, detail="이 파티의 참가자가 아닙니다.")
+
+    return {
+        "token": qr.participation_token(db_party.id, current_user.id, db_party.date),
+        "expires_at": qr.ticket_expires_at(db_party.date),
+    }
+
+
+# 14. 체크인 명단 (호스트 기기 사전 로드)
+@router.get(
+    "/{party_id}/check-in/roster",
+    response_model=CheckInRosterResponse,
+    summary="체크인 명단 미리 받기 (호스트)"
+)
+def read_check_in_roster(
+    party_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    호스트 기기가 파티 시작 전에 받아두는 참가자 명단입니다.
+    각 참가자 입장권 토큰의 서명 부분이 들어 있어, 스캔한 QR 을 서버 왕복 없이 현장에서 확인할 수 있습니다.
+    확인된 체크인은 모아서 `POST /{party_id}/check-in/bulk` 로 보냅니다.
+    """
+    db_party = crud_party.get_party(db, party_id)
+    if not db_party:
+        raise HTTPException(status_code=404, detail="파티를 찾을 수 없습니다.")
+    if db_party.host_id != current_user.id and not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="호스트만 체크인 명단을 받을 수 있습니다.")
+
+    entries = [
+        {
+            **row,
+            "signature": qr.signature_of(qr.participation_token(db_party.id, row["user_id"], db_party.date)),
+        }
+        for row in crud_party.get_participants_rows(db, [db_party.id])[db_party.id]
+        if row["status"] != PartyParticipantStatusEnum.REJECTED
+    ]
+    return {"party_id": db_party.id, "expires_at": qr.ticket_expires_at(db_party.date), "entries": entries}
+
+
+# 15. 일괄 체크인 (호스트 기기에서 모아 보내기)
+@router.post(
+    "/{party_id}/check-in/bulk",
+    response_model=CheckInBatchResult,
+    summary="일괄 체크인 (QR 토큰 묶음)"
+)
+def bulk_check_in(
+    party_id: str,
+    batch: CheckInBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    호스트 기기가 현장에서 확인한 입장권 토큰들을 한 번에 체크인합니다.
+    토큰은 서버에서 다시 검증하며(DB 조회 없음), 같은 배치를 재전송해도 안전합니다(멱등).
+    """
+    db_party = crud_party.get_party(db, party_id)
+    if not db_party:
+        raise HTTPException(status_code=404, detail="파티를 찾을 수 없습니다.")
+    if db_party.host_id != current_user.id and not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="호스트만 체크인을 처리할 수 있습니다.")
+
+    user_ids, rejected = [], []
+    for token in batch.tokens:
+        try:
+            user_ids.append(qr.verify_participation(token, db_party.id))
+        except qr.QRTokenError as exc:
+            rejected.append({"token": token, "reason": exc.reason})
+
+    result = crud_party.bulk_check_in(db, db_party.id, user_ids)
+    return {**result, "rejected": rejected}
+
+
+# 16. 호스트 대시보드 - 참가자 실시간 스트림 (SSE)
+async def _participant_stream(request: Request, topic: str, after_seq: int, snapshot: Optional[list]):
+    subscription, backlog = events.subscribe(topic, after_seq)
+    try:
+        if snapshot is not None:
+            yield events.sse_event("snapshot", {"participants": snapshot}, events.event_id(after_seq))
+        if backlog is None:
+            # 이어 받을 수 없음 (다른 워커/재시작 이후의 id, 또는 버퍼에서 밀려남) -> 스냅샷부터 다시
+            yield events.sse_event("reset", {"reason": "resume_unavailable"})
+            return
+        for event in backlog:
+            yield event.encode()
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=config.SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield events.sse_comment("keep-alive")
+                continue
+            yield event.encode()
+    finally:
+        events.unsubscribe(subscription)
+
+
+@router.get(
+    "/{party_id}/dashboard/stream",
+    summary="호스트 대시보드 - 참가자 변경 실시간 스트림 (SSE)"
+)
+def stream_party_participants(
+    party_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    참가 신청/체크인/내보내기/상태 변경을 Server-Sent Events 로 보냅니다.
+
+    - 처음 연결하면 `snapshot` 이벤트로 전체 참가자 목록을 한 번 보낸 뒤 `participant`, `participant_removed` 변경분만 보냅니다.
+    - 재연결 시 브라우저가 보내는 `Last-Event-ID` 이후의 변경분부터 이어서 보냅니다.
+    - 이어 받을 수 없으면 `reset` 이벤트를 보내고 닫으며, 클라이언트는 Last-Event-ID 없이 다시 연결합니다.
+    """
+    db_party = crud_party.get_party(db, party_id=party_id)
+    if db_party is None:
+        raise HTTPException(status_code=404, detail="파티를 찾을 수 없습니다.")
+    if str(db_party.host_id) != str(current_user.id) and not current_user.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="파티 호스트만 참가자 목록을 조회할 수 있습니다.")
+
+    topic = crud_party.party_topic(db_party.id)
+    after_seq = events.parse_event_id(last_event_id)
+    snapshot = None
+    if after_seq is None:
+        # 스냅샷 조회 전에 순번을 읽어 두어, 조회 중에 일어난 변경도 이어서 받도록 합니다.
+        after_seq = events.last_seq(topic)
+        snapshot = [
+            {**row, "status": row["status"].value}
+            for row in crud_party.get_participants_rows(db, [db_party.id])[db_party.id]
+        ]
+
+    # 스트림이 열려 있는 동안 DB 연결을 잡고 있지 않도록 먼저 반납합니다.
+    db.close()
+    return StreamingResponse(
+        _participant_stream(request, topic, after_seq, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
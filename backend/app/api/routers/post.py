@@ -1,6 +1,4 @@
 import os
-import uuid
-import io
 from typing import List, Optional
 
 from fastapi import (
@@ -13,52 +11,27 @@ from fastapi import (
     Form,
 )
 from sqlalchemy.orm import Session
-from PIL import Image  # 이미지 압축/리사이즈용
 
-from app.api.deps import get_db
+from app.api.deps import get_db, sparse_fields
 from app import schemas
+from app.core import images, fields as fieldsets
+from app.core.responses import ORJSONResponse
 from app.crud import post as post_crud
 
 
-# ====== 이미지 압축 + 저장 헬퍼 ======
-async def save_compressed_image(
+# ====== 이미지 저장 헬퍼 ======
+async def save_original_image(
     upload_file: UploadFile,
     upload_dir: str = "static/posts",
-    max_size: tuple[int, int] = (1080, 1080),
-    quality: int = 75,
-) -> str:
+) -> tuple[str, str]:
     """
-    업로드된 이미지를 압축/리사이즈 해서 JPEG로 저장하고, /static 기준 URL을 반환.
-
-    - max_size: (가로, 세로) 최대 크기
-    - quality: JPEG 품질 (1~95 정도, 75면 충분히 깔끔하면서 용량 절감)
+    업로드된 이미지를 원본 그대로 저장하고 (파일 경로, /static 기준 URL) 을 반환.
+    압축/리사이즈(1080px JPEG + 썸네일)는 image_variants 백그라운드 작업이 처리하며,
+    끝나면 게시글의 image_url 이 변환본으로 바뀝니다.
     """
-    os.makedirs(upload_dir, exist_ok=True)
-
-    # 업로드된 파일 내용을 메모리로 읽기
     raw_bytes = await upload_file.read()
-
-    # Pillow로 이미지 열기
-    image = Image.open(io.BytesIO(raw_bytes))
-
-    # 1) 크기 제한 (1080x1080 안쪽으로 축소)
-    image.thumbnail(max_size)
-
-    # 2) RGB 변환 (PNG, etc → JPEG 저장 위해)
-    image = image.convert("RGB")
-
-    # 3) 파일명 생성 (확장자는 jpg 고정)
-    filename = f"{uuid.uuid4().hex}.jpg"
-    fs_path = os.path.join(upload_dir, filename)
-
-    # 4) 압축해서 JPEG로 저장
-    with open(fs_path, "wb") as f:
-        buffer = io.BytesIO()
-        image.save(buffer, format="JPEG", quality=quality, optimize=True)
-        f.write(buffer.getvalue())
-
-    # 5) 클라이언트에 노출할 경로 (/static 기준)
-    return f"/static/posts/{filename}"
+    fs_path = images.save_original(raw_bytes, upload_file.filename, upload_dir)
+    return fs_path, "/" + fs_path.replace(os.sep, "/")
 
 
 # 임시 사용자 ID. 실제로는 인증 시스템에서 가져와야 함.
@@ -91,10 +64,11 @@ async def create_post_route(
     """
 
     image_path: Optional[str] = None
+    image_source: Optional[str] = None
 
-    # 이미지가 있으면 압축 + 저장
+    # 이미지가 있으면 원본 저장 (압축은 백그라운드 작업)
     if image is not None:
-        image_path = await save_compressed_image(image)
+        image_source, image_path = await save_original_image(image)
 
     # Pydantic 스키마로 묶기 (image_url 로 통일)
     post_create = schemas.PostCreate(
@@ -108,6 +82,7 @@ async def create_post_route(
         db=db,
         post_create=post_create,
         user_id=current_user_id,
+        image_source=image_source,
     )
 
 
@@ -117,8 +92,15 @@ def get_post_list_route(
     skip: int = 0,
     limit: int = 10,
     db: Session = Depends(get_db),
+    fields: Optional[frozenset] = Depends(sparse_fields(schemas.Post, always=("post_id",))),
 ):
-    """게시글 목록을 최신순으로 조회합니다. (페이징 적용)"""
+    """
+    게시글 목록을 최신순으로 조회합니다. (페이징 적용)
+    fields=post_id,title,image_url 처럼 고르면 그 컬럼만 조회합니다. (본문 content 생략 가능)
+    """
+    if fields is not None:
+        rows = post_crud.get_post_list_rows(db, skip=skip, limit=limit, fields=fields)
+        return ORJSONResponse(fieldsets.serialize(schemas.Post, fields, rows))
     posts = post_crud.get_post_list(db, skip=skip, limit=limit)
     return posts
 
@@ -166,11 +148,11 @@ async def update_post_route(
         update_data["content"] = content
 
     # --- 2. 이미지 교체 처리 ---
+    image_source: Optional[str] = None
     if image is not None:
         # (원하면 여기서 기존 파일 삭제 로직 넣어도 됨)
-        # 새 이미지 압축 + 저장
-        new_image_path = await save_compressed_image(image)
-        update_data["image_url"] = new_image_path
+        # 새 이미지 원본 저장 (압축은 백그라운드 작업)
+        image_source, update_data["image_url"] = await save_original_image(image)
 
     # 변경 사항이 전혀 없으면 기존 객체 반환
     if not update_data:
@@ -183,6 +165,7 @@ async def update_post_route(
         db=db,
         db_post=db_post,
         post_update=post_update,
+        image_source=image_source,
     )
 
 
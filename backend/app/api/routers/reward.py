@@ -1,17 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
-import uuid
 import datetime
 
-from app.api.deps import get_db, get_current_user, get_current_admin_user
+from app.api.deps import get_db, get_current_user, get_current_admin_user, conditional_get
 from app.schemas import RewardResponse, RewardCreate, RewardUpdate
 from app.models import User, Credit, CreditTypeEnum 
 from app.crud import reward as crud_reward
+from app.crud import credit as crud_credit
+from app.core.ids import new_id
 
 router = APIRouter()
 
-@router.get("/", response_model=List[RewardResponse], summary="리워드 목록 조회")
+@router.get("/", response_model=List[RewardResponse], summary="리워드 목록 조회",
+            dependencies=[Depends(conditional_get("rewards"))])
 def read_rewards(db: Session = Depends(get_db)):
     """교환 가능한 모든 리워드 상품 목록을 조회합니다."""
     return crud_reward.get_rewards(db)
@@ -62,12 +64,13 @@ def exchange_reward(
     if not reward:
         raise HTTPException(status_code=404, detail="Reward not found")
 
-    current_balance = sum(credit.amount for credit in current_user.credits)
+    # 전체 기록을 불러와 더하지 않고 월말 스냅샷 + 이후 기록만 합산
+    current_balance = crud_credit.get_user_credit_balance(db, user_id=current_user.id)
     if current_balance < reward.cost:
         raise HTTPException(status_code=400, detail="Insufficient credits")
 
     new_credit = Credit(
-        id=str(uuid.uuid4()), # ID 생성 필요
+        id=new_id(), # ID 생성 필요
         user_id=current_user.id,
         amount=-reward.cost,
         type=CreditTypeEnum.SPENT_REWARD,
@@ -1,17 +1,38 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.api.deps import get_db, get_current_user
-from app.schemas import StoryCreate, StoryResponse, StoryResponseWithComments
+from app.core import config, fields as fieldsets
+from app.core.responses import ORJSONResponse
+from app.api.deps import get_db, get_current_user, conditional_get, sparse_fields
+from app.schemas import (
+    StoryCreate, StoryResponse, StoryResponseWithComments, StoryUpdate,
+    CommentCreate, CommentResponse,
+)
 from app.models import User
 from app.crud import story as crud_story
 
+# 스토리 라우트는 여기 한 곳에만 정의합니다.
+# 예전 경로(/community/stories)는 community 라우터가 이 라우터를 그대로 다시 붙여 제공합니다.
 router = APIRouter()
 
 @router.get("/", response_model=List[StoryResponse], summary="커뮤니티 스토리 목록 조회")
-def read_stories(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
-    """최신 스토리 목록을 조회합니다."""
+def read_stories(
+    skip: int = 0,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    cache_headers: dict = Depends(conditional_get("stories", "tags")),
+    fields: Optional[frozenset] = Depends(sparse_fields(StoryResponse))
+):
+    """
+    최신 스토리 목록을 조회합니다.
+    fields=id,title,excerpt,image_url 처럼 고르면 본문(content)과 태그/좋아요 조회를 건너뜁니다.
+    """
+    if fields is not None:
+        rows = crud_story.get_stories_rows(db, skip=skip, limit=limit, fields=fields)
+        return ORJSONResponse(fieldsets.serialize(StoryResponse, fields, rows), headers=cache_headers)
+    if config.FAST_JSON:
+        return ORJSONResponse(crud_story.get_stories_rows(db, skip=skip, limit=limit), headers=cache_headers)
     return crud_story.get_stories(db, skip=skip, limit=limit)
 
 @router.post("/", response_model=StoryResponse, status_code=status.HTTP_201_CREATED, summary="스토리 작성")
@@ -31,6 +52,21 @@ def read_story(story_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="스토리를 찾을 수 없습니다.")
     return story
 
+@router.patch("/{story_id}", response_model=StoryResponse, summary="스토리 수정")
+def update_story(
+    story_id: str,
+    story_in: StoryUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """작성자만 수정할 수 있습니다. tags 를 주면 전체 교체합니다."""
+    story = crud_story.get_story(db, story_id=story_id)
+    if not story:
+        raise HTTPException(status_code=404, detail="스토리를 찾을 수 없습니다.")
+    if story.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    return crud_story.update_story(db=db, db_story=story, story_in=story_in)
+
 @router.post("/{story_id}/like", response_model=StoryResponse, summary="스토리 좋아요 토글")
 def like_story(
     story_id: str,
@@ -43,6 +79,25 @@ def like_story(
         raise HTTPException(status_code=404, detail="스토리를 찾을 수 없습니다.")
     return story
 
+@router.post("/{story_id}/comments", response_model=CommentResponse, summary="댓글 작성")
+def create_comment(
+    story_id: str,
+    comment_in: CommentCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """스토리에 댓글을 작성합니다. (story_id 는 경로 값을 사용)"""
+    comment = crud_story.create_comment(
+        db=db,
+        comment=comment_in,
+        story_id=story_id,
+        user_id=current_user.id,
+        author_nickname=current_user.nickname
+    )
+    if comment is None:
+        raise HTTPException(status_code=404, detail="스토리를 찾을 수 없습니다.")
+    return comment
+
 @router.delete("/{story_id}", status_code=status.HTTP_204_NO_CONTENT, summary="스토리 삭제")
 def delete_story(
     story_id: str,
@@ -54,6 +109,6 @@ def delete_story(
         raise HTTPException(status_code=404, detail="Not found")
     if story.user_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
-    
+
     crud_story.delete_story(db, story_id)
-    return
\ No newline at end of file
+    return
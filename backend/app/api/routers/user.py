@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import timedelta
 
+from app.core import config
+from app.core.responses import ORJSONResponse
 # security 관련 함수 및 설정 임포트
 from app.core.security import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES
 # 의존성 임포트
 from app.api.deps import get_db, get_current_user
 # 스키마 및 모델 임포트
-from app.schemas import UserCreate, UserResponse, UserUpdate, Token
+from app.schemas import UserCreate, UserResponse, UserUpdate, Token, NeighborStatus, NeighborPage, FeedPage
 from app.models import User
-from app.crud import user as crud_user
+from app.crud import user as crud_user, feed as crud_feed
 
 router = APIRouter()
 
@@ -26,6 +28,8 @@ def read_users(
     limit: int = 100
 ):
     """모든 사용자 목록을 조회합니다."""
+    if config.FAST_JSON:
+        return ORJSONResponse(crud_user.get_users_rows(db, skip=skip, limit=limit))
     return crud_user.get_users(db, skip=skip, limit=limit)
 
 @router.post(
@@ -66,13 +70,14 @@ def create_user(
     summary="내 정보 조회"
 )
 def read_users_me(
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     현재 인증된 사용자의 프로필 정보를 반환합니다.
     (JWT 토큰 헤더를 통해 식별)
     """
-    return current_user
+    return _me_response(db, current_user)
 
 
 @router.patch(
@@ -88,7 +93,31 @@ def update_user_me(
     """
     현재 인증된 사용자의 프로필 정보를 수정합니다.
     """
-    return crud_user.update_user(db=db, db_user=current_user, user_in=user_in)
+    return _me_response(db, crud_user.update_user(db=db, db_user=current_user, user_in=user_in))
+
+
+def _me_response(db: Session, user: User) -> UserResponse:
+    """
+    본인 응답은 이웃 id 를 전부 담습니다. (이웃 추가/삭제 토글이 neighbors 로 현재 상태를 판단하므로
+    USER_NEIGHBORS_PREVIEW 개에서 잘리면 잘린 이웃을 다시 추가하려다 실패합니다.)
+    """
+    response = UserResponse.model_validate(user)
+    response.neighbors = crud_user.get_all_neighbor_ids(db, user.id)
+    return response
+
+
+@router.get("/me/feed", response_model=FeedPage, summary="이웃 활동 피드")
+def read_my_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    내 이웃들의 최신 활동(스토리 작성, 교환 아이템 등록, 게시글 작성, 파티 참가)을 최신순으로 반환합니다.
+    다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨 조회합니다.
+    """
+    return crud_feed.get_feed(db, user_id=current_user.id, cursor=cursor, limit=limit)
 
 
 @router.get(
@@ -163,7 +192,7 @@ def logout():
 # ---------------------------------------------------------
 # [추가] 이웃 추가 (Follow)
 # ---------------------------------------------------------
-@router.post("/{user_id}/neighbors", response_model=UserResponse, summary="이웃 추가")
+@router.post("/{user_id}/neighbors", response_model=NeighborStatus, summary="이웃 추가")
 def add_neighbor(
     user_id: str, # 팔로우할 대상의 ID
     db: Session = Depends(get_db),
@@ -171,22 +200,23 @@ def add_neighbor(
 ):
     """
     특정 사용자(user_id)를 내 이웃으로 추가합니다.
+    이미 이웃이면 그대로 성공을 반환합니다.
     """
     if current_user.id == user_id:
         raise HTTPException(status_code=400, detail="자기 자신을 이웃으로 추가할 수 없습니다.")
         
-    updated_user = crud_user.add_neighbor(db, db_user=current_user, neighbor_id=user_id)
+    result = crud_user.add_neighbor(db, user_id=current_user.id, neighbor_id=user_id)
     
-    if not updated_user:
+    if result is None:
          raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
          
-    return updated_user
+    return result
 
 
 # ---------------------------------------------------------
 # [추가] 이웃 삭제 (Unfollow)
 # ---------------------------------------------------------
-@router.delete("/{user_id}/neighbors", response_model=UserResponse, summary="이웃 삭제")
+@router.delete("/{user_id}/neighbors", response_model=NeighborStatus, summary="이웃 삭제")
 def delete_neighbor(
     user_id: str, # 언팔로우할 대상의 ID
     db: Session = Depends(get_db),
@@ -195,9 +225,45 @@ def delete_neighbor(
     """
     특정 사용자(user_id)를 내 이웃 목록에서 삭제합니다.
     """
-    updated_user = crud_user.remove_neighbor(db, db_user=current_user, neighbor_id=user_id)
+    result = crud_user.remove_neighbor(db, user_id=current_user.id, neighbor_id=user_id)
     
-    if not updated_user:
+    if result is None:
          raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
          
-    return updated_user
\ No newline at end of file
+    return result
+
+
+# ---------------------------------------------------------
+# 이웃 목록 (id 만, 커서 페이지네이션)
+# ---------------------------------------------------------
+@router.get("/{user_id}/neighbors", response_model=NeighborPage, summary="이웃 목록 조회")
+def read_neighbors(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """user_id 가 이웃으로 추가한 사용자 id 목록"""
+    return crud_user.get_neighbor_ids(db, user_id=user_id, cursor=cursor, limit=limit)
+
+
+@router.get("/{user_id}/followers", response_model=NeighborPage, summary="나를 추가한 이웃 목록 조회")
+def read_followers(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """user_id 를 이웃으로 추가한 사용자 id 목록"""
+    return crud_user.get_follower_ids(db, user_id=user_id, cursor=cursor, limit=limit)
+
+
+@router.get("/{user_id}/neighbors/mutual", response_model=NeighborPage, summary="서로이웃 목록 조회")
+def read_mutual_neighbors(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """user_id 와 서로 이웃으로 추가한 사용자 id 목록"""
+    return crud_user.get_mutual_neighbor_ids(db, user_id=user_id, cursor=cursor, limit=limit)
@@ -0,0 +1,217 @@
+# app/core/cache.py
+
+import functools
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from pydantic import TypeAdapter
+
+from app.core import config, metrics
+
+# -----------------------------------------------------------
+# 프로세스 내부 read-through 캐시 (LRU + TTL)
+#
+# 관리자가 가끔 수정하는 카탈로그 데이터(리워드, 메이커, 태그)를 위한 캐시입니다.
+# 각 캐시는 이름(namespace)과 세대(generation) 번호를 가지며,
+# invalidate() 는 로컬 항목을 비우고 백엔드의 세대를 올립니다.
+# 공유 백엔드(SharedFileBackend)를 쓰면 같은 호스트의 다른 워커도 세대 변화를 보고 무효화합니다.
+# -----------------------------------------------------------
+
+_MISSING = object()
+
+
+class LocalBackend:
+    """단일 프로세스용 세대 저장소 (워커 간 무효화 없음, TTL 로만 수렴)"""
+
+    def __init__(self):
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+
+class SharedFileBackend:
+    """
+    같은 호스트의 워커들이 공유하는 SQLite 파일 기반 세대 저장소.
+    매 조회마다 파일을 읽지 않도록 poll_interval 초 동안 읽은 값을 재사용합니다.
+    (다른 워커의 무효화는 최대 poll_interval 초 늦게 반영됨)
+    """
+
+    def __init__(self, path: str, poll_interval: float = 1.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._seen: dict[str, tuple[int, float]] = {}
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_generations "
+                "(namespace TEXT PRIMARY KEY, generation INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def generation(self, namespace: str) -> int:
+        now = time.monotonic()
+        seen = self._seen.get(namespace)
+        if seen is not None and now - seen[1] < self.poll_interval:
+            return seen[0]
+        row = self._connect().execute(
+            "SELECT generation FROM cache_generations WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        value = row[0] if row else 0
+        self._seen[namespace] = (value, now)
+        return value
+
+    def bump(self, namespace: str) -> None:
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO cache_generations (namespace, generation) VALUES (?, 1) "
+            "ON CONFLICT(namespace) DO UPDATE SET generation = generation + 1",
+            (namespace,),
+        )
+        # 자신이 올린 세대는 즉시 반영
+        self._seen.pop(namespace, None)
+
+
+def make_backend():
+    if config.CACHE_BACKEND == "file":
+        return SharedFileBackend(config.CACHE_SHARED_PATH, poll_interval=config.CACHE_POLL_INTERVAL)
+    return LocalBackend()
+
+
+class Cache:
+    """크기 제한(LRU)과 만료 시간(TTL)을 가진 캐시 하나"""
+
+    def __init__(self, name: str, maxsize: Optional[int] = None, ttl: Optional[float] = None, backend=None):
+        self.name = name
+        self.maxsize = maxsize if maxsize is not None else config.CACHE_MAXSIZE
+        self.ttl = ttl if ttl is not None else config.CACHE_TTL_SECONDS
+        self.backend = backend
+        self._data: "OrderedDict[Hashable, tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        _registry[name] = self
+
+    def _backend(self):
+        # 설정이 import 이후에 바뀌어도 반영되도록 공용 백엔드는 처음 사용할 때 만듭니다.
+        return self.backend or get_backend()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        generation = self._backend().generation(self.name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at, entry_generation = entry
+                if expires_at > now and entry_generation == generation:
+                    self._data.move_to_end(key)
+                    metrics.incr("cache_hits", self.name)
+                    return value
+                del self._data[key]
+        metrics.incr("cache_misses", self.name)
+        return default
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        if generation is None:
+            generation = self._backend().generation(self.name)
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl, generation)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                metrics.incr("cache_evictions", self.name)
+
+    def discard(self, key: Hashable) -> None:
+        """항목 하나만 로컬에서 지웁니다. (다른 워커의 같은 항목은 TTL 로 만료)"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self) -> None:
+        """로컬 항목을 모두 비우고 세대를 올려 다른 워커의 항목도 무효화합니다."""
+        with self._lock:
+            self._data.clear()
+        self._backend().bump(self.name)
+        metrics.incr("cache_invalidations", self.name)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_registry: dict[str, Cache] = {}
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = make_backend()
+    return _backend
+
+
+def cached(cache: Cache, schema: Any, key: Optional[Callable[..., Hashable]] = None):
+    """
+    (db, *args) 형태의 CRUD 조회 함수를 read-through 캐시로 감쌉니다.
+
+    ORM 객체는 세션에 묶여 있어 요청 간에 공유할 수 없으므로,
+    조회 결과를 schema(Pydantic 응답 모델)로 변환하여 저장하고 반환합니다.
+    key 를 생략하면 db 를 제외한 인자 전체를 키로 사용합니다.
+    """
+    adapter = TypeAdapter(schema)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(db, *args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (fn.__name__, args, tuple(sorted(kwargs.items())))
+            value = cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                return value
+            # 조회 전에 세대를 읽어 두어야 조회 중에 일어난 무효화를 놓치지 않습니다.
+            generation = cache._backend().generation(cache.name)
+            result = fn(db, *args, **kwargs)
+            value = adapter.validate_python(result, from_attributes=True) if result is not None else None
+            cache.set(cache_key, value, generation=generation)
+            return value
+
+        wrapper.uncached = fn
+        return wrapper
+
+    return decorator
+
+
+def stats() -> dict:
+    """캐시별 크기 / 적중 / 미스 / 축출 카운터"""
+    hits = metrics.get_counters("cache_hits")
+    misses = metrics.get_counters("cache_misses")
+    evictions = metrics.get_counters("cache_evictions")
+    invalidations = metrics.get_counters("cache_invalidations")
+    return {
+        name: {
+            "size": len(cache),
+            "maxsize": cache.maxsize,
+            "hits": hits.get(name, 0),
+            "misses": misses.get(name, 0),
+            "evictions": evictions.get(name, 0),
+            "invalidations": invalidations.get(name, 0),
+            "hit_rate": metrics.hit_rate(hits.get(name, 0), misses.get(name, 0)),
+        }
+        for name, cache in sorted(_registry.items())
+    }
+
+
+metrics.register_collector("cache", stats)
@@ -0,0 +1,213 @@
+# app/core/compression.py
+
+import hashlib
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core import config, metrics
+from app.core.cache import Cache, LocalBackend
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 설치되어 있지 않으면 gzip 만 사용
+    brotli = None
+
+# -----------------------------------------------------------
+# 응답 압축 미들웨어 (br / gzip)
+#
+# Accept-Encoding 을 보고 br(brotli 패키지가 있을 때) 또는 gzip 으로 JSON/텍스트 응답을 압축합니다.
+# - COMPRESS_MIN_BYTES 보다 작은 응답은 그대로 보냅니다. (작은 응답은 압축 이득보다 CPU 비용이 큼)
+# - 본문이 한 번에 오는 응답은 한 번에 압축하고 Content-Length 를 다시 계산합니다.
+# - 여러 조각으로 오는 응답(StreamingResponse, 관리자 내보내기)은 임계값을 넘는 순간부터
+#   조각 단위로 압축하며 보내므로 전체 본문을 메모리에 모으지 않습니다.
+# - ETag 가 붙은 응답(조건부 GET 캐시 계층)은 같은 본문을 다시 압축하지 않도록
+#   (인코딩, 본문 해시) -> 압축 바이트를 compressed_cache 에 보관합니다.
+# 이미 Content-Encoding 이 있는 응답, 압축 대상이 아닌 형식(관리자 내보내기 ?gzip=true 는 application/gzip 파일),
+# SSE(text/event-stream)는 건드리지 않습니다.
+# ETag 는 약한 ETag(W/"...")이므로 압축 여부와 관계없이 그대로 둡니다.
+# -----------------------------------------------------------
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+# 조각마다 바로 전달되어야 하는 응답 (압축기 내부 버퍼에 묶이면 안 됨)
+EXCLUDED_TYPES = ("text/event-stream",)
+
+# 본문 해시가 키이므로 무효화가 필요 없습니다. (워커별 로컬 세대 저장소 사용)
+compressed_cache = Cache("compressed_responses", maxsize=config.COMPRESS_CACHE_MAXSIZE, backend=LocalBackend())
+
+
+def available_encodings() -> tuple:
+    """서버가 지원하는 인코딩 (우선순위 순)"""
+    if brotli is not None and config.COMPRESS_BROTLI:
+        return ("br", "gzip")
+    return ("gzip",)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 의 q 값이 가장 높은 지원 인코딩. 같으면 br 우선, 없으면 None"""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name] = quality
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class Encoder:
+    """gzip / br 스트리밍 압축기 (compress() 를 조각마다, finish() 를 마지막에 한 번)"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=config.COMPRESS_BROTLI_QUALITY)
+            self.compress, self.finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(config.COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress, self.finish = compressor.compress, compressor.flush
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    encoder = Encoder(encoding)
+    return encoder.compress(body) + encoder.finish()
+
+
+def compress_cached(body: bytes, encoding: str) -> bytes:
+    """같은 본문이면 이전에 압축한 바이트를 재사용합니다."""
+    if len(body) > config.COMPRESS_CACHE_MAX_BODY_BYTES:
+        return compress(body, encoding)
+    key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+    data = compressed_cache.get(key)
+    if data is None:
+        data = compress(body, encoding)
+        compressed_cache.set(key, data)
+    return data
+
+
+def is_compressible(status: int, headers: Headers) -> bool:
+    if status < 200 or status in (204, 206, 304):
+        return False
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    if not content_type or content_type in EXCLUDED_TYPES:
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = minimum_size if minimum_size is not None else config.COMPRESS_MIN_BYTES
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingSend(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSend:
+    """
+    응답 메시지를 가로채 압축 여부를 정합니다.
+    start 메시지는 본문 크기를 알 때(임계값 도달 또는 본문 끝)까지 보내지 않고 들고 있습니다.
+    """
+
+    def __init__(self, send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start = None
+        # None: 아직 결정 전, False: 그대로 전달, True: 스트리밍 압축 중
+        self.compressing = None
+        self.pending: list[bytes] = []
+        self.pending_size = 0
+        self.encoder = None
+
+    async def __call__(self, message):
+        kind = message["type"]
+        if kind == "http.response.start":
+            self.start = message
+            if not is_compressible(message["status"], Headers(raw=message["headers"])):
+                self.compressing = False
+                await self.send(message)
+            return
+        if kind != "http.response.body" or self.compressing is False:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressing:
+            data = self.encoder.compress(body)
+            if not more_body:
+                data += self.encoder.finish()
+            if data or not more_body:
+                await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        self.pending.append(body)
+        self.pending_size += len(body)
+        if not more_body:
+            await self._send_whole(b"".join(self.pending))
+        elif self.pending_size >= self.minimum_size:
+            await self._start_streaming()
+
+    def _headers(self) -> MutableHeaders:
+        headers = MutableHeaders(scope=self.start)
+        headers.add_vary_header("Accept-Encoding")
+        return headers
+
+    async def _send_whole(self, body: bytes):
+        headers = self._headers()
+        if len(body) >= self.minimum_size:
+            if "etag" in headers:
+                data = compress_cached(body, self.encoding)
+            else:
+                data = compress(body, self.encoding)
+            metrics.incr("compressed_responses", self.encoding)
+            metrics.incr("compression_bytes_saved", self.encoding, len(body) - len(data))
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(data))
+            body = data
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": body})
+
+    async def _start_streaming(self):
+        headers = self._headers()
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["content-length"]
+        self.compressing = True
+        self.encoder = Encoder(self.encoding)
+        data = self.encoder.compress(b"".join(self.pending))
+        self.pending = []
+        metrics.incr("compressed_responses", self.encoding)
+        await self.send(self.start)
+        if data:
+            await self.send({"type": "http.response.body", "body": data, "more_body": True})
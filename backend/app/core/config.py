@@ -0,0 +1,91 @@
+# app/core/config.py
+
+import os
+
+# -----------------------------------------------------------
+# 런타임 설정 값 (환경변수로 덮어쓸 수 있습니다)
+# -----------------------------------------------------------
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """'1', 'true', 'yes', 'on' 을 참으로 해석하는 환경변수 플래그"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# 목록 API 빠른 직렬화 경로 (컬럼 프로젝션 + orjson, Pydantic 재검증 생략)
+FAST_JSON = env_flag("FAST_JSON")
+
+# 카탈로그 read-through 캐시
+# CACHE_BACKEND: "local" (워커별) 또는 "file" (같은 호스트 워커 간 무효화 공유)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "local")
+CACHE_SHARED_PATH = os.getenv("CACHE_SHARED_PATH", "./cache-generations.db")
+CACHE_POLL_INTERVAL = float(os.getenv("CACHE_POLL_INTERVAL", "1.0"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_MAXSIZE = int(os.getenv("CACHE_MAXSIZE", "1024"))
+
+# 시작 시 스키마 리비전 확인: "strict" (불일치 시 기동 중단), "warn" (로그만), "off"
+SCHEMA_CHECK = os.getenv("SCHEMA_CHECK", "strict")
+
+# 사용자 응답(UserResponse.neighbors)에 담는 이웃 id 수 (전체는 GET /users/{id}/neighbors)
+USER_NEIGHBORS_PREVIEW = int(os.getenv("USER_NEIGHBORS_PREVIEW", "50"))
+
+# 이웃 피드: 이웃 수가 이 값을 넘는 사용자의 활동은 타임라인에 복사하지 않고 조회 시 읽습니다.
+FEED_FANOUT_LIMIT = int(os.getenv("FEED_FANOUT_LIMIT", "5000"))
+
+# 파티 교환 매칭: 워커 메모리에 유지할 파티 인덱스 수 (LRU)
+MATCHING_MAX_PARTIES = int(os.getenv("MATCHING_MAX_PARTIES", "64"))
+
+# 파티 입장권(QR) 토큰: 파티 날짜가 끝난 뒤 이 시간까지 유효
+QR_TICKET_GRACE_HOURS = int(os.getenv("QR_TICKET_GRACE_HOURS", "12"))
+
+# 의류 QR(태그) 토큰 유효 기간, QR 스캔 상세 응답 캐시 TTL
+QR_ITEM_TOKEN_DAYS = int(os.getenv("QR_ITEM_TOKEN_DAYS", "365"))
+ITEM_DETAIL_CACHE_TTL = float(os.getenv("ITEM_DETAIL_CACHE_TTL", "30"))
+
+# 실시간 스트림(SSE): 토픽별 재연결용 이벤트 보관 수, keep-alive 주기,
+# 구독자 없이 이 시간(초) 동안 발행/구독이 없던 토픽은 메모리에서 정리
+EVENT_BUFFER_SIZE = int(os.getenv("EVENT_BUFFER_SIZE", "500"))
+EVENT_TOPIC_IDLE_SECONDS = float(os.getenv("EVENT_TOPIC_IDLE_SECONDS", "3600"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# 백그라운드 작업 큐 (app/core/jobs.py)
+# JOB_WORKERS=0 이면 API 프로세스에서는 실행하지 않고 'python -m app.worker' 로 따로 실행합니다.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "60"))
+JOB_BACKOFF_BASE = float(os.getenv("JOB_BACKOFF_BASE", "5"))
+JOB_BACKOFF_MAX = float(os.getenv("JOB_BACKOFF_MAX", "600"))
+JOB_RETENTION_HOURS = float(os.getenv("JOB_RETENTION_HOURS", "72"))
+
+# 파티 종료 후 출석(ATTENDED) 참가자에게 지급하는 크레딧
+PARTY_ATTENDANCE_CREDITS = int(os.getenv("PARTY_ATTENDANCE_CREDITS", "50"))
+# 관리자 통계 집계(stat_rollups)를 그대로 쓰는 최대 시간
+ROLLUP_MAX_AGE_SECONDS = float(os.getenv("ROLLUP_MAX_AGE_SECONDS", "300"))
+
+# 파티 수명 주기 스케줄러: 날짜가 지난 UPCOMING 파티를 COMPLETED 로 바꾸는 주기(초)
+PARTY_LIFECYCLE_INTERVAL = float(os.getenv("PARTY_LIFECYCLE_INTERVAL", "300"))
+
+# Idempotency-Key: 저장된 응답을 재사용하는 기간, 처리 중인 키를 다른 요청이 가져가지 못하게 잠그는 시간
+IDEMPOTENCY_TTL_HOURS = float(os.getenv("IDEMPOTENCY_TTL_HOURS", "24"))
+IDEMPOTENCY_LOCK_SECONDS = float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "30"))
+
+# 크레딧 원장: 최근 CREDIT_HOT_MONTHS 개월만 credits 테이블에 두고, 그 이전 달은 압축 파일로 보관
+CREDIT_HOT_MONTHS = int(os.getenv("CREDIT_HOT_MONTHS", "12"))
+CREDIT_ARCHIVE_DIR = os.getenv("CREDIT_ARCHIVE_DIR", "archives/credits")
+
+# 아이템 일괄 등록: 한 번에 insert/commit 하는 행 수, 요청 하나에 받는 최대 행 수
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+IMPORT_MAX_ROWS = int(os.getenv("IMPORT_MAX_ROWS", "20000"))
+
+# 응답 압축 (app/core/compression.py): 이 크기 이상인 JSON/텍스트 응답만 br/gzip 으로 압축
+# 앞단 프록시(nginx 등)가 압축한다면 COMPRESSION=0 으로 끕니다. br 은 brotli 패키지가 있을 때만 사용
+COMPRESSION = env_flag("COMPRESSION", default=True)
+COMPRESS_BROTLI = env_flag("COMPRESS_BROTLI", default=True)
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
+# ETag 가 붙은 응답의 압축 바이트 캐시: 항목 수, 캐시할 최대 원본 크기
+COMPRESS_CACHE_MAXSIZE = int(os.getenv("COMPRESS_CACHE_MAXSIZE", "256"))
+COMPRESS_CACHE_MAX_BODY_BYTES = int(os.getenv("COMPRESS_CACHE_MAX_BODY_BYTES", str(1024 * 1024)))
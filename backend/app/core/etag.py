@@ -0,0 +1,191 @@
+# app/core/etag.py
+
+import datetime
+import hashlib
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import event, select, update, insert, literal, exists
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.models import TableVersion
+
+# -----------------------------------------------------------
+# 조건부 GET (ETag / Last-Modified)
+#
+# 자주 조회되지만 거의 바뀌지 않는 목록(리워드, 메이커, 스토리, 파티 상세)은
+# 테이블별 버전 카운터(table_versions)로 약한 ETag 를 만들고,
+# If-None-Match 가 일치하면 본 쿼리/직렬화 없이 304 를 반환합니다.
+# -----------------------------------------------------------
+
+# 버전을 올리는 테이블. (credits 처럼 쓰기가 잦은 테이블은 추적하지 않아 버전 행 경합이 생기지 않음)
+# 쓰기는 API 프로세스와 워커(python -m app.worker) 양쪽에서 일어나므로, 라우터/모듈 import 여부와 관계없이
+# 어느 프로세스에서나 같은 집합이 되도록 여기에 고정해 둡니다. conditional_get 에 새 테이블을 쓰려면 먼저 추가하세요.
+TRACKED_TABLES = frozenset({
+    "rewards",                              # GET /rewards/
+    "makers", "maker_products",             # GET /makers/, /makers/{id}
+    "stories", "tags",                      # GET /stories/
+    "parties", "party_participations",      # GET /parties/{id} , 교환 매칭 인덱스 (app/crud/matching.py)
+})
+
+version_table = TableVersion.__table__
+
+
+def check_tracked(tables: Iterable[str]) -> None:
+    """추적하지 않는 테이블로 ETag 를 만들면 버전이 오르지 않아 영영 304 가 되므로 정의 시점에 막습니다."""
+    untracked = set(tables) - TRACKED_TABLES
+    if untracked:
+        raise ValueError(f"etag.TRACKED_TABLES 에 없는 테이블입니다: {', '.join(sorted(untracked))}")
+
+
+# --- 버전 증가 (쓰기 경로) ---
+
+def bump(connection, tables: Iterable[str]) -> None:
+    """주어진 테이블의 버전을 현재 트랜잭션 안에서 1 증가시킵니다."""
+    bump_keys(connection, set(tables) & TRACKED_TABLES)
+
+
+def bump_keys(connection, names: Iterable[str]) -> None:
+    """
+    추적 여부와 관계없이 주어진 이름의 버전 행을 1 증가시킵니다.
+    테이블 전체 대신 더 좁은 범위(예: 파티별 매칭 범위 "party_items:<id>")의 버전을 둘 때 씁니다.
+    """
+    now = datetime.datetime.utcnow()
+    for name in sorted(set(names)):
+        result = connection.execute(
+            update(version_table)
+            .where(version_table.c.name == name)
+            .values(version=version_table.c.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            # 처음 쓰이는 테이블이면 버전 행을 만듭니다. (없을 때만 insert)
+            connection.execute(
+                insert(version_table).from_select(
+                    ["name", "version", "updated_at"],
+                    select(literal(name), literal(1), literal(now)).where(
+                        ~exists().where(version_table.c.name == name)
+                    ),
+                )
+            )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed_tables(session: Session, flush_context) -> None:
+    # after_flush 시점에는 new/dirty/deleted 가 아직 flush 이전 상태를 담고 있습니다.
+    tables = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if hasattr(obj, "__table__")
+    }
+    if tables & TRACKED_TABLES:
+        bump(session.connection(), tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_bulk_statement_tables(orm_execute_state) -> None:
+    # query.update() / query.delete() / session.execute(update(...)) 같은 set-based 문장은
+    # flush 를 거치지 않으므로 여기서 대상 테이블의 버전을 올립니다.
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name in TRACKED_TABLES:
+        bump(orm_execute_state.session.connection(), [name])
+
+
+# --- 검증 (읽기 경로) ---
+
+def get_versions(db: Session, tables: Iterable[str]) -> list[tuple[str, int, Optional[datetime.datetime]]]:
+    names = sorted(set(tables))
+    rows = {
+        row.name: row
+        for row in db.query(TableVersion.name, TableVersion.version, TableVersion.updated_at)
+        .filter(TableVersion.name.in_(names))
+        .all()
+    }
+    return [
+        (name, rows[name].version, rows[name].updated_at) if name in rows else (name, 0, None)
+        for name in names
+    ]
+
+
+def make_etag(versions) -> str:
+    raw = ";".join(f"{name}:{version}" for name, version, _ in versions)
+    return 'W/"%s"' % hashlib.sha1(raw.encode()).hexdigest()[:20]
+
+
+def _strip_weak(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """약한 비교(weak comparison)로 If-None-Match 헤더와 ETag 를 비교합니다."""
+    if if_none_match.strip() == "*":
+        return True
+    target = _strip_weak(etag)
+    return any(_strip_weak(candidate) == target for candidate in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: str, last_modified: datetime.datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is not None:
+        since = since.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validate(request: Request, response: Response, db: Session, tables: Iterable[str]) -> dict:
+    """
+    요청의 조건부 헤더를 검사합니다.
+    변경이 없으면 HTTPException(304)를 발생시키고, 아니면 응답에 붙일 캐시 헤더를 반환합니다.
+    (응답 객체를 직접 반환하는 엔드포인트는 반환된 헤더를 직접 넣어주어야 합니다.)
+    """
+    route = request.scope.get("route")
+    label = getattr(route, "path", request.url.path)
+
+    versions = get_versions(db, tables)
+    etag = make_etag(versions)
+    timestamps = [updated_at for _, _, updated_at in versions if updated_at is not None]
+    last_modified = max(timestamps) if timestamps else None
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=datetime.timezone.utc), usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        unchanged = etag_matches(if_none_match, etag)
+    elif if_modified_since is not None and last_modified is not None:
+        unchanged = not_modified_since(if_modified_since, last_modified)
+    else:
+        unchanged = False
+
+    if unchanged:
+        metrics.incr("etag_hits", label)
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    metrics.incr("etag_misses", label)
+    response.headers.update(headers)
+    return headers
+
+
+def stats() -> dict:
+    """라우트별 304 적중률"""
+    hits, misses = metrics.get_counters("etag_hits"), metrics.get_counters("etag_misses")
+    return {
+        route: {
+            "hits": hits.get(route, 0),
+            "misses": misses.get(route, 0),
+            "hit_rate": metrics.hit_rate(hits.get(route, 0), misses.get(route, 0)),
+        }
+        for route in sorted(set(hits) | set(misses))
+    }
+
+
+metrics.register_collector("etag", stats)
@@ -0,0 +1,189 @@
+# app/core/events.py
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.core import config, metrics
+
+# -----------------------------------------------------------
+# 프로세스 내부 pub/sub (SSE 스트림용)
+#
+# 토픽(예: "party:<id>")마다 최근 이벤트를 EVENT_BUFFER_SIZE 개까지 보관하여
+# 재연결한 클라이언트가 Last-Event-ID 이후의 이벤트를 이어 받을 수 있게 합니다.
+# 이벤트 id 는 "<프로세스 epoch>-<토픽 내 순번>" 이며, 다른 워커/재시작 이후의 id 이거나
+# 버퍼에서 밀려난 id 면 이어 받을 수 없으므로 클라이언트에 reset 을 보내 스냅샷부터 다시 받게 합니다.
+#
+# publish 는 요청 스레드(스레드풀)에서, 구독은 이벤트 루프에서 일어나므로
+# 구독자 큐에는 loop.call_soon_threadsafe 로 넣습니다.
+#
+# 구독자가 없고 EVENT_TOPIC_IDLE_SECONDS 동안 발행/구독이 없던 토픽은 버퍼째 정리합니다.
+# 정리된 토픽이 다시 만들어지면 순번을 정리된 토픽들의 마지막 순번 이후부터 시작하므로,
+# 정리 전에 받은 id 로 재연결하면 엉뚱한 이벤트를 이어 받지 않고 reset 을 받습니다.
+# -----------------------------------------------------------
+
+EPOCH = os.urandom(4).hex()
+# 유휴 토픽 정리는 발행/구독 때 최대 이 간격(초)마다 한 번
+SWEEP_INTERVAL = 60.0
+
+
+def event_id(seq: int) -> str:
+    return f"{EPOCH}-{seq}"
+
+
+def sse_event(event_type: str, data: Any, event_id: Optional[str] = None) -> str:
+    """SSE 전송 형식 (event_id 가 없으면 재연결 위치에 영향을 주지 않는 단발 이벤트)"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event_type}\ndata: {payload}\n\n"
+
+
+def sse_comment(text: str = "") -> str:
+    return f": {text}\n\n"
+
+
+@dataclass(frozen=True)
+class Event:
+    seq: int
+    type: str
+    data: dict
+
+    @property
+    def id(self) -> str:
+        return event_id(self.seq)
+
+    def encode(self) -> str:
+        return sse_event(self.type, self.data, self.id)
+
+
+@dataclass(eq=False)
+class Subscription:
+    topic: str
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+
+
+@dataclass
+class _Topic:
+    buffer: deque
+    seq: int = 0
+    subscribers: set = field(default_factory=set)
+    last_active: float = field(default_factory=time.monotonic)
+
+
+_topics: dict[str, _Topic] = {}
+_lock = threading.Lock()
+# 정리된 토픽들의 마지막 순번 중 최댓값 (새 토픽의 시작 순번)
+_seq_floor = 0
+_last_sweep = time.monotonic()
+
+
+def _topic(name: str) -> _Topic:
+    """토픽을 가져오거나 만듭니다. (_lock 안에서 호출)"""
+    now = time.monotonic()
+    _sweep(now)
+    topic = _topics.get(name)
+    if topic is None:
+        topic = _topics[name] = _Topic(buffer=deque(maxlen=config.EVENT_BUFFER_SIZE), seq=_seq_floor)
+    topic.last_active = now
+    return topic
+
+
+def _sweep(now: float) -> None:
+    """구독자가 없고 오래 쓰이지 않은 토픽을 정리합니다. (_lock 안에서 호출)"""
+    global _seq_floor, _last_sweep
+    if now - _last_sweep < SWEEP_INTERVAL:
+        return
+    _last_sweep = now
+    idle = [
+        name for name, topic in _topics.items()
+        if not topic.subscribers and now - topic.last_active > config.EVENT_TOPIC_IDLE_SECONDS
+    ]
+    for name in idle:
+        _seq_floor = max(_seq_floor, _topics.pop(name).seq)
+    if idle:
+        metrics.incr("events_topics_evicted", amount=len(idle))
+
+
+def publish(topic_name: str, event_type: str, data: dict) -> Event:
+    with _lock:
+        topic = _topic(topic_name)
+        topic.seq += 1
+        event = Event(seq=topic.seq, type=event_type, data=data)
+        topic.buffer.append(event)
+        subscribers = list(topic.subscribers)
+    for subscription in subscribers:
+        try:
+            subscription.loop.call_soon_threadsafe(subscription.queue.put_nowait, event)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (연결 종료 직후)
+            pass
+    metrics.incr("events_published", topic_name.split(":", 1)[0])
+    return event
+
+
+def last_seq(topic_name: str) -> int:
+    """토픽의 마지막 순번. 아직 없는(또는 정리된) 토픽은 새로 만들어질 때의 시작 순번(_seq_floor)"""
+    with _lock:
+        topic = _topics.get(topic_name)
+        return topic.seq if topic else _seq_floor
+
+
+def parse_event_id(value: Optional[str]) -> Optional[int]:
+    """이 프로세스가 발급한 이벤트 id 면 순번을, 아니면 None"""
+    if not value:
+        return None
+    epoch, _, seq = value.strip().partition("-")
+    if epoch != EPOCH or not seq.isdigit():
+        return None
+    return int(seq)
+
+
+def subscribe(topic_name: str, after_seq: int) -> tuple[Subscription, Optional[list[Event]]]:
+    """
+    after_seq 이후 이벤트를 받는 구독을 만듭니다. (이벤트 루프 안에서 호출)
+    반환되는 backlog 는 버퍼에 남아 있는 after_seq 이후 이벤트이며,
+    이미 버퍼에서 밀려나 이어 받을 수 없으면 None 입니다.
+    """
+    subscription = Subscription(topic=topic_name, loop=asyncio.get_running_loop())
+    with _lock:
+        topic = _topic(topic_name)
+        oldest = topic.buffer[0].seq if topic.buffer else topic.seq + 1
+        if after_seq > topic.seq or after_seq < oldest - 1:
+            backlog = None
+        else:
+            backlog = [event for event in topic.buffer if event.seq > after_seq]
+        topic.subscribers.add(subscription)
+    return subscription, backlog
+
+
+def unsubscribe(subscription: Subscription) -> None:
+    with _lock:
+        topic = _topics.get(subscription.topic)
+        if topic is None:
+            return
+        topic.subscribers.discard(subscription)
+        # 마지막 구독자가 나간 시점부터 유휴 시간을 셉니다. (정리는 _sweep)
+        topic.last_active = time.monotonic()
+        # 구독자도 없고 보관할 이벤트도 없는 토픽은 바로 정리
+        if not topic.subscribers and not topic.buffer:
+            del _topics[subscription.topic]
+
+
+def stats() -> dict:
+    with _lock:
+        return {
+            "topics": len(_topics),
+            "subscribers": sum(len(topic.subscribers) for topic in _topics.values()),
+            "buffered": sum(len(topic.buffer) for topic in _topics.values()),
+            "evicted": metrics.get_counter("events_topics_evicted"),
+            "published": metrics.get_counters("events_published"),
+        }
+
+
+metrics.register_collector("events", stats)
@@ -0,0 +1,65 @@
+# app/core/export.py
+
+import csv
+import datetime
+import enum
+import io
+import json
+import zlib
+from typing import Iterable, Iterator, Sequence
+
+# -----------------------------------------------------------
+# 대용량 내보내기 인코딩 (CSV / NDJSON, 선택적 gzip)
+#
+# 행을 하나씩 받아 CHUNK_SIZE 정도씩 모아 bytes 로 내보내므로,
+# 전체 결과를 메모리에 올리지 않고 StreamingResponse 로 바로 흘려보낼 수 있습니다.
+# 행 조회(yield_per)는 app/crud/export.py 에서 담당합니다.
+# -----------------------------------------------------------
+
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+CHUNK_SIZE = 64 * 1024
+
+
+def _value(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return value
+
+
+def encode_rows(rows: Iterable[Sequence], columns: Sequence[str], fmt: str) -> Iterator[bytes]:
+    """행(컬럼 순서의 튜플)을 CSV / NDJSON 으로 인코딩해 CHUNK_SIZE 단위로 내보냅니다."""
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(buffer)
+        # 엑셀에서 한글이 깨지지 않도록 BOM
+        buffer.write("\ufeff")
+        writer.writerow(columns)
+        write = lambda row: writer.writerow([_value(value) for value in row])
+    else:
+        write = lambda row: buffer.write(
+            json.dumps({column: _value(value) for column, value in zip(columns, row)}, ensure_ascii=False) + "\n"
+        )
+
+    for row in rows:
+        write(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """bytes 스트림을 gzip 형식으로 압축하며 내보냅니다."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
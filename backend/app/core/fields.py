@@ -0,0 +1,61 @@
+# app/core/fields.py
+
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+# -----------------------------------------------------------
+# 희소 필드셋 (?fields=id,title,image_url)
+#
+# 목록 화면이 제목/썸네일만 그릴 때 긴 Text 컬럼(본문, 설명, 사연)과 부가 쿼리(참가자, 태그, 좋아요)를
+# 건너뛰도록, 요청한 필드만 컬럼 단위로 조회(프로젝션)하고 그 필드만 가진 응답 모델로 직렬화합니다.
+# 필드 이름은 각 목록의 응답 모델(ItemResponse, PartyResponse, ...) 기준이며, 식별자 필드는 항상 포함됩니다.
+# -----------------------------------------------------------
+
+DESCRIPTION = "응답에 포함할 필드 (쉼표로 구분, 예: id,title,image_url). 생략하면 전체 필드"
+
+
+class FieldsError(ValueError):
+    """응답 모델에 없는 필드를 요청한 경우"""
+
+
+def _available(model: type[BaseModel]) -> dict:
+    """필드 이름 -> (타입, FieldInfo 또는 기본값). computed_field 는 일반 필드로 취급합니다."""
+    available = {name: (info.annotation, info) for name, info in model.model_fields.items()}
+    for name, info in model.model_computed_fields.items():
+        available[name] = (info.return_type, None)
+    return available
+
+
+def parse(value: Optional[str], model: type[BaseModel], always: Sequence[str] = ("id",)) -> Optional[frozenset]:
+    """쉼표 구분 문자열을 필드 이름 집합으로 바꿉니다. 생략/빈 값이면 None (전체 필드)"""
+    if value is None or not value.strip():
+        return None
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = requested - set(_available(model))
+    if unknown:
+        raise FieldsError(f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+    return frozenset(requested | set(always))
+
+
+def wants(fields: Optional[frozenset], name: str) -> bool:
+    return fields is None or name in fields
+
+
+def select(columns: Iterable, fields: Optional[frozenset]) -> tuple:
+    """요청한 필드에 해당하는 컬럼만 (column.key 기준)"""
+    return tuple(column for column in columns if wants(fields, column.key))
+
+
+@lru_cache(maxsize=256)
+def _adapter(model: type[BaseModel], fields: frozenset) -> TypeAdapter:
+    definitions = {name: spec for name, spec in _available(model).items() if name in fields}
+    trimmed = create_model(f"{model.__name__}Fields", **definitions)
+    return TypeAdapter(List[trimmed])
+
+
+def serialize(model: type[BaseModel], fields: frozenset, rows: list) -> list:
+    """요청한 필드만 가진 응답 모델로 검증/직렬화한 JSON 호환 dict 목록"""
+    adapter = _adapter(model, fields)
+    return adapter.dump_python(adapter.validate_python(rows), mode="json")
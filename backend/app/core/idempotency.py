@@ -0,0 +1,155 @@
+# app/core/idempotency.py
+
+import hashlib
+import re
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, Response
+
+from app.core import metrics
+
+# -----------------------------------------------------------
+# Idempotency-Key 미들웨어
+#
+# 모바일 앱이 네트워크 오류로 같은 요청을 다시 보내도 한 번만 실행되도록,
+# 아래 경로의 요청에 Idempotency-Key 헤더가 있으면:
+# - 처음 받은 키: 실행하고 응답(5xx 제외)을 저장
+# - 이미 처리된 키: 실행하지 않고 저장된 응답을 그대로 반환 (Idempotent-Replayed: true)
+# - 처리 중인 키: 409 (Retry-After) / 같은 키로 본문이 다른 요청: 422
+# 키는 Authorization 헤더 + 메서드 + 경로와 묶어서 저장하므로 사용자/엔드포인트끼리 겹치지 않습니다.
+# 저장소는 app/crud/idempotency.py
+# -----------------------------------------------------------
+
+HEADER = "idempotency-key"
+MAX_KEY_LENGTH = 255
+
+IDEMPOTENT_ROUTES = [
+    ("POST", re.compile(r"^/credits/earn$")),
+    ("POST", re.compile(r"^/rewards/exchange/[^/]+$")),
+    ("POST", re.compile(r"^/items/add$")),
+    ("POST", re.compile(r"^/items/import$")),
+    ("POST", re.compile(r"^/clothing/$")),
+    ("POST", re.compile(r"^/posts/$")),
+]
+
+
+def is_idempotent_route(method: str, path: str) -> bool:
+    return any(method == route_method and pattern.match(path) for route_method, pattern in IDEMPOTENT_ROUTES)
+
+
+def _digest(*parts: bytes) -> bytes:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(len(part).to_bytes(4, "big"))
+        h.update(part)
+    return h.digest()[:16]
+
+
+def storage_key(authorization: str, method: str, path: str, key: str) -> bytes:
+    return _digest(authorization.encode(), method.encode(), path.encode(), key.encode())
+
+
+def fingerprint(body: bytes) -> bytes:
+    return _digest(body)
+
+
+def _run_db(fn, *args):
+    """동기 DB 작업을 스레드풀에서 별도 세션으로 실행"""
+    from app.database import SessionLocal, get_engine
+
+    def run():
+        get_engine()
+        db = SessionLocal()
+        try:
+            return fn(db, *args)
+        finally:
+            db.close()
+
+    return run_in_threadpool(run)
+
+
+class IdempotencyMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not is_idempotent_route(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        key = headers.get(HEADER)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await JSONResponse({"detail": "Invalid Idempotency-Key"}, status_code=400)(scope, receive, send)
+            return
+
+        from app.crud import idempotency as crud_idempotency
+
+        # 본문을 모두 읽어 지문을 만들고, 앱에는 읽은 본문을 다시 넘겨줍니다.
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        stored_key = storage_key(headers.get("authorization", ""), scope["method"], scope["path"], key)
+        outcome, row = await _run_db(crud_idempotency.begin, stored_key, fingerprint(body))
+        metrics.incr("idempotency", outcome)
+        if outcome == crud_idempotency.REPLAY:
+            response = Response(row.body, status_code=row.status_code, media_type=row.content_type,
+                                headers={"Idempotent-Replayed": "true"})
+            await response(scope, receive, send)
+            return
+        if outcome == crud_idempotency.MISMATCH:
+            await JSONResponse({"detail": "Idempotency-Key was used with a different request"},
+                               status_code=422)(scope, receive, send)
+            return
+        if outcome == crud_idempotency.IN_PROGRESS:
+            await JSONResponse({"detail": "A request with this Idempotency-Key is in progress"},
+                               status_code=409, headers={"Retry-After": "1"})(scope, receive, send)
+            return
+
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        # 응답을 모아 두었다가 저장한 뒤 보냅니다. (대상 엔드포인트는 작은 JSON 응답)
+        start = None
+        response_chunks = []
+
+        async def capture_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                response_chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except Exception:
+            await _run_db(crud_idempotency.release, stored_key)
+            raise
+
+        status_code = start["status"] if start else 500
+        response_body = b"".join(response_chunks)
+        if status_code >= 500:
+            await _run_db(crud_idempotency.release, stored_key)
+        else:
+            content_type = Headers(raw=start["headers"]).get("content-type")
+            await _run_db(crud_idempotency.complete, stored_key, status_code, content_type, response_body)
+
+        if start is not None:
+            await send(start)
+        await send({"type": "http.response.body", "body": response_body, "more_body": False})
@@ -0,0 +1,68 @@
+# app/core/ids.py
+
+import os
+import threading
+import time
+import uuid
+
+# -----------------------------------------------------------
+# 시간 순서 UUID (UUIDv7, RFC 9562)
+#
+# 앞 48비트가 밀리초 타임스탬프라서 새 행이 항상 인덱스 끝에 추가됩니다.
+# (uuid4 는 값이 무작위라 B-tree 삽입 위치가 흩어지고 페이지 분할이 잦음)
+# API 에 노출되는 id 는 지금처럼 "xxxxxxxx-xxxx-..." 문자열이고,
+# DB 에는 models.CompactUUID 타입으로 16바이트(바이너리/네이티브 uuid)로 저장됩니다.
+# -----------------------------------------------------------
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_BITS = 12  # rand_a 12비트를 같은 밀리초 안의 순번으로 사용 (프로세스 내 단조 증가)
+
+
+def uuid7(timestamp_ms: int | None = None) -> uuid.UUID:
+    global _last_ms, _counter
+    with _lock:
+        now = timestamp_ms if timestamp_ms is not None else time.time_ns() // 1_000_000
+        if now > _last_ms:
+            _last_ms, _counter = now, int.from_bytes(os.urandom(2), "big") & 0x3FF
+        else:
+            # 같은 밀리초(또는 시계가 뒤로 감): 순번을 올리고, 넘치면 다음 밀리초로 넘어갑니다.
+            _counter += 1
+            if _counter >> _COUNTER_BITS:
+                _last_ms, _counter = _last_ms + 1, 0
+        ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76 | counter << 64
+    value |= 0b10 << 62 | rand_b
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """새 엔티티 id (UUIDv7 문자열)"""
+    return str(uuid7())
+
+
+def id_timestamp(value: str) -> float | None:
+    """UUIDv7 id 에 담긴 생성 시각(epoch 초). v7 이 아니면 None"""
+    parsed = uuid.UUID(value)
+    if parsed.version != 7:
+        return None
+    return (parsed.int >> 80) / 1000
+
+
+class MalformedIdError(ValueError):
+    """UUID 형식이 아닌 id (models.CompactUUID 에 바인딩될 때 발생)"""
+
+
+def parse_id(value) -> uuid.UUID:
+    """id 문자열(또는 UUID) -> UUID. 형식이 아니면 MalformedIdError"""
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise MalformedIdError(f"올바른 id 형식이 아닙니다 ({value!r})") from None
@@ -0,0 +1,69 @@
+# app/core/images.py
+
+import io
+import os
+import uuid
+
+# -----------------------------------------------------------
+# 업로드 이미지 저장 / 변환
+#
+# 요청 경로에서는 원본 바이트만 저장하고(save_original), 압축/리사이즈는
+# 백그라운드 작업(image_variants)이 make_variants 로 처리합니다.
+# 변환 결과 파일 이름은 원본 이름에서 정해지므로 같은 작업을 다시 실행해도 결과가 같습니다.
+# -----------------------------------------------------------
+
+ORIGINALS_DIR = "originals"
+ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp", "bmp"}
+
+# (접미사, 최대 크기, JPEG 품질)
+VARIANTS = (
+    ("", (1080, 1080), 75),       # 본문용 (기존 save_compressed_image 와 같은 설정)
+    ("_thumb", (320, 320), 70),   # 목록 썸네일
+)
+
+
+def save_original(raw_bytes: bytes, filename: str | None, upload_dir: str) -> str:
+    """원본을 upload_dir/originals 에 그대로 저장하고 파일 경로를 반환합니다. (Pillow 를 쓰지 않음)"""
+    upload_dir = os.path.join(upload_dir, ORIGINALS_DIR)
+    os.makedirs(upload_dir, exist_ok=True)
+    extension = (filename or "").rsplit(".", 1)[-1].lower() if filename and "." in filename else ""
+    if extension not in ALLOWED_EXTENSIONS:
+        extension = "img"
+    fs_path = os.path.join(upload_dir, f"{uuid.uuid4().hex}.{extension}")
+    with open(fs_path, "wb") as f:
+        f.write(raw_bytes)
+    return fs_path
+
+
+def variant_path(source_path: str, suffix: str = "") -> str:
+    """upload_dir/originals/<stem>.<ext> -> upload_dir/<stem><suffix>.jpg"""
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    upload_dir = os.path.dirname(os.path.dirname(source_path))
+    return os.path.join(upload_dir, f"{stem}{suffix}.jpg")
+
+
+def make_variants(source_path: str) -> list[str]:
+    """
+    원본에서 JPEG 변환본들을 만들고 경로 목록을 반환합니다. (VARIANTS 순서)
+    이미 만들어진 변환본은 건너뜁니다.
+    """
+    paths = [variant_path(source_path, suffix) for suffix, _, _ in VARIANTS]
+    if all(os.path.exists(path) for path in paths):
+        return paths
+
+    # Pillow 는 import 비용이 커서 작업 실행 시점에 불러옵니다.
+    from PIL import Image
+
+    with Image.open(source_path) as original:
+        original = original.convert("RGB")
+        for (suffix, max_size, quality), path in zip(VARIANTS, paths):
+            image = original.copy()
+            image.thumbnail(max_size)
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=quality, optimize=True)
+            # 쓰는 도중 실패해도 반쯤 쓴 파일이 남지 않도록 임시 파일 -> rename
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(buffer.getvalue())
+            os.replace(tmp_path, path)
+    return paths
@@ -0,0 +1,32 @@
+# app/core/impact.py
+
+from typing import Optional
+
+# -----------------------------------------------------------
+# 파티 임팩트(교환으로 아낀 물 / 탄소) 계수
+#
+# 새 옷 한 벌을 만드는 대신 교환했을 때 아낄 수 있는 양을 카테고리별로 추정한 값입니다.
+# (물: 리터, CO2: kg / 한 벌) 알 수 없는 카테고리는 DEFAULT_COEFFICIENT 를 씁니다.
+# 실제 집계는 app/crud/impact.py 에서 DB 의 GROUP BY 한 번으로 계산합니다.
+# -----------------------------------------------------------
+
+COEFFICIENTS: dict[str, tuple[int, int]] = {
+    "티셔츠": (2700, 7),
+    "바지": (7500, 33),
+    "드레스": (9000, 25),
+    "자켓": (8000, 30),
+    "악세서리": (1000, 3),
+}
+DEFAULT_COEFFICIENT = (3000, 10)
+
+
+def coefficient(category) -> tuple[int, int]:
+    """카테고리(enum 또는 값) 한 벌당 (물, CO2)"""
+    return COEFFICIENTS.get(getattr(category, "value", category), DEFAULT_COEFFICIENT)
+
+
+def from_columns(items_exchanged: Optional[int], water_saved: Optional[int], co2_reduced: Optional[int]) -> Optional[dict]:
+    """파티에 저장된 임팩트 컬럼 -> ImpactStatsBase 형태 (아직 계산된 적 없으면 None)"""
+    if items_exchanged is None:
+        return None
+    return {"items_exchanged": items_exchanged, "water_saved": water_saved or 0, "co2_reduced": co2_reduced or 0}
@@ -0,0 +1,88 @@
+# app/core/item_import.py
+
+import csv
+import json
+from typing import Iterable, Iterator, Optional
+
+# -----------------------------------------------------------
+# 아이템 일괄 등록 파일 파싱 (CSV / JSON lines)
+#
+# 파티 현장 접수처럼 수백 벌을 한 번에 등록할 때 쓰는 파일 형식입니다.
+# - CSV: 첫 줄은 헤더 (name, description, category, size, image_url, goodbye_met_when, ...)
+# - NDJSON: 한 줄에 객체 하나. Goodbye Tag 는 "goodbye_tag" 객체 또는 goodbye_ 접두사 필드
+# goodbye_ 필드가 하나라도 채워진 행만 Goodbye Tag 를 만듭니다.
+# 행 단위 검증/저장은 app/crud/item.import_items 에서 합니다.
+# -----------------------------------------------------------
+
+FORMATS = ("csv", "ndjson")
+EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+GOODBYE_PREFIX = "goodbye_"
+
+
+class ImportRowError(ValueError):
+    """파싱 단계에서 읽을 수 없는 행 (행 번호와 함께 보고)"""
+
+
+def format_for(filename: Optional[str]) -> Optional[str]:
+    """파일 확장자로 형식을 추정합니다. 모르면 None"""
+    if not filename:
+        return None
+    for extension, fmt in EXTENSIONS.items():
+        if filename.lower().endswith(extension):
+            return fmt
+    return None
+
+
+def _nest_goodbye_tag(record: dict) -> dict:
+    tag = record.pop("goodbye_tag", None) or {}
+    if not isinstance(tag, dict):
+        # 객체가 아닌 값은 그대로 두어 검증 단계에서 행 오류로 보고되게 합니다.
+        record["goodbye_tag"] = tag
+        return record
+    tag = dict(tag)
+    for key in [key for key in record if key.startswith(GOODBYE_PREFIX)]:
+        value = record.pop(key)
+        if value not in (None, ""):
+            tag[key[len(GOODBYE_PREFIX):]] = value
+    if tag:
+        record["goodbye_tag"] = tag
+    return record
+
+
+def _csv_records(lines: Iterable[str]) -> Iterator[tuple[int, object]]:
+    reader = csv.DictReader(lines)
+    for row in reader:
+        # 헤더보다 칸이 많은 행은 None 키에 남는 값이 모입니다.
+        if None in row:
+            yield reader.line_num, ImportRowError("헤더보다 열이 많습니다.")
+            continue
+        record = {key: value for key, value in row.items() if key and value not in (None, "")}
+        if record:
+            yield reader.line_num, _nest_goodbye_tag(record)
+
+
+def _ndjson_records(lines: Iterable[str]) -> Iterator[tuple[int, object]]:
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_no, ImportRowError(f"JSON 형식 오류: {exc}")
+            continue
+        if not isinstance(record, dict):
+            yield line_no, ImportRowError("각 줄은 JSON 객체여야 합니다.")
+            continue
+        yield line_no, _nest_goodbye_tag(record)
+
+
+def parse_records(lines: Iterable[str], fmt: str) -> Iterator[tuple[int, object]]:
+    """
+    (행 번호, dict 또는 ImportRowError) 를 순서대로 내보냅니다.
+    파일 전체를 읽지 않고 줄 단위로 처리하므로 큰 파일도 메모리에 올리지 않습니다.
+    """
+    if fmt == "csv":
+        return _csv_records(lines)
+    if fmt == "ndjson":
+        return _ndjson_records(lines)
+    raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
@@ -0,0 +1,236 @@
+# app/core/jobs.py
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from app.core import config, metrics
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------------------------------------
+# 백그라운드 작업 실행기
+#
+# 작업은 같은 DB 의 jobs 테이블에 저장되고(app/crud/job.py), 워커 스레드들이 가져가 실행합니다.
+# - 우선순위(작을수록 먼저) -> 실행 예정 시각 순으로 가져감
+# - 실패하면 지수 백오프(+지터) 후 재시도, max_attempts 를 넘으면 FAILED
+# - 실행 중 워커가 죽으면 visibility timeout 이 지난 뒤 다른 워커가 다시 가져감
+# - 작업 함수의 DB 쓰기와 완료 표시는 한 트랜잭션이므로, 완료된 작업의 쓰기가 두 번 반영되지 않습니다.
+#
+# 작업 함수는 도메인 crud 모듈에서 @handler("종류") 로 등록하고, 큐에는 crud_job.enqueue 로 넣습니다.
+# -----------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    kind: str
+    fn: Callable
+    visibility_timeout: float
+    # True 면 완료 후 dedupe_key 를 풀어 같은 키로 다시 넣을 수 있습니다. (집계 갱신처럼 반복되는 작업)
+    release_key: bool
+
+
+HANDLERS: dict[str, JobSpec] = {}
+# 주기 작업: 종류 -> 주기(초)
+PERIODIC: dict[str, float] = {}
+
+
+def handler(kind: str, visibility_timeout: Optional[float] = None, release_key: bool = False):
+    """fn(db, payload) 를 작업 종류 kind 의 실행 함수로 등록합니다. commit 은 실행기가 합니다."""
+    def decorator(fn):
+        HANDLERS[kind] = JobSpec(
+            kind=kind, fn=fn,
+            visibility_timeout=visibility_timeout or config.JOB_VISIBILITY_TIMEOUT,
+            release_key=release_key,
+        )
+        return fn
+    return decorator
+
+
+def periodic(kind: str, interval: float) -> None:
+    """
+    kind 작업을 interval 초마다 한 번 실행하도록 등록합니다.
+    각 워커가 유휴 시간에 "종류:시간 구간" dedupe_key 로 작업을 넣으므로, 워커/프로세스가 여러 개여도
+    구간마다 하나만 들어갑니다.
+    """
+    PERIODIC[kind] = interval
+
+
+def backoff_seconds(attempts: int) -> float:
+    """attempts 번 실패한 뒤의 대기 시간: base * 2^(attempts-1), 최대 JOB_BACKOFF_MAX, 50~100% 지터"""
+    delay = min(config.JOB_BACKOFF_BASE * 2 ** max(attempts - 1, 0), config.JOB_BACKOFF_MAX)
+    return delay * random.uniform(0.5, 1.0)
+
+
+class JobRunner:
+    PURGE_INTERVAL = 600
+
+    def __init__(self, workers: int, poll_interval: Optional[float] = None):
+        self.workers = workers
+        self.poll_interval = poll_interval if poll_interval is not None else config.JOB_POLL_INTERVAL
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._last_purge = 0.0
+        self._periodic_slots: dict[str, int] = {}
+        self._periodic_lock = threading.Lock()
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._loop, args=(f"{self.name}:{i}",), name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info("job runner started (%d workers)", self.workers)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def _loop(self, worker: str) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_once(worker)
+            except Exception:
+                logger.exception("job runner loop error")
+                ran = False
+            if not ran:
+                self._enqueue_periodic()
+                self._maybe_purge()
+                self._stop.wait(self.poll_interval)
+
+    def run_once(self, worker: str) -> bool:
+        """작업 하나를 가져와 실행합니다. 가져갈 작업이 없으면 False"""
+        from app.database import SessionLocal
+        from app.crud import job as crud_job
+
+        db = SessionLocal()
+        try:
+            job = crud_job.claim(db, worker, config.JOB_VISIBILITY_TIMEOUT)
+            if job is None:
+                return False
+            job_id, kind, payload, attempts, max_attempts = job.id, job.kind, job.payload, job.attempts, job.max_attempts
+            spec = HANDLERS.get(kind)
+            if spec is None:
+                crud_job.fail(db, job_id, worker, f"등록되지 않은 작업 종류: {kind}", retry_in=None)
+                metrics.incr("jobs_failed", kind)
+                return True
+
+            # 가져올 때는 기본 visibility timeout 으로 잠그므로, 종류별 값이 더 길면 늘려 둡니다.
+            if spec.visibility_timeout != config.JOB_VISIBILITY_TIMEOUT:
+                crud_job.extend_lock(db, job_id, worker, spec.visibility_timeout)
+
+            started = time.perf_counter()
+            try:
+                spec.fn(db, payload)
+                if not crud_job.finish(db, job_id, worker, release_key=spec.release_key):
+                    # 그 사이 다른 워커가 가져감 -> 이쪽 결과는 버림
+                    db.rollback()
+                    metrics.incr("jobs_lost_lease", kind)
+                    return True
+                db.commit()
+                metrics.incr("jobs_done", kind)
+            except Exception as exc:
+                db.rollback()
+                logger.warning("job %s (%s) failed (attempt %d/%d)", job_id, kind, attempts, max_attempts, exc_info=True)
+                retry_in = backoff_seconds(attempts) if attempts < max_attempts else None
+                crud_job.fail(db, job_id, worker, f"{type(exc).__name__}: {exc}", retry_in)
+                metrics.incr("jobs_retried" if retry_in is not None else "jobs_failed", kind)
+            finally:
+                metrics.incr("jobs_run_ms", kind, int((time.perf_counter() - started) * 1000))
+            return True
+        finally:
+            db.close()
+
+    def _enqueue_periodic(self) -> None:
+        now = time.time()
+        with self._periodic_lock:
+            due = {
+                kind: int(now // interval) for kind, interval in PERIODIC.items()
+                if self._periodic_slots.get(kind) != int(now // interval)
+            }
+            self._periodic_slots.update(due)
+        if not due:
+            return
+        from app.database import SessionLocal
+        from app.crud import job as crud_job
+
+        db = SessionLocal()
+        try:
+            for kind, slot in due.items():
+                crud_job.enqueue(db, kind, {"slot": slot}, priority=10, dedupe_key=f"{kind}:{slot}")
+            db.commit()
+        except Exception:
+            logger.exception("periodic job enqueue failed")
+            with self._periodic_lock:
+                for kind in due:
+                    self._periodic_slots.pop(kind, None)
+        finally:
+            db.close()
+
+    def _maybe_purge(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < self.PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        from app.database import SessionLocal
+        from app.crud import job as crud_job
+
+        db = SessionLocal()
+        try:
+            crud_job.purge_finished(db, config.JOB_RETENTION_HOURS)
+        except Exception:
+            logger.exception("job purge failed")
+        finally:
+            db.close()
+
+
+_runner: Optional[JobRunner] = None
+
+
+def start_runner(workers: Optional[int] = None) -> Optional[JobRunner]:
+    global _runner
+    workers = config.JOB_WORKERS if workers is None else workers
+    if workers <= 0 or _runner is not None:
+        return _runner
+    _runner = JobRunner(workers)
+    _runner.start()
+    return _runner
+
+
+def stop_runner() -> None:
+    global _runner
+    if _runner is not None:
+        _runner.stop()
+        _runner = None
+
+
+def stats() -> dict:
+    """큐 깊이/지연(DB 기준, 모든 워커 공통)과 이 프로세스의 처리 카운터"""
+    from app.database import SessionLocal, get_engine
+    from app.crud import job as crud_job
+
+    data = {
+        "workers": _runner.workers if _runner else 0,
+        "done": metrics.get_counters("jobs_done"),
+        "retried": metrics.get_counters("jobs_retried"),
+        "failed": metrics.get_counters("jobs_failed"),
+        "lost_lease": metrics.get_counters("jobs_lost_lease"),
+        "run_ms": metrics.get_counters("jobs_run_ms"),
+    }
+    get_engine()
+    db = SessionLocal()
+    try:
+        data.update(crud_job.queue_stats(db))
+    finally:
+        db.close()
+    return data
+
+
+metrics.register_collector("jobs", stats)
@@ -0,0 +1,155 @@
+# app/core/matching.py
+
+import heapq
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# -----------------------------------------------------------
+# 교환 아이템 매칭 인덱스 (메모리)
+#
+# 한 범위(파티)에 출품된 아이템을 (카테고리, 사이즈) 버킷과 소유자별로 색인합니다.
+# 사용자가 원하는 사이즈/카테고리의 버킷만 훑어 후보를 만들고,
+# 후보 소유자가 입는 사이즈(그 사람이 내놓은 옷들의 사이즈)에 내 옷이 맞으면 "서로 교환(two-way)" 후보로 가산합니다.
+# DB 조회/무효화는 app/crud/matching.py 에서 담당합니다.
+# -----------------------------------------------------------
+
+SCORE_MATCH = 1.0       # 원하는 (카테고리, 사이즈)에 해당
+SCORE_TWO_WAY = 2.0     # 상대도 내 옷을 입을 수 있음
+SCORE_CATEGORY = 0.5    # 선호 카테고리 순서 가산 (첫 번째가 최대)
+MAX_SWAP_WITH = 3
+
+
+@dataclass(frozen=True)
+class ItemEntry:
+    id: str
+    owner_id: str
+    owner_nickname: str
+    category: str
+    size: Optional[str]
+    name: str
+    image_url: str
+
+
+@dataclass
+class Match:
+    item: ItemEntry
+    score: float
+    two_way: bool
+    swap_with: list[str]
+
+
+class MatchIndex:
+    def __init__(self, scope: str, version=None):
+        # version: 인덱스를 만들 때의 데이터 버전 (무효화 판단은 호출한 쪽에서)
+        self.scope = scope
+        self.version = version
+        self._items: dict[str, ItemEntry] = {}
+        self._by_key: dict[tuple[str, Optional[str]], set[str]] = defaultdict(set)
+        self._by_owner: dict[str, set[str]] = defaultdict(set)
+        self._owner_sizes: dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._items
+
+    # --- 증분 갱신 ---
+
+    def upsert(self, entry: ItemEntry) -> None:
+        with self._lock:
+            self.remove(entry.id)
+            self._items[entry.id] = entry
+            self._by_key[(entry.category, entry.size)].add(entry.id)
+            self._by_owner[entry.owner_id].add(entry.id)
+            if entry.size:
+                self._owner_sizes[entry.owner_id][entry.size] += 1
+
+    def remove(self, item_id: str) -> None:
+        with self._lock:
+            entry = self._items.pop(item_id, None)
+            if entry is None:
+                return
+            key = (entry.category, entry.size)
+            self._by_key[key].discard(item_id)
+            if not self._by_key[key]:
+                del self._by_key[key]
+            self._by_owner[entry.owner_id].discard(item_id)
+            if not self._by_owner[entry.owner_id]:
+                del self._by_owner[entry.owner_id]
+            if entry.size:
+                sizes = self._owner_sizes[entry.owner_id]
+                sizes[entry.size] -= 1
+                if sizes[entry.size] <= 0:
+                    del sizes[entry.size]
+                if not sizes:
+                    del self._owner_sizes[entry.owner_id]
+
+    def load(self, entries: Iterable[ItemEntry]) -> None:
+        for entry in entries:
+            self.upsert(entry)
+
+    # --- 조회 ---
+
+    def owned_by(self, owner_id: str) -> list[ItemEntry]:
+        return [self._items[item_id] for item_id in self._by_owner.get(owner_id, ())]
+
+    def sizes_of(self, owner_id: str) -> set[str]:
+        return set(self._owner_sizes.get(owner_id, ()))
+
+    def match(
+        self,
+        user_id: str,
+        sizes: Optional[Iterable[str]] = None,
+        categories: Optional[list[str]] = None,
+        limit: int = 20,
+    ) -> list[Match]:
+        """
+        user_id 에게 맞는 교환 후보를 점수순으로 반환합니다.
+        sizes 를 생략하면 내가 내놓은 옷들의 사이즈를 내 사이즈로 봅니다. (없으면 모든 사이즈)
+        categories 는 선호 순서대로 넘기며, 생략하면 모든 카테고리입니다.
+        """
+        with self._lock:
+            mine = self.owned_by(user_id)
+            wanted_sizes = set(sizes) if sizes else self.sizes_of(user_id)
+            category_rank = {category: rank for rank, category in enumerate(categories or [])}
+
+            keys = [
+                key for key in self._by_key
+                if (not wanted_sizes or key[1] in wanted_sizes)
+                and (not category_rank or key[0] in category_rank)
+            ]
+
+            # 소유자별 서로 교환 가능 여부는 요청당 한 번만 계산
+            swap_cache: dict[str, list[str]] = {}
+
+            def swap_with(owner_id: str) -> list[str]:
+                if owner_id not in swap_cache:
+                    owner_sizes = self._owner_sizes.get(owner_id)
+                    swap_cache[owner_id] = [
+                        item.id for item in mine if owner_sizes and item.size in owner_sizes
+                    ][:MAX_SWAP_WITH]
+                return swap_cache[owner_id]
+
+            def scored():
+                for key in keys:
+                    bonus = 0.0
+                    if category_rank:
+                        bonus = SCORE_CATEGORY * (len(category_rank) - category_rank[key[0]]) / len(category_rank)
+                    for item_id in self._by_key[key]:
+                        entry = self._items[item_id]
+                        if entry.owner_id == user_id:
+                            continue
+                        swaps = swap_with(entry.owner_id)
+                        score = SCORE_MATCH + bonus + (SCORE_TWO_WAY if swaps else 0.0)
+                        # 같은 점수면 최근 등록(UUIDv7 id 가 큰) 아이템 우선
+                        yield (score, entry.id, entry, swaps)
+
+            top = heapq.nlargest(limit, scored(), key=lambda row: (row[0], row[1]))
+            return [
+                Match(item=entry, score=round(score, 3), two_way=bool(swaps), swap_with=swaps)
+                for score, _, entry, swaps in top
+            ]
@@ -0,0 +1,65 @@
+# app/core/metrics.py
+
+import threading
+from collections import defaultdict
+from typing import Callable, Dict
+
+# -----------------------------------------------------------
+# 프로세스 내부 메트릭 (카운터 / 게이지)
+# 워커 프로세스마다 따로 집계되며 /admin/metrics 로 조회합니다.
+# -----------------------------------------------------------
+
+_lock = threading.Lock()
+_counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+_gauges: Dict[str, Dict[str, float]] = defaultdict(dict)
+_collectors: Dict[str, Callable[[], dict]] = {}
+
+
+def incr(name: str, label: str = "", amount: int = 1) -> None:
+    """카운터 증가. label 로 라우트/캐시 이름 등을 구분합니다."""
+    with _lock:
+        _counters[name][label] += amount
+
+
+def set_gauge(name: str, value: float, label: str = "") -> None:
+    with _lock:
+        _gauges[name][label] = value
+
+
+def get_counter(name: str, label: str = "") -> int:
+    with _lock:
+        return _counters[name].get(label, 0)
+
+
+def get_counters(name: str) -> Dict[str, int]:
+    """label 별 카운터 값 복사본"""
+    with _lock:
+        return dict(_counters.get(name, {}))
+
+
+def register_collector(name: str, collector: Callable[[], dict]) -> None:
+    """조회 시점에 값을 계산하는 수집기(예: 적중률, 큐 길이)를 등록합니다."""
+    _collectors[name] = collector
+
+
+def hit_rate(hits: int, misses: int) -> float:
+    total = hits + misses
+    return round(hits / total, 4) if total else 0.0
+
+
+def snapshot() -> dict:
+    """현재까지의 모든 메트릭을 dict 로 반환합니다."""
+    with _lock:
+        data = {
+            "counters": {name: dict(values) for name, values in _counters.items()},
+            "gauges": {name: dict(values) for name, values in _gauges.items()},
+        }
+    for name, collector in _collectors.items():
+        data[name] = collector()
+    return data
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
@@ -0,0 +1,156 @@
+# app/core/qr.py
+
+import base64
+import datetime
+import hashlib
+import hmac
+import struct
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core import config, metrics
+from app.core.security import SECRET_KEY
+
+# -----------------------------------------------------------
+# QR 코드용 서명 토큰 (상태 없음)
+#
+# 토큰 = base64url( version(1) | kind(1) | id 16바이트 x N | 만료 unix 초(4) | HMAC-SHA256 앞 16바이트 )
+# 서명과 만료만으로 검증하므로 위조/만료 토큰은 DB 조회 없이 거절됩니다.
+#
+# 체크인 명단(roster)에는 참가자별 서명 부분만 내려줍니다.
+# 호스트 기기는 스캔한 토큰의 마지막 16바이트를 명단의 signature 와 비교하여
+# 키 없이도 현장에서 검증할 수 있습니다.
+# -----------------------------------------------------------
+
+VERSION = 1
+KIND_PARTICIPATION = b"P"
+KIND_ITEM = b"I"
+ID_COUNTS = {KIND_PARTICIPATION: 2, KIND_ITEM: 1}  # (party_id, user_id) / (item_id,)
+
+SIGNATURE_BYTES = 16
+_HEADER = struct.Struct(">Bc")
+_EXPIRY = struct.Struct(">I")
+
+# JWT 와 같은 비밀 키에서 용도별 키를 따로 파생합니다.
+_KEY = hmac.new(SECRET_KEY.encode(), b"otgil-qr-token", hashlib.sha256).digest()
+
+
+class QRTokenError(ValueError):
+    """reason: malformed / bad_signature / expired / wrong_kind / wrong_party"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class QRToken:
+    kind: bytes
+    ids: tuple[str, ...]
+    expires_at: int
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(body: bytes) -> bytes:
+    return hmac.new(_KEY, body, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+
+def sign(kind: bytes, ids: tuple[str, ...], expires_at: int) -> str:
+    if len(ids) != ID_COUNTS[kind]:
+        raise ValueError(f"kind {kind!r} 토큰에는 id 가 {ID_COUNTS[kind]}개 필요합니다.")
+    body = _HEADER.pack(VERSION, kind) + b"".join(uuid.UUID(value).bytes for value in ids) + _EXPIRY.pack(expires_at)
+    return _b64encode(body + _sign(body))
+
+
+def signature_of(token: str) -> str:
+    """토큰의 서명 부분 (체크인 명단에 내려주는 값)"""
+    return _b64encode(_b64decode(token)[-SIGNATURE_BYTES:])
+
+
+def _reject(reason: str):
+    metrics.incr("qr_rejected", reason)
+    raise QRTokenError(reason)
+
+
+def verify(token: str, kind: bytes, now: Optional[float] = None) -> QRToken:
+    """서명/만료를 검사하고 토큰 내용을 반환합니다. 실패 시 QRTokenError"""
+    try:
+        raw = _b64decode(token.strip())
+    except (ValueError, TypeError):
+        _reject("malformed")
+    if len(raw) < _HEADER.size + _EXPIRY.size + SIGNATURE_BYTES:
+        _reject("malformed")
+
+    body, signature = raw[:-SIGNATURE_BYTES], raw[-SIGNATURE_BYTES:]
+    if not hmac.compare_digest(signature, _sign(body)):
+        _reject("bad_signature")
+
+    version, token_kind = _HEADER.unpack_from(body)
+    if version != VERSION or token_kind not in ID_COUNTS:
+        _reject("malformed")
+    if token_kind != kind:
+        _reject("wrong_kind")
+    count = ID_COUNTS[token_kind]
+    if len(body) != _HEADER.size + 16 * count + _EXPIRY.size:
+        _reject("malformed")
+
+    (expires_at,) = _EXPIRY.unpack_from(body, len(body) - _EXPIRY.size)
+    if expires_at < (time.time() if now is None else now):
+        _reject("expired")
+
+    ids = tuple(
+        str(uuid.UUID(bytes=body[_HEADER.size + 16 * i:_HEADER.size + 16 * (i + 1)]))
+        for i in range(count)
+    )
+    metrics.incr("qr_verified", token_kind.decode())
+    return QRToken(kind=token_kind, ids=ids, expires_at=expires_at)
+
+
+# --- 파티 입장권 (참가자 QR) ---
+
+def ticket_expires_at(party_date: datetime.date) -> int:
+    """파티 날짜가 끝난 뒤 QR_TICKET_GRACE_HOURS 까지 유효 (같은 참가자에게는 항상 같은 토큰)"""
+    end = datetime.datetime.combine(party_date + datetime.timedelta(days=1), datetime.time())
+    end += datetime.timedelta(hours=config.QR_TICKET_GRACE_HOURS)
+    return int(end.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+
+def participation_token(party_id: str, user_id: str, party_date: datetime.date) -> str:
+    return sign(KIND_PARTICIPATION, (party_id, user_id), ticket_expires_at(party_date))
+
+
+def verify_participation(token: str, party_id: str) -> str:
+    """입장권을 검증하고 user_id 를 반환합니다. 다른 파티의 입장권이면 wrong_party"""
+    ticket_party_id, user_id = verify(token, KIND_PARTICIPATION).ids
+    try:
+        party_id = str(uuid.UUID(party_id))
+    except ValueError:
+        _reject("wrong_party")
+    if ticket_party_id != party_id:
+        _reject("wrong_party")
+    return user_id
+
+
+# --- 의류 태그 (아이템 QR) ---
+
+def item_token_expires_at(now: Optional[float] = None) -> int:
+    return int((time.time() if now is None else now) + config.QR_ITEM_TOKEN_DAYS * 86400)
+
+
+def item_token(item_id: str, expires_at: Optional[int] = None) -> str:
+    return sign(KIND_ITEM, (item_id,), expires_at if expires_at is not None else item_token_expires_at())
+
+
+def verify_item(token: str) -> str:
+    """의류 태그 토큰을 검증하고 item_id 를 반환합니다."""
+    return verify(token, KIND_ITEM).ids[0]
+
@@ -0,0 +1,20 @@
+# app/core/responses.py
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+# -----------------------------------------------------------
+# orjson JSON 응답 (FAST_JSON 경로, default_response_class)
+#
+# fastapi.responses.ORJSONResponse 는 더 이상 권장되지 않으므로(deprecated) 같은 동작을 여기 둡니다.
+# datetime / Enum / dict 의 문자열이 아닌 키는 orjson 이 바로 인코딩합니다.
+# -----------------------------------------------------------
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,8 +1,17 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from fastapi.encoders import jsonable_encoder
 import datetime
+import uuid
 
-from app.models import User, ClothingItem, Party, PartyStatusEnum, PartyParticipation, Credit, CreditTypeEnum, PartySubmissionStatusEnum, PartyParticipantStatusEnum
+from app.core import config, jobs
+from app.crud import job as crud_job
+
+from app.crud import impact as crud_impact
+from app.crud import item as crud_item
+from app.crud import matching as crud_matching
+from app.crud import party as crud_party
+from app.models import User, ClothingItem, Party, PartyStatusEnum, PartyParticipation, Credit, CreditTypeEnum, PartySubmissionStatusEnum, PartyParticipantStatusEnum, StatRollup
 
 def get_overall_stats(db: Session) -> dict:
     """
@@ -16,11 +25,8 @@ def get_overall_stats(db: Session) -> dict:
     # 'total_events'를 전체 파티 수로 가정
     total_events = db.query(func.count(Party.id)).scalar()
     
-    # 'total_exchanges'를 완료된 파티 수로 가정 (또는 실제 교환된 아이템 수 등으로 정의 가능)
-    # 여기서는 완료된 파티 수로 계산합니다.
-    total_exchanges = db.query(func.count(Party.id))\
-        .filter(Party.status == PartyStatusEnum.COMPLETED)\
-        .scalar()
+    # 'total_exchanges' 는 파티에서 실제 교환된 아이템 수 (파티별로 저장된 임팩트의 합)
+    total_exchanges = db.query(func.sum(Party.impact_items_exchanged)).scalar()
         
     # AdminOverallStats 스키마 형태에 맞춰 딕셔너리 반환
     stats = {
@@ -33,28 +39,42 @@ def get_overall_stats(db: Session) -> dict:
 
 def get_group_performance(db: Session) -> list:
     """
-    (예시) 그룹별 성과 통계
+    그룹(파티 개최 지역)별 성과 통계
+    - users: 참가자 수 (중복 제외)
+    - items_listed: 해당 지역 파티에 출품된 아이템 수
+    - exchanges: 교환된 아이템 수 (파티별 저장된 임팩트의 합)
+    지역별 GROUP BY 를 따로 실행해 조인으로 행 수가 부풀지 않게 합니다.
     """
-    # 예시: 파티 개최 지역별 통계
-    # location별로 파티 수, 참가자 수 등을 집계
-    results = db.query(
-        Party.location,
-        func.count(Party.id).label('party_count'),
-        func.count(PartyParticipation.user_id).label('participant_count')
-    ).outerjoin(PartyParticipation, Party.id == PartyParticipation.party_id)\
-     .group_by(Party.location).all()
-    
-    performance_data = []
-    for loc, party_cnt, part_cnt in results:
-        if loc:
-            performance_data.append({
-                "group_name": loc, # 지역명을 그룹명으로 사용
-                "users": part_cnt, # 해당 지역 파티 참가자 수 합계
-                "items_listed": party_cnt * 10, # (예시) 파티당 평균 10벌 가정
-                "exchanges": party_cnt * 5 # (예시) 파티당 평균 5벌 교환 가정
-            })
-            
-    return performance_data
+    exchanges = dict(
+        db.query(Party.location, func.coalesce(func.sum(Party.impact_items_exchanged), 0))
+        .filter(Party.location.isnot(None))
+        .group_by(Party.location)
+        .all()
+    )
+    users = dict(
+        db.query(Party.location, func.count(func.distinct(PartyParticipation.user_id)))
+        .join(PartyParticipation, Party.id == PartyParticipation.party_id)
+        .filter(Party.location.isnot(None))
+        .group_by(Party.location)
+        .all()
+    )
+    items_listed = dict(
+        db.query(Party.location, func.count(ClothingItem.id))
+        .join(ClothingItem, ClothingItem.submitted_party_id == Party.id)
+        .filter(Party.location.isnot(None))
+        .group_by(Party.location)
+        .all()
+    )
+    return [
+        {
+            "group_name": location,
+            "users": users.get(location, 0),
+            "items_listed": items_listed.get(location, 0),
+            "exchanges": exchange_count,
+        }
+        for location, exchange_count in exchanges.items()
+        if location
+    ]
 
 def get_daily_activity(db: Session) -> list:
     """
@@ -89,28 +109,123 @@ def get_category_distribution(db: Session) -> list:
     
     return [{"category": cat, "count": cnt} for cat, cnt in results]
 
+# --- 통계 집계 (stat_rollups) ---
+# 위 통계들은 테이블 전체를 훑으므로 대시보드를 열 때마다 계산하지 않고 저장된 집계를 보여줍니다.
+# 집계가 ROLLUP_MAX_AGE_SECONDS 보다 오래되면 일단 그대로 반환하고 rollup_refresh 작업을 넣습니다.
+
+ROLLUPS = {
+    "overall_stats": get_overall_stats,
+    "group_performance": get_group_performance,
+    "daily_activity": get_daily_activity,
+    "category_distribution": get_category_distribution,
+}
+
+def _save_rollup(db: Session, name: str) -> object:
+    payload = jsonable_encoder(ROLLUPS[name](db))
+    db.merge(StatRollup(name=name, payload=payload, refreshed_at=datetime.datetime.utcnow()))
+    return payload
+
+def get_rollup(db: Session, name: str):
+    """저장된 집계를 반환합니다. 없으면 바로 계산해 저장하고, 오래되었으면 갱신 작업을 넣습니다."""
+    row = db.get(StatRollup, name)
+    if row is None:
+        payload = _save_rollup(db, name)
+        db.commit()
+        return payload
+    age = (datetime.datetime.utcnow() - row.refreshed_at).total_seconds()
+    if age > config.ROLLUP_MAX_AGE_SECONDS:
+        if crud_job.enqueue(db, "rollup_refresh", priority=200, dedupe_key="rollup_refresh"):
+            db.commit()
+    return row.payload
+
+@jobs.handler("rollup_refresh", release_key=True)
+def refresh_rollups(db: Session, payload: dict) -> None:
+    for name in payload.get("names") or ROLLUPS:
+        _save_rollup(db, name)
+
 # --- 추가된 관리자 기능 ---
 
-def get_pending_party_items(db: Session) -> list[ClothingItem]:
-    """파티 출품 승인 대기 중인 아이템 목록 조회"""
-    return db.query(ClothingItem)\
-        .filter(ClothingItem.party_submission_status == PartySubmissionStatusEnum.PENDING)\
-        .all()
+def get_pending_party_items(db: Session, party_id: str | None = None, cursor: str | None = None, limit: int = 100,
+                            tags: str = "full") -> dict:
+    """
+    파티 출품 승인 대기 중인 아이템 목록 (id 순 keyset 페이지네이션, 태그는 한 번의 outer join)
+    party_id 를 주면 해당 파티 출품분만 조회합니다. tags 는 crud_item.TAG_FIELD_SETS 참고
+    """
+    query = crud_item.item_rows_query(db, tags)\
+        .filter(ClothingItem.party_submission_status == PartySubmissionStatusEnum.PENDING)
+    if party_id:
+        query = query.filter(ClothingItem.submitted_party_id == party_id)
+    if cursor:
+        query = query.filter(ClothingItem.id > cursor)
+    rows = query.order_by(ClothingItem.id).limit(limit + 1).all()
+    items = [crud_item.item_row_to_dict(row, tags) for row in rows[:limit]]
+    return {"items": items, "next_cursor": items[-1]["id"] if len(rows) > limit else None}
+
+def _normalize_id(value: str) -> str | None:
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return None
+
+def _moderation_result(requested: list, current: dict, changed: dict) -> dict:
+    """요청 순서대로 id 별 결과(updated / unchanged / not_found)"""
+    results = []
+    for target_id, normalized, status in requested:
+        if normalized not in current:
+            outcome = "not_found"
+        elif normalized in changed:
+            outcome = "updated"
+        else:
+            outcome = "unchanged"
+        results.append({"id": target_id, "status": status.value, "outcome": outcome})
+    return {"updated": len(changed), "results": results}
+
+def bulk_update_item_submission_status(db: Session, moderations: list[tuple[str, PartySubmissionStatusEnum]]) -> dict:
+    """
+    여러 아이템의 출품 상태를 한 번에 변경합니다.
+    현재 상태 조회 1회 + (현재 상태, 목표 상태) 묶음별 UPDATE 1문장이며, 파티 임팩트도 파티당 UPDATE 한 번으로 반영합니다.
+    같은 아이템이 여러 번 오면 마지막 상태를 적용합니다.
+    반환: {"updated": n, "results": [{"id", "status", "outcome"}]} (요청 순서)
+    """
+    requested = [(item_id, _normalize_id(item_id), status) for item_id, status in moderations]
+    targets = {normalized: status for _, normalized, status in requested if normalized}
+    current = {
+        row.id: row for row in db.query(
+            ClothingItem.id, ClothingItem.party_submission_status, ClothingItem.submitted_party_id, ClothingItem.category,
+        ).filter(ClothingItem.id.in_(list(targets))).all()
+    } if targets else {}
+
+    pending = {item_id: status for item_id, status in targets.items()
+               if item_id in current and current[item_id].party_submission_status != status}
+    transitions: dict = {}
+    for item_id, status in pending.items():
+        transitions.setdefault((current[item_id].party_submission_status, status), []).append(item_id)
+
+    changed = {}
+    for (before, status), item_ids in transitions.items():
+        # 조회한 상태 그대로인 행만 바뀌므로(compare-and-set), 그 사이 다른 요청이 바꾼 행의 임팩트는 두 번 반영되지 않습니다.
+        changed.update((item_id, status) for item_id in crud_item.set_submission_status(db, item_ids, before, status))
+    crud_impact.apply_changes(db, [
+        (crud_impact.impact_key(current[item_id]), crud_impact.impact_key(current[item_id], status))
+        for item_id, status in changed.items()
+    ])
+    crud_matching.touch(db, *{(None, current[item_id].submitted_party_id) for item_id in changed})
+    db.commit()
+    for item_id in changed:
+        crud_item.item_detail_cache.discard(item_id)
+
+    return _moderation_result(requested, current, changed)
 
 def update_item_submission_status(db: Session, item_id: str, status: str) -> ClothingItem | None:
     """아이템 파티 출품 상태 변경 (APPROVED / REJECTED)"""
     item = db.query(ClothingItem).filter(ClothingItem.id == item_id).first()
     if not item:
         return None
-    
     try:
-        status_enum = PartySubmissionStatusEnum(status)
-        item.party_submission_status = status_enum
-        db.commit()
-        db.refresh(item)
-        return item
+        PartySubmissionStatusEnum(status)
     except ValueError:
         return None
+    return crud_item.update_item_submission_status(db, item, status)
 
 def update_party_status(db: Session, party_id: str, status: str) -> Party | None:
     """파티 상태 변경 (UPCOMING / REJECTED 등)"""
@@ -120,6 +235,8 @@ def update_party_status(db: Session, party_id: str, status: str) -> Party | None
     
     try:
         status_enum = PartyStatusEnum(status)
+        if status_enum == PartyStatusEnum.COMPLETED and party.status != PartyStatusEnum.COMPLETED:
+            crud_party.enqueue_post_party_jobs(db, party.id)
         party.status = status_enum
         db.commit()
         db.refresh(party)
@@ -151,6 +268,38 @@ def update_participant_status(db: Session, party_id: str, user_id: str, status:
         participant.status = status_enum
         db.commit()
         db.refresh(participant)
+        crud_party.publish_participant(party_id, user_id, participant.status)
         return participant
     except ValueError:
-        return None
\ No newline at end of file
+        return None
+
+
+def bulk_update_participant_status(db: Session, party_id: str, moderations: list[tuple[str, PartyParticipantStatusEnum]]) -> dict:
+    """
+    한 파티의 여러 참가자 상태를 한 번에 변경합니다. (현재 상태 조회 1회 + (현재 상태, 목표 상태) 묶음별 UPDATE 1문장)
+    반환 형식은 bulk_update_item_submission_status 와 같습니다.
+    """
+    requested = [(user_id, _normalize_id(user_id), status) for user_id, status in moderations]
+    targets = {normalized: status for _, normalized, status in requested if normalized}
+    current = dict(
+        db.query(PartyParticipation.user_id, PartyParticipation.status)
+        .filter(PartyParticipation.party_id == party_id, PartyParticipation.user_id.in_(list(targets)))
+        .all()
+    ) if targets else {}
+
+    transitions: dict = {}
+    for user_id, status in targets.items():
+        if user_id in current and current[user_id] != status:
+            transitions.setdefault((current[user_id], status), []).append(user_id)
+
+    changed = {}
+    for (before, status), user_ids in transitions.items():
+        # 조회한 상태 그대로인 행만 바뀌므로(compare-and-set), 그 사이 다른 요청이 바꾼 참가자는 알림/결과에서 빠집니다.
+        changed.update((user_id, status) for user_id in crud_party.set_participant_status(db, party_id, user_ids, before, status))
+    if changed:
+        crud_matching.touch_members(db, [party_id])
+    db.commit()
+    for user_id, status in changed.items():
+        crud_party.publish_participant(party_id, user_id, status)
+
+    return _moderation_result(requested, current, changed)
@@ -1,12 +1,41 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from sqlalchemy import func, and_, select
+from typing import Iterator, List, Optional
 import datetime
-import uuid
+import gzip
+import json
+import os
 from fastapi import HTTPException, status
 
-from app.models import Credit, User, Credit as CreditModel, CreditTypeEnum as ModelCreditTypeEnum
+from app.models import Credit, User, Credit as CreditModel, CreditTypeEnum as ModelCreditTypeEnum, CreditSnapshot, CreditArchive
 from app.schemas import EarnRequest
+from app.core import config, jobs
+from app.core.ids import new_id
+from app.crud.user import _insert_ignore
+
+# --------------------------------------------------------------------------
+# 크레딧 원장
+#
+# credits 는 추가만 하는 원장입니다. 기록을 취소할 때는 지우지 않고 반대 금액의 기록(reverses_id)을 추가합니다.
+# 월이 끝나면 사용자별 월말 잔액(credit_snapshots)을 저장하고, 잔액/명세 조회는
+# "가장 최근 스냅샷 + 그 이후 기록" 만 읽습니다.
+# CREDIT_HOT_MONTHS 보다 오래된 달은 압축 파일(gzip NDJSON)로 옮기고 테이블에서 지웁니다.
+# 스냅샷/보관은 credit_ledger 주기 작업이 처리합니다.
+# --------------------------------------------------------------------------
+
+# 월말 직전에 시작해 늦게 commit 된 기록이 스냅샷에서 빠지지 않도록, 달이 끝나고 이 시간이 지난 뒤 스냅샷을 만듭니다.
+SNAPSHOT_GRACE = datetime.timedelta(hours=1)
+SNAPSHOT_BATCH_SIZE = 1000
+ARCHIVE_FIELDS = ("id", "date", "activity_name", "type", "amount", "user_id", "reverses_id")
+
+
+def month_start(value: datetime.datetime) -> datetime.datetime:
+    return datetime.datetime(value.year, value.month, 1)
+
+
+def next_month(start: datetime.datetime) -> datetime.datetime:
+    return datetime.datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
 
 def earn_credit_to_user(db: Session, req: EarnRequest) -> CreditModel:
 
@@ -24,9 +53,9 @@ def earn_credit_to_user(db: Session, req: EarnRequest) -> CreditModel:
     except Exception:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid credit type")
     
-    # id는 128비트의 무작위 고유값
+    # id는 시간 순서 UUID (UUIDv7)
     credit_obj = CreditModel(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         date=datetime.datetime.utcnow(),
         activity_name=req.activity_name,
         type=credit_type,
@@ -36,65 +65,221 @@ def earn_credit_to_user(db: Session, req: EarnRequest) -> CreditModel:
     
     return credit_obj
 
-def get_user_credit_balance(db: Session, user_id: str) -> int:
-    """특정 사용자의 크레딧 총 잔액을 계산합니다."""
-    # 크래딧 소유 user id가 현재 유저 id와 일치하는 것만 필터링
-    # .scalar()를 사용하여 단일 값(총합) 반환
-    # .scalar() 가 없으면 query 객체로 반환 됨
-    # .first()는 튜플형태로 반환됨
-    # .all()는 튜플이 들어간 리스트 형태로 반환됨
-    total_balance = db.query(func.sum(Credit.amount))\
-        .filter(Credit.user_id == user_id)\
-        .scalar()
-    
-    # 필터링에 부합하는 크레딧이 없으면 sum 함수는 None을 반환할 수 있음
-    # 함수 리턴 타입이 int이므로 None 방지
-    # 잔액이 None인 경우 0 반환
-    return total_balance or 0
+def _latest_snapshot(db: Session, user_id: str, at: Optional[datetime.datetime]) -> tuple[Optional[datetime.datetime], int]:
+    """at 이전(포함)의 가장 최근 월말 스냅샷 (period_end, balance). 없으면 (None, 0)"""
+    query = db.query(CreditSnapshot.period_end, CreditSnapshot.balance).filter(CreditSnapshot.user_id == user_id)
+    if at is not None:
+        query = query.filter(CreditSnapshot.period_end <= at)
+    row = query.order_by(CreditSnapshot.period_end.desc()).first()
+    return (row.period_end, row.balance) if row else (None, 0)
+
+
+def get_user_credit_balance(db: Session, user_id: str, at: Optional[datetime.datetime] = None) -> int:
+    """
+    at 시점(기본: 현재)의 크레딧 잔액 = 가장 최근 월말 스냅샷 + 그 이후 기록의 합.
+    (ix_credits_user_id_date 로 스냅샷 이후 구간만 읽음)
+    """
+    period_end, balance = _latest_snapshot(db, user_id, at)
+    query = db.query(func.sum(Credit.amount)).filter(Credit.user_id == user_id)
+    if period_end is not None:
+        query = query.filter(Credit.date >= period_end)
+    if at is not None:
+        query = query.filter(Credit.date < at)
+    balance += query.scalar() or 0
 
+    # at 이 보관된 달의 중간이면 그 달 기록은 테이블에 없으므로 보관 파일에서 더합니다.
+    # (스냅샷은 모든 지난 달에 대해 만들어진 뒤에 보관하므로, 그 이전 보관 달에는 읽을 기록이 없음)
+    if at is not None and at != month_start(at):
+        archive = db.get(CreditArchive, month_start(at))
+        if archive is not None:
+            balance += sum(
+                entry["amount"] for entry in read_archive(archive.path)
+                if entry["user_id"] == user_id and datetime.datetime.fromisoformat(entry["date"]) < at
+            )
+    return balance
 
-def get_credits_by_user(db: Session, user_id: str) -> List[Credit]:
-    """특정 사용자의 모든 크레딧 변동 내역을 조회합니다 (최신순)."""
+
+def get_credits_by_user(
+    db: Session, user_id: str, limit: Optional[int] = None, before: Optional[datetime.datetime] = None
+) -> List[Credit]:
+    """특정 사용자의 크레딧 변동 내역을 조회합니다 (최신순, before 이전만, 최대 limit 개)."""
     # 크래딧 소유 user id가 현재 유저 id와 일치하는 것만 필터링 후 내림차순 정렬
-    return db.query(Credit)\
-        .filter(Credit.user_id == user_id)\
-        .order_by(Credit.date.desc())\
-        .all()
+    query = db.query(Credit).filter(Credit.user_id == user_id)
+    if before is not None:
+        query = query.filter(Credit.date < before)
+    query = query.order_by(Credit.date.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
 
-def delete_credit_record(db: Session, credit_id: str, user_id: str ) -> bool:
+def get_monthly_statement(db: Session, user_id: str, month: datetime.datetime) -> dict:
     """
-    특정 ID와 사용자 ID가 일치하는 크레딧 기록을 데이터베이스에서 삭제합니다.
+    한 달의 명세: 기초 잔액(월초 시점 잔액) + 그 달의 기록 + 기말 잔액.
+    보관된 달이면 기록을 보관 파일에서 읽습니다.
+    """
+    start = month_start(month)
+    end = next_month(start)
+    opening = get_user_credit_balance(db, user_id, at=start)
+    archive = db.get(CreditArchive, start)
+    if archive is not None:
+        entries = [entry for entry in read_archive(archive.path) if entry["user_id"] == user_id]
+        amounts = [entry["amount"] for entry in entries]
+    else:
+        entries = db.query(Credit)\
+            .filter(Credit.user_id == user_id, Credit.date >= start, Credit.date < end)\
+            .order_by(Credit.date)\
+            .all()
+        amounts = [entry.amount for entry in entries]
+    return {
+        "user_id": user_id,
+        "period_start": start,
+        "period_end": end,
+        "opening_balance": opening,
+        "closing_balance": opening + sum(amounts),
+        "archived": archive is not None,
+        "entries": entries,
+    }
 
-    Args:
-        db: SQLAlchemy 데이터베이스 세션
-        credit_id: 삭제할 크레딧 기록의 고유 ID
-        user_id: 해당 크레딧을 소유한 사용자의 ID
 
-    Returns:
-        삭제 성공 여부 (True/False)
+def reverse_credit_record(db: Session, credit_id: str, user_id: str) -> Credit:
+    """
+    크레딧 기록을 취소합니다. 원래 기록은 그대로 두고 반대 금액의 보정 기록을 추가합니다.
+    (commit 은 호출한 쪽. 동시에 두 번 취소하면 ix_credits_reverses_id 유니크 인덱스에 걸림)
     """
-    
-    # 1. 삭제할 크레딧 객체 조회 (보안: user_id가 일치하는지 확인)
     credit: Optional[Credit] = db.query(Credit)\
                                  .filter(Credit.id == credit_id, Credit.user_id == user_id)\
                                  .first()
-    
     if not credit:
-        # 기록이 없거나, 다른 사용자의 기록인 경우
+        # 기록이 없거나, 다른 사용자의 기록이거나, 이미 보관된 기록인 경우
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, 
+            status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ID '{credit_id}'에 해당하는 크레딧 기록을 찾을 수 없거나 접근 권한이 없습니다."
         )
+    if credit.reverses_id is not None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="취소 기록은 다시 취소할 수 없습니다.")
+    if db.query(Credit.id).filter(Credit.reverses_id == credit.id).first():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 취소된 크레딧 기록입니다.")
 
-    # 2. 객체 삭제
-    try:
-        db.delete(credit)
-        
-        # NOTE: 이 함수를 호출한 외부 트랜잭션에서 db.commit()이 실행되어야 최종 반영됩니다.
-        db.flush() 
-        
-    except Exception as e:
-        # 외부에서 롤백을 처리할 수 있도록 예외를 다시 발생시킵니다.
-        raise RuntimeError(f"크레딧 삭제 중 DB 오류 발생: {e}")
-
-    return True
\ No newline at end of file
+    reversal = CreditModel(
+        id=new_id(),
+        date=datetime.datetime.utcnow(),
+        activity_name=f"취소: {credit.activity_name}",
+        type=credit.type,
+        amount=-credit.amount,
+        user_id=credit.user_id,
+        reverses_id=credit.id,
+    )
+    db.add(reversal)
+    db.flush()
+    return reversal
+
+
+# --------------------------------------------------------------------------
+# 월말 스냅샷 / 보관 (credit_ledger 주기 작업)
+# --------------------------------------------------------------------------
+
+def build_snapshots(db: Session, period_start: datetime.datetime) -> int:
+    """
+    period_start 달의 월말 스냅샷을 만듭니다. (그 달에 기록이 있는 사용자만, 이미 있으면 건너뜀)
+    잔액 = 사용자의 직전 스냅샷 + 그 달 기록의 합 이므로, 달 순서대로 만들어야 합니다.
+    """
+    period_end = next_month(period_start)
+    deltas = db.query(Credit.user_id, func.sum(Credit.amount))\
+        .filter(Credit.date >= period_start, Credit.date < period_end)\
+        .group_by(Credit.user_id)\
+        .all()
+    created = 0
+    for start in range(0, len(deltas), SNAPSHOT_BATCH_SIZE):
+        batch = dict(deltas[start:start + SNAPSHOT_BATCH_SIZE])
+        latest = select(CreditSnapshot.user_id, func.max(CreditSnapshot.period_end).label("period_end"))\
+            .where(CreditSnapshot.user_id.in_(list(batch)), CreditSnapshot.period_end <= period_start)\
+            .group_by(CreditSnapshot.user_id)\
+            .subquery()
+        previous = dict(
+            db.query(CreditSnapshot.user_id, CreditSnapshot.balance)
+            .join(latest, and_(CreditSnapshot.user_id == latest.c.user_id, CreditSnapshot.period_end == latest.c.period_end))
+            .all()
+        )
+        for user_id, delta in batch.items():
+            created += _insert_ignore(db, CreditSnapshot.__table__, dict(
+                user_id=user_id, period_end=period_end, balance=previous.get(user_id, 0) + (delta or 0),
+            ))
+    return created
+
+
+def archive_path(period_start: datetime.datetime) -> str:
+    return os.path.join(config.CREDIT_ARCHIVE_DIR, f"credits-{period_start:%Y-%m}.jsonl.gz")
+
+
+def read_archive(path: str) -> Iterator[dict]:
+    """보관 파일의 기록 (date 는 ISO 문자열)"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def archive_month(db: Session, period_start: datetime.datetime) -> Optional[CreditArchive]:
+    """
+    period_start 달의 기록을 압축 파일로 옮기고 테이블에서 지웁니다. (commit 은 호출한 쪽)
+    파일은 임시 파일 -> rename 으로 쓰고, 삭제가 롤백되면 다음 실행에서 같은 파일을 다시 씁니다.
+    """
+    if db.get(CreditArchive, period_start) is not None:
+        return None
+    period_end = next_month(period_start)
+    in_month = and_(Credit.date >= period_start, Credit.date < period_end)
+    if db.query(Credit.id).filter(in_month).first() is None:
+        return None
+    columns = [getattr(Credit, field) for field in ARCHIVE_FIELDS]
+
+    path = archive_path(period_start)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    entries = total = 0
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in db.query(*columns).filter(in_month).order_by(Credit.date).yield_per(SNAPSHOT_BATCH_SIZE):
+            entry = dict(zip(ARCHIVE_FIELDS, row))
+            entry["date"] = entry["date"].isoformat()
+            entry["type"] = entry["type"].value
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            entries += 1
+            total += entry["amount"]
+    os.replace(tmp_path, path)
+
+    db.query(Credit).filter(in_month).delete(synchronize_session=False)
+    archive = CreditArchive(period_start=period_start, path=path, entries=entries, total_amount=total)
+    db.add(archive)
+    return archive
+
+
+def _first_unsnapshotted_month(db: Session) -> Optional[datetime.datetime]:
+    last = db.query(func.max(CreditSnapshot.period_end)).scalar()
+    if last is not None:
+        return last
+    first = db.query(func.min(Credit.date)).scalar()
+    return month_start(first) if first is not None else None
+
+
+@jobs.handler("credit_ledger", visibility_timeout=600)
+def maintain_ledger(db: Session, payload: dict) -> None:
+    """끝난 달의 월말 스냅샷을 만들고, CREDIT_HOT_MONTHS 보다 오래된 달을 보관합니다."""
+    now = datetime.datetime.utcnow()
+    period = _first_unsnapshotted_month(db)
+    while period is not None and next_month(period) + SNAPSHOT_GRACE <= now:
+        build_snapshots(db, period)
+        period = next_month(period)
+
+    if config.CREDIT_HOT_MONTHS <= 0:
+        return
+    # 보관 대상: 스냅샷이 만들어진(위 반복에서 지난) 달 중 최근 CREDIT_HOT_MONTHS 개월 이전
+    hot_start = month_start(now)
+    for _ in range(config.CREDIT_HOT_MONTHS):
+        hot_start = month_start(hot_start - datetime.timedelta(days=1))
+    oldest = db.query(func.min(Credit.date)).filter(Credit.date < hot_start).scalar()
+    period = month_start(oldest) if oldest is not None else None
+    while period is not None and period < hot_start:
+        archive_month(db, period)
+        period = next_month(period)
+
+
+jobs.periodic("credit_ledger", 86400)
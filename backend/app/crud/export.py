@@ -0,0 +1,86 @@
+import datetime
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import ClothingItem, Credit, PartyParticipation, User
+
+# --------------------------------------------------------------------------
+# 관리자 내보내기용 행 조회
+#
+# 컬럼만 조회(프로젝션)하고 yield_per 로 EXPORT_BATCH_SIZE 행씩 DB 커서에서 가져오므로
+# 테이블 크기와 관계없이 메모리 사용량이 일정합니다. 인코딩은 app/core/export.py
+# --------------------------------------------------------------------------
+
+EXPORT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Dataset:
+    columns: tuple
+    # (db, **filters) -> 정렬까지 적용된 Query
+    query: Callable
+
+    @property
+    def column_names(self) -> list[str]:
+        return [column.key for column in self.columns]
+
+
+CREDIT_COLUMNS = (
+    Credit.id, Credit.date, Credit.user_id, Credit.activity_name, Credit.type, Credit.amount, Credit.reverses_id,
+)
+ITEM_COLUMNS = (
+    ClothingItem.id, ClothingItem.user_id, ClothingItem.user_nickname, ClothingItem.name, ClothingItem.category,
+    ClothingItem.size, ClothingItem.is_listed_for_exchange, ClothingItem.party_submission_status,
+    ClothingItem.submitted_party_id,
+)
+PARTICIPANT_COLUMNS = (
+    PartyParticipation.party_id, PartyParticipation.user_id, User.nickname, PartyParticipation.status,
+)
+
+
+def _credits_query(db: Session, since: Optional[datetime.datetime] = None,
+                   until: Optional[datetime.datetime] = None, **_):
+    """기간 필터는 ix_credits_date 범위"""
+    query = db.query(*CREDIT_COLUMNS)
+    if since is not None:
+        query = query.filter(Credit.date >= since)
+    if until is not None:
+        query = query.filter(Credit.date < until)
+    return query.order_by(Credit.date)
+
+
+def _items_query(db: Session, **_):
+    return db.query(*ITEM_COLUMNS).order_by(ClothingItem.id)
+
+
+def _participants_query(db: Session, party_id: Optional[str] = None, **_):
+    query = db.query(*PARTICIPANT_COLUMNS).outerjoin(User, User.id == PartyParticipation.user_id)
+    if party_id:
+        query = query.filter(PartyParticipation.party_id == party_id)
+    return query.order_by(PartyParticipation.party_id, PartyParticipation.user_id)
+
+
+DATASETS = {
+    "credits": Dataset(CREDIT_COLUMNS, _credits_query),
+    "items": Dataset(ITEM_COLUMNS, _items_query),
+    "participants": Dataset(PARTICIPANT_COLUMNS, _participants_query),
+}
+
+
+def iter_rows(dataset: str, **filters) -> Iterator[tuple]:
+    """
+    데이터셋의 행을 순서대로 내보냅니다.
+    StreamingResponse 가 응답을 보내는 동안 읽으므로 요청의 세션(get_db)이 아닌 자체 세션을 씁니다.
+    """
+    from app.database import SessionLocal, get_engine
+
+    get_engine()
+    db = SessionLocal()
+    try:
+        query = DATASETS[dataset].query(db, **filters)
+        for row in query.yield_per(EXPORT_BATCH_SIZE):
+            yield tuple(row)
+    finally:
+        db.close()
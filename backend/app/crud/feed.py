@@ -0,0 +1,113 @@
+from typing import List, Optional
+
+from sqlalchemy import insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.core import config
+from app.core.ids import new_id
+from app.models import Activity, FeedEntry, FeedVerbEnum, User, user_neighbors
+
+# --------------------------------------------------------------------------
+# 쓰기 (활동 기록 + fan-out)
+# --------------------------------------------------------------------------
+
+def record_activity(db: Session, actor_id: str, verb: FeedVerbEnum, object_id: str, summary: Optional[str] = None) -> str:
+    """
+    활동을 기록하고, 작성자의 이웃 수가 FEED_FANOUT_LIMIT 이하이면 이웃들의 타임라인에 id 를 복사합니다.
+    호출한 쪽의 트랜잭션 안에서 실행되며 commit 은 호출한 쪽에서 합니다.
+    """
+    follower_count = db.query(User.follower_count).filter(User.id == actor_id).scalar() or 0
+    fanned_out = follower_count <= config.FEED_FANOUT_LIMIT
+
+    activity_id = new_id()
+    db.add(Activity(
+        id=activity_id, actor_id=actor_id, verb=verb, object_id=object_id,
+        summary=summary, fanned_out=fanned_out,
+    ))
+    if fanned_out and follower_count:
+        # 이웃 목록을 파이썬으로 가져오지 않고 insert ... select 한 문장으로 복사합니다.
+        # (ix_user_neighbors_neighbor_id_user_id 범위 스캔)
+        followers = select(user_neighbors.c.user_id, literal(activity_id, FeedEntry.activity_id.type))\
+            .where(user_neighbors.c.neighbor_id == actor_id)
+        db.execute(insert(FeedEntry).from_select(["owner_id", "activity_id"], followers))
+    return activity_id
+
+
+def delete_activities(db: Session, object_id: str, actor_id: Optional[str] = None) -> None:
+    """원본(스토리/아이템/게시글/참가)이 삭제되면 활동도 지웁니다. 타임라인 행은 조회 시 조인에서 빠집니다."""
+    query = db.query(Activity).filter(Activity.object_id == object_id)
+    if actor_id is not None:
+        query = query.filter(Activity.actor_id == actor_id)
+    query.delete(synchronize_session=False)
+
+
+def remove_actor_entries(db: Session, owner_id: str, actor_id: str) -> None:
+    """이웃 삭제 시 owner 의 타임라인에 복사된 그 이웃의 활동을 지웁니다. (commit 은 호출한 쪽)"""
+    db.query(FeedEntry)\
+        .filter(
+            FeedEntry.owner_id == owner_id,
+            FeedEntry.activity_id.in_(select(Activity.id).where(Activity.actor_id == actor_id)),
+        )\
+        .delete(synchronize_session=False)
+
+
+# --------------------------------------------------------------------------
+# 조회 (Read)
+# --------------------------------------------------------------------------
+
+def _pushed_ids(db: Session, user_id: str, cursor: Optional[str], limit: int) -> List[str]:
+    """내 타임라인에 복사된 활동 id (PK (owner_id, activity_id) 역순 범위 스캔)"""
+    query = db.query(FeedEntry.activity_id).filter(FeedEntry.owner_id == user_id)
+    if cursor:
+        query = query.filter(FeedEntry.activity_id < cursor)
+    return [row[0] for row in query.order_by(FeedEntry.activity_id.desc()).limit(limit).all()]
+
+
+def _pulled_ids(db: Session, user_id: str, cursor: Optional[str], limit: int) -> List[str]:
+    """
+    타임라인에 복사되지 않은(fanned_out=False) 이웃 활동 id 를 직접 조회합니다.
+    작성 시점의 fan-out 여부로 고르므로, 이후 작성자의 이웃 수가 바뀌어도 활동이 사라지지 않습니다.
+    """
+    query = db.query(Activity.id)\
+        .join(user_neighbors, user_neighbors.c.neighbor_id == Activity.actor_id)\
+        .filter(user_neighbors.c.user_id == user_id, Activity.fanned_out.is_(False))
+    if cursor:
+        query = query.filter(Activity.id < cursor)
+    return [row[0] for row in query.order_by(Activity.id.desc()).limit(limit).all()]
+
+
+def get_feed(db: Session, user_id: str, cursor: Optional[str] = None, limit: int = 20) -> dict:
+    """
+    이웃 활동 피드 (최신순, 커서 = 이전 페이지 마지막 활동 id)
+    두 경로(push/pull)에서 각각 limit + 1 개씩 읽어 id 역순으로 합칩니다.
+    """
+    candidates = set(_pushed_ids(db, user_id, cursor, limit + 1))
+    candidates.update(_pulled_ids(db, user_id, cursor, limit + 1))
+    # UUID 문자열(소문자 hex)의 사전순 = 16바이트 값의 순서 = 생성 시각 순서
+    ordered = sorted(candidates, reverse=True)
+    page_ids = ordered[:limit]
+    has_more = len(ordered) > limit
+
+    rows = db.query(
+        Activity.id, Activity.actor_id, User.nickname, Activity.verb,
+        Activity.object_id, Activity.summary, Activity.created_at,
+    ).join(User, User.id == Activity.actor_id)\
+     .filter(Activity.id.in_(page_ids))\
+     .all() if page_ids else []
+    by_id = {row.id: row for row in rows}
+
+    items = [
+        {
+            "id": row.id,
+            "actor_id": row.actor_id,
+            "actor_nickname": row.nickname,
+            "verb": row.verb.value,
+            "object_id": row.object_id,
+            "summary": row.summary,
+            "created_at": row.created_at,
+        }
+        for row in (by_id.get(activity_id) for activity_id in page_ids)
+        if row is not None  # 삭제된 활동
+    ]
+    return {"items": items, "next_cursor": page_ids[-1] if has_more and page_ids else None}
+
@@ -0,0 +1,100 @@
+import datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import config, jobs
+from app.crud.user import _insert_ignore
+from app.models import IdempotencyKey
+
+# --------------------------------------------------------------------------
+# Idempotency-Key 저장소 (idempotency_keys 테이블)
+#
+# 키를 처음 받은 요청만 insert 에 성공해 실행하고, 같은 키의 다른 요청은
+# 저장된 응답을 재사용하거나(처리 완료) 409 를 받습니다(처리 중).
+# 처리하던 요청이 응답을 저장하지 못하고 죽으면 locked_until 이 지난 뒤 다음 요청이 이어받습니다.
+# 만료된 키는 idempotency_purge 주기 작업이 지웁니다.
+# --------------------------------------------------------------------------
+
+EXECUTE = "execute"        # 이 요청이 실행
+REPLAY = "replay"          # 저장된 응답 반환
+IN_PROGRESS = "in_progress"  # 같은 키의 요청이 처리 중
+MISMATCH = "mismatch"      # 같은 키로 다른 본문의 요청
+
+
+def begin(db: Session, key: bytes, fingerprint: bytes) -> tuple[str, Optional[IdempotencyKey]]:
+    """키를 선점합니다. (결과, 기존 행) 을 반환하며 결과가 EXECUTE 일 때만 요청을 실행합니다."""
+    for _ in range(2):
+        now = datetime.datetime.utcnow()
+        lock_until = now + datetime.timedelta(seconds=config.IDEMPOTENCY_LOCK_SECONDS)
+        inserted = _insert_ignore(db, IdempotencyKey.__table__, dict(
+            key=key, fingerprint=fingerprint, locked_until=lock_until,
+            expires_at=now + datetime.timedelta(hours=config.IDEMPOTENCY_TTL_HOURS),
+        ))
+        db.commit()
+        if inserted:
+            return EXECUTE, None
+
+        row = db.get(IdempotencyKey, key)
+        if row is None or row.expires_at <= now:
+            # 만료된 키 (아직 정리 전) -> 지우고 다시 선점
+            db.query(IdempotencyKey)\
+                .filter(IdempotencyKey.key == key, IdempotencyKey.expires_at <= now)\
+                .delete(synchronize_session=False)
+            db.commit()
+            db.expunge_all()
+            continue
+        if row.fingerprint != fingerprint:
+            return MISMATCH, row
+        if row.status_code is not None:
+            return REPLAY, row
+        if row.locked_until is not None and row.locked_until > now:
+            return IN_PROGRESS, row
+
+        # 잠금 만료: 처리하던 요청이 응답을 남기지 못함 -> 잠금 시각 조건을 건 UPDATE 로 하나만 이어받음
+        taken = db.query(IdempotencyKey)\
+            .filter(
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None),
+                IdempotencyKey.locked_until == row.locked_until,
+            )\
+            .update({IdempotencyKey.locked_until: lock_until}, synchronize_session=False)
+        db.commit()
+        return (EXECUTE, None) if taken else (IN_PROGRESS, row)
+    return IN_PROGRESS, None
+
+
+def complete(db: Session, key: bytes, status_code: int, content_type: Optional[str], body: bytes) -> None:
+    """실행 결과를 저장합니다. 이후 같은 키의 요청은 이 응답을 그대로 받습니다."""
+    db.query(IdempotencyKey)\
+        .filter(IdempotencyKey.key == key)\
+        .update({
+            IdempotencyKey.status_code: status_code,
+            IdempotencyKey.content_type: content_type,
+            IdempotencyKey.body: body,
+            IdempotencyKey.locked_until: None,
+        }, synchronize_session=False)
+    db.commit()
+
+
+def release(db: Session, key: bytes) -> None:
+    """실행이 실패(5xx/예외)하면 키를 풀어 재시도가 다시 실행되게 합니다."""
+    db.query(IdempotencyKey)\
+        .filter(IdempotencyKey.key == key, IdempotencyKey.status_code.is_(None))\
+        .delete(synchronize_session=False)
+    db.commit()
+
+
+def purge_expired(db: Session) -> int:
+    """만료된 키 삭제 (ix_idempotency_keys_expires_at 범위). commit 은 호출한 쪽"""
+    return db.query(IdempotencyKey)\
+        .filter(IdempotencyKey.expires_at < datetime.datetime.utcnow())\
+        .delete(synchronize_session=False)
+
+
+@jobs.handler("idempotency_purge")
+def run_idempotency_purge(db: Session, payload: dict) -> None:
+    purge_expired(db)
+
+
+jobs.periodic("idempotency_purge", 3600)
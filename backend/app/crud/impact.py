@@ -0,0 +1,133 @@
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import case, func, update
+from sqlalchemy.orm import Session
+
+from app.core import impact
+from app.models import ClothingItem, ClothingCategoryEnum, Party, PartySubmissionStatusEnum
+
+# --------------------------------------------------------------------------
+# 파티 임팩트 집계
+#
+# 교환 수 = 파티에 출품되어 승인(APPROVED)된 아이템 수, 물/CO2 = 카테고리별 계수의 합.
+# 결과는 parties.impact_* 컬럼에 저장해 두고(목록/통계는 컬럼만 읽음),
+# 출품 상태/카테고리가 바뀌면 같은 트랜잭션에서 차이만큼 더하고 뺍니다. (apply_change)
+# 아직 계산된 적 없는 파티(기존 데이터)는 그때 전체를 다시 계산합니다.
+# 파티 종료 시 party_impact 작업이 recompute 로 전체를 다시 맞춥니다.
+# --------------------------------------------------------------------------
+
+
+class ImpactKey(NamedTuple):
+    party_id: str
+    category: object
+
+
+def impact_key(item, status=None) -> Optional[ImpactKey]:
+    """
+    아이템(ORM 객체 또는 같은 이름의 컬럼을 가진 행)이 파티 임팩트에 들어가면 (파티, 카테고리), 아니면 None
+    status 를 주면 그 출품 상태였을 때를 기준으로 합니다.
+    """
+    status = status or item.party_submission_status
+    if item.submitted_party_id is None or status != PartySubmissionStatusEnum.APPROVED:
+        return None
+    return ImpactKey(item.submitted_party_id, item.category)
+
+
+def apply_changes(db: Session, changes: Iterable[tuple[Optional[ImpactKey], Optional[ImpactKey]]]) -> None:
+    """
+    아이템들의 변경 전/후 impact_key 로 파티 임팩트를 갱신합니다. (commit 은 호출한 쪽)
+    파티별로 차이를 모아 파티당 UPDATE 한 번으로 반영하며,
+    UPDATE 안에서 더하고 빼므로 동시에 여러 아이템이 바뀌어도 값이 어긋나지 않습니다.
+    아직 계산된 적 없는(impact_* 가 NULL 인) 파티는 차이가 아니라 전체를 다시 계산하므로,
+    아이템 변경을 세션에 반영한 뒤(UPDATE 실행 / 속성 변경 / delete 후)에 호출해야 합니다. (flush 는 여기서 합니다)
+    """
+    deltas: dict[str, list[int]] = {}
+    for before, after in changes:
+        if before == after:
+            continue
+        for key, sign in ((before, -1), (after, 1)):
+            if key is None:
+                continue
+            water, co2 = impact.coefficient(key.category)
+            delta = deltas.setdefault(key.party_id, [0, 0, 0])
+            delta[0] += sign
+            delta[1] += sign * water
+            delta[2] += sign * co2
+    deltas = {party_id: delta for party_id, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return
+
+    db.flush()
+    uncomputed = [row[0] for row in db.query(Party.id).filter(
+        Party.id.in_(list(deltas)), Party.impact_items_exchanged.is_(None),
+    ).all()]
+    recompute(db, uncomputed)
+    for party_id in uncomputed:
+        deltas.pop(party_id, None)
+
+    for party_id, (count, water, co2) in deltas.items():
+        # 그 사이 다른 요청이 NULL 로 되돌릴 일은 없지만, 부분 합이 저장되지 않도록 계산된 파티에만 더합니다.
+        db.query(Party)\
+            .filter(Party.id == party_id, Party.impact_items_exchanged.isnot(None))\
+            .update({
+                Party.impact_items_exchanged: Party.impact_items_exchanged + count,
+                Party.impact_water_saved: func.coalesce(Party.impact_water_saved, 0) + water,
+                Party.impact_co2_reduced: func.coalesce(Party.impact_co2_reduced, 0) + co2,
+            }, synchronize_session=False)
+
+
+def apply_change(db: Session, before: Optional[ImpactKey], after: Optional[ImpactKey]) -> None:
+    """아이템 하나의 변경 전/후 impact_key 로 파티 임팩트를 갱신합니다. (commit 은 호출한 쪽)"""
+    apply_changes(db, [(before, after)])
+
+
+def _coefficient_sum(index: int):
+    """카테고리별 계수(index 0: 물, 1: CO2)를 CASE 로 붙여 SUM 하는 식"""
+    return func.sum(case(
+        *[(ClothingItem.category == category, impact.coefficient(category)[index]) for category in ClothingCategoryEnum],
+        else_=impact.DEFAULT_COEFFICIENT[index],
+    ))
+
+
+def compute(db: Session, party_ids: Iterable[str]) -> dict[str, dict]:
+    """여러 파티의 임팩트를 GROUP BY 한 번으로 계산합니다. (출품이 없는 파티는 0)"""
+    party_ids = list(party_ids)
+    results = {party_id: impact.from_columns(0, 0, 0) for party_id in party_ids}
+    if not party_ids:
+        return results
+    rows = db.query(
+        ClothingItem.submitted_party_id,
+        func.count(ClothingItem.id),
+        _coefficient_sum(0),
+        _coefficient_sum(1),
+    ).filter(
+        ClothingItem.submitted_party_id.in_(party_ids),
+        ClothingItem.party_submission_status == PartySubmissionStatusEnum.APPROVED,
+    ).group_by(ClothingItem.submitted_party_id).all()
+    for party_id, items_exchanged, water_saved, co2_reduced in rows:
+        results[party_id] = impact.from_columns(items_exchanged, water_saved, co2_reduced)
+    return results
+
+
+def recompute(db: Session, party_ids: Iterable[str]) -> dict[str, dict]:
+    """임팩트를 다시 계산해 파티 컬럼에 저장합니다. (commit 은 호출한 쪽)"""
+    results = compute(db, party_ids)
+    if results:
+        db.execute(update(Party), [
+            {
+                "id": party_id,
+                "impact_items_exchanged": stats["items_exchanged"],
+                "impact_water_saved": stats["water_saved"],
+                "impact_co2_reduced": stats["co2_reduced"],
+            }
+            for party_id, stats in results.items()
+        ])
+    return results
+
+
+def recompute_all(db: Session, batch_size: int = 500) -> int:
+    """모든 파티의 임팩트를 batch_size 개씩 다시 계산합니다. (계수 변경 / 기존 데이터 채우기용)"""
+    party_ids = [row[0] for row in db.query(Party.id).order_by(Party.id).all()]
+    for start in range(0, len(party_ids), batch_size):
+        recompute(db, party_ids[start:start + batch_size])
+    return len(party_ids)
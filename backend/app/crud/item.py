@@ -1,28 +1,135 @@
-import uuid
-from sqlalchemy.orm import Session
-from typing import List
+from pydantic import ValidationError
+from sqlalchemy import insert, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
+from typing import Iterable, List
 
-from app.models import ClothingItem, PartySubmissionStatusEnum, GoodbyeTag, HelloTag
-from app.schemas import ClothingItemCreate, ClothingItemUpdate, GoodbyeTagCreate, HelloTagCreate
+from app.models import ClothingItem, ClothingCategoryEnum, PartySubmissionStatusEnum, GoodbyeTag, HelloTag, FeedVerbEnum
+from app.schemas import ClothingItemCreate, ClothingItemUpdate, GoodbyeTagCreate, HelloTagCreate, ClothingItemResponse
+from app.core import config, fields as fieldsets
+from app.core.cache import Cache, cached
+from app.core.ids import new_id
+from app.crud import feed as crud_feed
+from app.crud import impact as crud_impact
+from app.crud import matching as crud_matching
 
 def get_item(db: Session, item_id: str) -> ClothingItem | None:
     """ID로 단일 아이템을 조회합니다."""
     return db.query(ClothingItem).filter(ClothingItem.id == item_id).first()
 
+# 응답(ClothingItemResponse)에 1:1 태그가 포함되므로 목록 조회는 두 태그를 같은 쿼리에서 join 해 옵니다.
+# (옵션이 없으면 아이템마다 goodbye_tag / hello_tag lazy SELECT 가 2번씩 나감)
+TAG_LOAD_OPTIONS = (joinedload(ClothingItem.goodbye_tag), joinedload(ClothingItem.hello_tag))
+
 def get_items_for_exchange(db: Session, skip: int = 0, limit: int = 20) -> List[ClothingItem]:
-    """교환을 위해 등록된 아이템 목록을 조회합니다."""
+    """교환을 위해 등록된 아이템 목록을 조회합니다. (태그 포함 한 번의 쿼리)"""
     return db.query(ClothingItem)\
+        .options(*TAG_LOAD_OPTIONS)\
+        .filter(ClothingItem.is_listed_for_exchange == True)\
+        .offset(skip)\
+        .limit(limit)\
+        .all()
+
+# --- 빠른 직렬화 경로 (FAST_JSON) ---
+# ORM 객체를 만들지 않고 필요한 컬럼만 조회하여 ClothingItemResponse 와 같은 모양의 dict 로 반환합니다.
+
+ITEM_COLUMNS = (
+    ClothingItem.name, ClothingItem.description, ClothingItem.category, ClothingItem.size,
+    ClothingItem.image_url, ClothingItem.id, ClothingItem.user_id, ClothingItem.user_nickname,
+    ClothingItem.is_listed_for_exchange, ClothingItem.party_submission_status, ClothingItem.submitted_party_id,
+)
+GOODBYE_TAG_COLUMNS = (
+    GoodbyeTag.clothing_item_id, GoodbyeTag.met_when, GoodbyeTag.met_where, GoodbyeTag.why_got,
+    GoodbyeTag.worn_count, GoodbyeTag.why_let_go, GoodbyeTag.final_message,
+)
+HELLO_TAG_COLUMNS = (
+    HelloTag.clothing_item_id, HelloTag.received_from, HelloTag.received_at,
+    HelloTag.first_impression, HelloTag.hello_message,
+)
+
+# 목록에서 태그를 얼마나 가져올지 (tags 쿼리 파라미터)
+# - full: 전체 / summary: 긴 Text 컬럼(사연, 메시지) 제외 / none: 태그 join 자체를 생략
+# 긴 사연은 상세(/clothing/{id}) 에서만 가져오면 목록 한 페이지의 행 크기와 응답 바이트가 크게 줄어듭니다.
+TAG_FIELD_SETS = {
+    "full": (GOODBYE_TAG_COLUMNS, HELLO_TAG_COLUMNS),
+    "summary": (
+        (GoodbyeTag.clothing_item_id, GoodbyeTag.met_when, GoodbyeTag.met_where, GoodbyeTag.worn_count),
+        (HelloTag.clothing_item_id, HelloTag.received_from, HelloTag.received_at),
+    ),
+    "none": ((), ()),
+}
+TAG_FIELDS_PATTERN = "^(" + "|".join(TAG_FIELD_SETS) + ")$"
+
+def _tag_dict(columns, values) -> dict | None:
+    # 첫 컬럼(clothing_item_id)이 None 이면 outer join 결과 태그가 없는 것
+    if values[0] is None:
+        return None
+    return {column.key: value for column, value in zip(columns[1:], values[1:])}
+
+def _projection(tags: str, fields: frozenset | None) -> tuple:
+    """(아이템 컬럼, Goodbye 컬럼, Hello 컬럼). fields 는 ?fields= 로 고른 응답 필드 (None 이면 전체)"""
+    goodbye_columns, hello_columns = TAG_FIELD_SETS[tags]
+    return (
+        fieldsets.select(ITEM_COLUMNS, fields),
+        goodbye_columns if fieldsets.wants(fields, "goodbye_tag") else (),
+        hello_columns if fieldsets.wants(fields, "hello_tag") else (),
+    )
+
+def item_rows_query(db: Session, tags: str = "full", fields: frozenset | None = None):
+    """아이템 + Goodbye/Hello 태그(tags 범위의 컬럼)를 한 번의 outer join 으로 가져오는 프로젝션 쿼리"""
+    item_columns, goodbye_columns, hello_columns = _projection(tags, fields)
+    query = db.query(*item_columns, *goodbye_columns, *hello_columns)
+    if goodbye_columns:
+        query = query.outerjoin(GoodbyeTag, GoodbyeTag.clothing_item_id == ClothingItem.id)
+    if hello_columns:
+        query = query.outerjoin(HelloTag, HelloTag.clothing_item_id == ClothingItem.id)
+    return query
+
+def item_row_to_dict(row, tags: str = "full", fields: frozenset | None = None) -> dict:
+    """tags 가 none 이면 goodbye_tag / hello_tag 키를 넣지 않습니다. (태그 없음(null) 과 구분)"""
+    item_columns, goodbye_columns, hello_columns = _projection(tags, fields)
+    n_item, n_goodbye = len(item_columns), len(goodbye_columns)
+    data = {column.key: value for column, value in zip(item_columns, row[:n_item])}
+    if goodbye_columns:
+        data["goodbye_tag"] = _tag_dict(goodbye_columns, row[n_item:n_item + n_goodbye])
+    if hello_columns:
+        data["hello_tag"] = _tag_dict(hello_columns, row[n_item + n_goodbye:])
+    return data
+
+def get_items_for_exchange_rows(db: Session, skip: int = 0, limit: int = 20, tags: str = "full",
+                                fields: frozenset | None = None) -> List[dict]:
+    """get_items_for_exchange 의 프로젝션 버전 (응답용 dict 목록, fields 로 고른 컬럼만 조회)"""
+    rows = item_rows_query(db, tags, fields)\
         .filter(ClothingItem.is_listed_for_exchange == True)\
         .offset(skip)\
         .limit(limit)\
         .all()
+    return [item_row_to_dict(row, tags, fields) for row in rows]
+
+# QR 스캔 상세 응답 캐시 (아이템 + 태그). 쓰기 시 해당 항목만 지우고, 다른 워커는 TTL 로 수렴합니다.
+item_detail_cache = Cache("item_details", ttl=config.ITEM_DETAIL_CACHE_TTL)
+
+@cached(item_detail_cache, ClothingItemResponse, key=lambda item_id: item_id)
+def get_item_detail(db: Session, item_id: str) -> dict | None:
+    """아이템 상세 (Goodbye/Hello 태그 포함, 한 번의 outer join). 캐시됨"""
+    row = item_rows_query(db).filter(ClothingItem.id == item_id).first()
+    return item_row_to_dict(row) if row is not None else None
 
 def get_items_by_user(db: Session, user_id: str) -> List[ClothingItem]:
-    """특정 사용자가 등록한 모든 아이템 목록을 조회합니다."""
+    """특정 사용자가 등록한 모든 아이템 목록을 조회합니다. (태그 포함 한 번의 쿼리)"""
     return db.query(ClothingItem)\
+        .options(*TAG_LOAD_OPTIONS)\
+        .filter(ClothingItem.user_id == user_id)\
+        .order_by(ClothingItem.id.desc())\
+        .all()
+
+def get_items_by_user_rows(db: Session, user_id: str, tags: str = "full") -> List[dict]:
+    """get_items_by_user 의 프로젝션 버전 (ix_clothing_items_user_id_id 역순 범위)"""
+    rows = item_rows_query(db, tags)\
         .filter(ClothingItem.user_id == user_id)\
         .order_by(ClothingItem.id.desc())\
         .all()
+    return [item_row_to_dict(row, tags) for row in rows]
 
 def create_user_item(db: Session, item: ClothingItemCreate, user_id: str, user_nickname: str) -> ClothingItem:
     """
@@ -33,14 +140,18 @@ def create_user_item(db: Session, item: ClothingItemCreate, user_id: str, user_n
     
     db_item = ClothingItem(
         **item_data,
-        id=str(uuid.uuid4()),
+        id=new_id(),
         user_id=user_id,
         user_nickname=user_nickname
     )
     
     db.add(db_item)
+    if db_item.is_listed_for_exchange:
+        crud_feed.record_activity(db, user_id, FeedVerbEnum.ITEM_LISTED, db_item.id, db_item.name)
+    touched = crud_matching.touch(db, crud_matching.item_scope(db_item))
     db.commit()
     db.refresh(db_item)
+    crud_matching.item_changed(db, db_item, touched)
     return db_item
 
 def update_item(db: Session, db_item: ClothingItem, item_in: ClothingItemUpdate) -> ClothingItem:
@@ -49,15 +160,42 @@ def update_item(db: Session, db_item: ClothingItem, item_in: ClothingItemUpdate)
     ClothingItemUpdate 스키마에 정의된 필드들을 업데이트합니다.
     """
     update_data = item_in.model_dump(exclude_unset=True)
+    was_listed = db_item.is_listed_for_exchange
+    impact_before = crud_impact.impact_key(db_item)
+    scope_before = crud_matching.item_scope(db_item)
     
     for key, value in update_data.items():
         setattr(db_item, key, value)
         
     db.add(db_item)
+    # 승인된 출품 아이템의 카테고리가 바뀌면 파티 임팩트도 바뀜
+    crud_impact.apply_change(db, impact_before, crud_impact.impact_key(db_item))
+    # 교환 목록에 새로 올린 경우 이웃 피드에 알림
+    if db_item.is_listed_for_exchange and not was_listed:
+        crud_feed.record_activity(db, db_item.user_id, FeedVerbEnum.ITEM_LISTED, db_item.id, db_item.name)
+    touched = crud_matching.touch(db, scope_before, crud_matching.item_scope(db_item))
     db.commit()
     db.refresh(db_item)
+    item_detail_cache.discard(db_item.id)
+    crud_matching.item_changed(db, db_item, touched)
     return db_item
 
+def set_submission_status(db: Session, item_ids: List[str], before, status: PartySubmissionStatusEnum) -> List[str]:
+    """
+    출품 상태가 아직 before 인 아이템만 status 로 바꾸고(compare-and-set) 실제로 바뀐 id 를 반환합니다. (commit 은 호출한 쪽)
+    동시에 들어온 다른 심사(단건/일괄)와 겹쳐도 임팩트 증감을 실제로 바뀐 행에만 반영할 수 있습니다.
+    """
+    unchanged_since_read = ClothingItem.party_submission_status.is_(None) if before is None \
+        else ClothingItem.party_submission_status == before
+    rows = db.execute(
+        update(ClothingItem)
+        .where(ClothingItem.id.in_(item_ids), unchanged_since_read)
+        .values(party_submission_status=status)
+        .returning(ClothingItem.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    return [row[0] for row in rows]
+
 def update_item_submission_status(db: Session, db_item: ClothingItem, status: str) -> ClothingItem:
     """아이템의 파티 출품 상태를 변경합니다 (관리자용)."""
     try:
@@ -65,19 +203,28 @@ def update_item_submission_status(db: Session, db_item: ClothingItem, status: st
     except ValueError:
         return db_item 
 
-    db_item.party_submission_status = status_enum
-    
-    db.add(db_item)
+    touched = set()
+    if set_submission_status(db, [db_item.id], db_item.party_submission_status, status_enum):
+        crud_impact.apply_change(db, crud_impact.impact_key(db_item), crud_impact.impact_key(db_item, status_enum))
+        touched = crud_matching.touch(db, crud_matching.item_scope(db_item))
     db.commit()
     db.refresh(db_item)
+    item_detail_cache.discard(db_item.id)
+    crud_matching.item_changed(db, db_item, touched)
     return db_item
 
 def remove_item(db: Session, db_item: ClothingItem):
     """
     특정 아이템 객체를 데이터베이스에서 삭제합니다.
     """
+    item_id = db_item.id
+    crud_feed.delete_activities(db, item_id)
+    touched = crud_matching.touch(db, crud_matching.item_scope(db_item))
     db.delete(db_item)
+    crud_impact.apply_change(db, crud_impact.impact_key(db_item), None)
     db.commit()
+    item_detail_cache.discard(item_id)
+    crud_matching.item_removed(db, item_id, touched)
     # 반환할 것이 없으므로 None을 반환하거나, 성공 메시지 처리를 위해 True를 반환할 수도 있습니다.
 
 
@@ -97,6 +244,7 @@ def create_goodbye_tag(db: Session, db_item: ClothingItem, tag_in: GoodbyeTagCre
     db.add(db_item) # item을 커밋하면 cascade 설정에 따라 tag도 저장됨
     db.commit()
     db.refresh(db_item)
+    item_detail_cache.discard(db_item.id)
     return db_item
 
 def create_hello_tag(db: Session, db_item: ClothingItem, tag_in: HelloTagCreate) -> ClothingItem:
@@ -115,4 +263,104 @@ def create_hello_tag(db: Session, db_item: ClothingItem, tag_in: HelloTagCreate)
     db.add(db_item)
     db.commit()
     db.refresh(db_item)
-    return db_item
\ No newline at end of file
+    item_detail_cache.discard(db_item.id)
+    return db_item
+
+
+# --- 일괄 등록 (파티 현장 접수 / 옷장 가져오기) ---
+# 행마다 commit/refresh 하지 않고, 검증을 통과한 행을 IMPORT_CHUNK_SIZE 개씩 모아
+# 아이템 / Goodbye Tag 를 각각 executemany insert 한 뒤 청크 단위로 commit 합니다.
+# 한 청크가 실패해도 앞서 commit 된 청크는 남고, 실패한 행은 행 번호와 함께 보고합니다.
+
+def _validation_message(exc: ValidationError, prefix: tuple = ()) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in (*prefix, *error['loc'])) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+def _import_row(record: dict, user_id: str, user_nickname: str, party_id: str | None) -> tuple[dict, dict | None]:
+    """행 하나를 검증해 (아이템 insert 값, Goodbye Tag insert 값 또는 None) 으로 바꿉니다."""
+    tag_data = record.pop("goodbye_tag", None)
+    item_in = ClothingItemCreate.model_validate(record)
+    item_id = new_id()
+    values = {
+        **item_in.model_dump(),
+        "category": ClothingCategoryEnum(item_in.category.value),
+        "id": item_id,
+        "user_id": user_id,
+        "user_nickname": user_nickname,
+        "is_listed_for_exchange": False,
+    }
+    if party_id is not None:
+        values["submitted_party_id"] = party_id
+        values["party_submission_status"] = PartySubmissionStatusEnum.PENDING
+    tag = None
+    if tag_data is not None:
+        try:
+            tag = {**GoodbyeTagCreate.model_validate(tag_data).model_dump(), "clothing_item_id": item_id}
+        except ValidationError as exc:
+            raise ValueError(_validation_message(exc, ("goodbye_tag",)))
+    return values, tag
+
+def _flush_import_chunk(db: Session, chunk: list, result: dict) -> None:
+    items = [values for _, values, _ in chunk]
+    tags = [tag for _, _, tag in chunk if tag is not None]
+    try:
+        db.execute(insert(ClothingItem), items)
+        if tags:
+            db.execute(insert(GoodbyeTag), tags)
+        # 출품 파티가 있으면 그 파티의 매칭 범위가 바뀜 (교환 목록 등록은 일괄 등록 대상이 아님)
+        crud_matching.touch(db, *{(None, values.get("submitted_party_id")) for values in items})
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        message = f"저장 실패: {exc.__class__.__name__}"
+        result["failed"] += len(chunk)
+        result["errors"].extend({"row": row, "error": message} for row, _, _ in chunk)
+        return
+    result["imported"] += len(chunk)
+    result["goodbye_tags"] += len(tags)
+
+def import_items(
+    db: Session,
+    records: Iterable[tuple[int, object]],
+    user_id: str,
+    user_nickname: str,
+    party_id: str | None = None,
+    chunk_size: int | None = None,
+    max_rows: int | None = None,
+) -> dict:
+    """
+    app/core/item_import.parse_records 가 내보낸 (행 번호, dict 또는 오류) 를 검증해 일괄 등록합니다.
+    party_id 를 주면 그 파티에 출품(PENDING)된 상태로 등록합니다. (파티 존재 확인은 호출한 쪽)
+    max_rows 를 넘는 행은 읽지 않고 truncated 로 표시합니다.
+    반환: {"imported", "goodbye_tags", "failed", "truncated", "errors": [{"row", "error"}]}
+    """
+    chunk_size = chunk_size or config.IMPORT_CHUNK_SIZE
+    result = {"imported": 0, "goodbye_tags": 0, "failed": 0, "truncated": False, "errors": []}
+    chunk = []
+    for count, (row, record) in enumerate(records):
+        if max_rows is not None and count >= max_rows:
+            result["truncated"] = True
+            break
+        if isinstance(record, Exception):
+            result["failed"] += 1
+            result["errors"].append({"row": row, "error": str(record)})
+            continue
+        try:
+            values, tag = _import_row(record, user_id, user_nickname, party_id)
+        except ValidationError as exc:
+            result["failed"] += 1
+            result["errors"].append({"row": row, "error": _validation_message(exc)})
+            continue
+        except ValueError as exc:
+            result["failed"] += 1
+            result["errors"].append({"row": row, "error": str(exc)})
+            continue
+        chunk.append((row, values, tag))
+        if len(chunk) >= chunk_size:
+            _flush_import_chunk(db, chunk, result)
+            chunk = []
+    if chunk:
+        _flush_import_chunk(db, chunk, result)
+    return result
@@ -0,0 +1,154 @@
+import datetime
+from typing import Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from app.core.ids import new_id
+from app.crud.user import _insert_ignore
+from app.models import Job, JobStatusEnum
+
+# --------------------------------------------------------------------------
+# 작업 큐 (jobs 테이블)
+#
+# 가져가기(claim)는 "후보 조회 -> 상태 조건을 건 UPDATE" 로 하며, UPDATE 가 1행을 바꾼 워커만 실행합니다.
+# (SQLite / PostgreSQL 모두 행 잠금 없이 여러 워커에서 안전)
+# --------------------------------------------------------------------------
+
+CLAIM_CANDIDATES = 8
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: Optional[dict] = None,
+    *,
+    priority: int = 100,
+    delay: float = 0,
+    max_attempts: int = 5,
+    dedupe_key: Optional[str] = None,
+) -> Optional[str]:
+    """
+    작업을 추가합니다. 호출한 쪽의 트랜잭션 안에서 실행되며 commit 은 호출한 쪽에서 합니다.
+    (요청의 쓰기와 같이 commit 되므로, 쓰기가 롤백되면 작업도 생기지 않습니다)
+    dedupe_key 가 같은 작업이 이미 있으면 추가하지 않고 None 을 반환합니다.
+    """
+    now = datetime.datetime.utcnow()
+    job_id = new_id()
+    values = dict(
+        id=job_id, kind=kind, payload=payload or {}, priority=priority,
+        status=JobStatusEnum.QUEUED, attempts=0, max_attempts=max_attempts,
+        run_at=now + datetime.timedelta(seconds=delay), dedupe_key=dedupe_key, created_at=now,
+    )
+    if dedupe_key is None:
+        db.add(Job(**values))
+        return job_id
+    return job_id if _insert_ignore(db, Job.__table__, values) else None
+
+
+def _claimable(now: datetime.datetime):
+    return or_(
+        and_(Job.status == JobStatusEnum.QUEUED, Job.run_at <= now),
+        # 실행 중이던 워커가 죽어 visibility timeout 이 지난 작업
+        and_(Job.status == JobStatusEnum.RUNNING, Job.locked_until < now),
+    )
+
+
+def claim(db: Session, worker: str, visibility_timeout: float) -> Optional[Job]:
+    """실행할 작업 하나를 가져와 RUNNING 으로 표시하고 commit 합니다. 없으면 None"""
+    now = datetime.datetime.utcnow()
+    # 상태별로 나눠 조회해야 (status, priority, run_at) 인덱스 순서대로 읽습니다.
+    queued = db.query(Job.id, Job.priority, Job.run_at)\
+        .filter(Job.status == JobStatusEnum.QUEUED, Job.run_at <= now)\
+        .order_by(Job.priority, Job.run_at)\
+        .limit(CLAIM_CANDIDATES)\
+        .all()
+    expired = db.query(Job.id, Job.priority, Job.run_at)\
+        .filter(Job.status == JobStatusEnum.RUNNING, Job.locked_until < now)\
+        .order_by(Job.priority, Job.run_at)\
+        .limit(CLAIM_CANDIDATES)\
+        .all()
+    candidates = sorted(queued + expired, key=lambda row: (row.priority, row.run_at))
+
+    for candidate in candidates:
+        claimed = db.query(Job)\
+            .filter(Job.id == candidate.id, _claimable(now))\
+            .update({
+                Job.status: JobStatusEnum.RUNNING,
+                Job.locked_by: worker,
+                Job.locked_until: now + datetime.timedelta(seconds=visibility_timeout),
+                Job.attempts: Job.attempts + 1,
+            }, synchronize_session=False)
+        db.commit()
+        if claimed:
+            return db.get(Job, candidate.id)
+    return None
+
+
+def extend_lock(db: Session, job_id: str, worker: str, visibility_timeout: float) -> None:
+    """오래 걸리는 작업의 잠금 시간을 늘립니다."""
+    db.query(Job)\
+        .filter(Job.id == job_id, Job.locked_by == worker, Job.status == JobStatusEnum.RUNNING)\
+        .update({Job.locked_until: datetime.datetime.utcnow() + datetime.timedelta(seconds=visibility_timeout)},
+                synchronize_session=False)
+    db.commit()
+
+
+def finish(db: Session, job_id: str, worker: str, release_key: bool = False) -> bool:
+    """
+    작업 완료 표시. 작업 함수의 쓰기와 같은 트랜잭션에서 호출하고 commit 은 호출한 쪽에서 합니다.
+    그 사이 visibility timeout 이 지나 다른 워커가 가져갔다면 False (호출한 쪽은 롤백)
+    """
+    values = {
+        Job.status: JobStatusEnum.DONE,
+        Job.finished_at: datetime.datetime.utcnow(),
+        Job.locked_until: None,
+        Job.last_error: None,
+    }
+    if release_key:
+        values[Job.dedupe_key] = None
+    return bool(
+        db.query(Job)
+        .filter(Job.id == job_id, Job.locked_by == worker, Job.status == JobStatusEnum.RUNNING)
+        .update(values, synchronize_session=False)
+    )
+
+
+def fail(db: Session, job_id: str, worker: str, error: str, retry_in: Optional[float]) -> None:
+    """실패 기록. retry_in 초 뒤 다시 실행하거나, None 이면 FAILED 로 끝냅니다. (dedupe_key 는 풀어 다시 넣을 수 있게 함)"""
+    now = datetime.datetime.utcnow()
+    if retry_in is None:
+        values = {Job.status: JobStatusEnum.FAILED, Job.finished_at: now, Job.dedupe_key: None}
+    else:
+        values = {Job.status: JobStatusEnum.QUEUED, Job.run_at: now + datetime.timedelta(seconds=retry_in)}
+    values.update({Job.last_error: error[:2000], Job.locked_until: None})
+    db.query(Job)\
+        .filter(Job.id == job_id, Job.locked_by == worker, Job.status == JobStatusEnum.RUNNING)\
+        .update(values, synchronize_session=False)
+    db.commit()
+
+
+def purge_finished(db: Session, older_than_hours: float) -> int:
+    """오래된 DONE 작업 삭제 (FAILED 는 확인용으로 남김)"""
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=older_than_hours)
+    deleted = db.query(Job)\
+        .filter(Job.status == JobStatusEnum.DONE, Job.run_at < cutoff)\
+        .delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+def queue_stats(db: Session) -> dict:
+    """상태별 작업 수와, 실행 시각이 지났는데 아직 대기 중인 가장 오래된 작업의 지연(초)"""
+    now = datetime.datetime.utcnow()
+    depth = {
+        status.value: count
+        for status, count in db.query(Job.status, func.count(Job.id)).group_by(Job.status).all()
+    }
+    oldest_due = db.query(func.min(Job.run_at))\
+        .filter(Job.status == JobStatusEnum.QUEUED, Job.run_at <= now)\
+        .scalar()
+    return {
+        "depth": depth,
+        "lag_seconds": round((now - oldest_due).total_seconds(), 3) if oldest_due else 0.0,
+    }
@@ -1,19 +1,50 @@
-import uuid
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import List, Optional
 
 from app.models import Maker, MakerProduct
-from app.schemas import MakerCreate, MakerUpdate, MakerProductCreate, MakerProductUpdate
+from app.schemas import MakerCreate, MakerUpdate, MakerProductCreate, MakerProductUpdate, MakerResponse
+from app.core import fields as fieldsets
+from app.core.cache import Cache, cached
+from app.core.ids import new_id
 
-# --- Maker 조회 ---
+# 메이커 목록/상세 캐시 (메이커 또는 굿즈가 바뀌면 무효화)
+maker_cache = Cache("makers")
 
-def get_makers(db: Session) -> List[Maker]:
-    """모든 메이커 목록을 조회합니다."""
-    return db.query(Maker).all()
+# --- Maker 조회 ---
 
-def get_maker(db: Session, maker_id: str) -> Maker | None:
+@cached(maker_cache, List[MakerResponse])
+def get_makers(db: Session) -> List[MakerResponse]:
+    """모든 메이커 목록을 조회합니다. (캐시됨)"""
+    # 응답에 상품 목록이 포함되므로 메이커마다 지연 로딩하지 않도록 한 번에 로드
+    return db.query(Maker).options(selectinload(Maker.products)).all()
+
+# --- 희소 필드셋 (?fields=) ---
+# 목록 화면용: 고른 컬럼만 조회하고, products 를 고르지 않으면 굿즈 쿼리를 생략합니다. (캐시하지 않음)
+
+MAKER_COLUMNS = (Maker.id, Maker.name, Maker.specialty, Maker.location, Maker.bio, Maker.image_url)
+PRODUCT_COLUMNS = (
+    MakerProduct.id, MakerProduct.maker_id, MakerProduct.name, MakerProduct.description,
+    MakerProduct.price, MakerProduct.image_url,
+)
+
+def get_makers_rows(db: Session, fields: Optional[frozenset] = None) -> List[dict]:
+    """get_makers 의 프로젝션 버전 (MakerResponse 형태의 dict 목록)"""
+    columns = fieldsets.select(MAKER_COLUMNS, fields)
+    results = [{column.key: value for column, value in zip(columns, row)} for row in db.query(*columns).all()]
+    if fieldsets.wants(fields, "products"):
+        products = {data["id"]: [] for data in results}
+        if products:
+            rows = db.query(*PRODUCT_COLUMNS).filter(MakerProduct.maker_id.in_(list(products))).all()
+            for row in rows:
+                products[row.maker_id].append({column.key: value for column, value in zip(PRODUCT_COLUMNS, row)})
+        for data in results:
+            data["products"] = products[data["id"]]
+    return results
+
+@cached(maker_cache, MakerResponse)
+def get_maker(db: Session, maker_id: str) -> MakerResponse | None:
     """
-    특정 메이커의 상세 정보와 관련 상품을 함께 조회합니다.
+    특정 메이커의 상세 정보와 관련 상품을 함께 조회합니다. (캐시됨)
     """
     return db.query(Maker).options(
         joinedload(Maker.products)
@@ -23,12 +54,13 @@ def get_maker(db: Session, maker_id: str) -> Maker | None:
 
 def create_maker(db: Session, maker: MakerCreate) -> Maker:
     db_maker = Maker(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         **maker.model_dump()
     )
     db.add(db_maker)
     db.commit()
     db.refresh(db_maker)
+    maker_cache.invalidate()
     return db_maker
 
 def update_maker(db: Session, maker_id: str, maker_in: MakerUpdate) -> Maker | None:
@@ -43,6 +75,7 @@ def update_maker(db: Session, maker_id: str, maker_in: MakerUpdate) -> Maker | N
     db.add(db_maker)
     db.commit()
     db.refresh(db_maker)
+    maker_cache.invalidate()
     return db_maker
 
 def delete_maker(db: Session, maker_id: str) -> bool:
@@ -52,6 +85,7 @@ def delete_maker(db: Session, maker_id: str) -> bool:
     
     db.delete(db_maker)
     db.commit()
+    maker_cache.invalidate()
     return True
 
 # --- Maker Product (굿즈) 관리 ---
@@ -61,13 +95,14 @@ def get_product(db: Session, product_id: str) -> MakerProduct | None:
 
 def create_maker_product(db: Session, maker_id: str, product: MakerProductCreate) -> MakerProduct:
     db_product = MakerProduct(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         maker_id=maker_id,
         **product.model_dump()
     )
     db.add(db_product)
     db.commit()
     db.refresh(db_product)
+    maker_cache.invalidate()
     return db_product
 
 def update_maker_product(db: Session, product_id: str, product_in: MakerProductUpdate) -> MakerProduct | None:
@@ -82,6 +117,7 @@ def update_maker_product(db: Session, product_id: str, product_in: MakerProductU
     db.add(db_product)
     db.commit()
     db.refresh(db_product)
+    maker_cache.invalidate()
     return db_product
 
 def delete_maker_product(db: Session, product_id: str) -> bool:
@@ -91,4 +127,5 @@ def delete_maker_product(db: Session, product_id: str) -> bool:
     
     db.delete(db_product)
     db.commit()
+    maker_cache.invalidate()
     return True
\ No newline at end of file
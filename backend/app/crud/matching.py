@@ -0,0 +1,233 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+from sqlalchemy import event, inspect, or_
+from sqlalchemy.orm import Session
+
+from app.core import config, etag, metrics
+from app.core.ids import parse_id
+from app.core.matching import ItemEntry, Match, MatchIndex
+from app.models import (
+    ClothingItem, Party, PartyParticipation, PartyParticipantStatusEnum, PartySubmissionStatusEnum,
+)
+
+# --------------------------------------------------------------------------
+# 파티 교환 매칭 (app/core/matching.MatchIndex 를 파티별로 관리)
+#
+# 파티 범위 = 호스트/참가 확정(ACCEPTED, ATTENDED) 회원이 교환 목록에 올린 아이템
+#            + 이 파티에 출품되어 반려되지 않은 아이템
+# 인덱스는 워커 메모리에 파티별로 만들고, 그 파티의 아이템 범위 버전("party_items:<파티 id>")이나
+# 회원 버전("party_members:<파티 id>")이 바뀌면 다시 만듭니다. 회원 버전은 참가 신청/상태 변경/호스트 변경을
+# flush 할 때 그 파티만 올리고(set-based UPDATE 는 touch_members), 아이템 쓰기는 commit 전에 touch() 로
+# 범위가 바뀌는 파티의 버전만 올리고 (clothing_items 전체 버전은 두지 않음),
+# 이 워커에서 일어난 변경은 commit 직후 item_changed() 로 증분 반영합니다.
+# --------------------------------------------------------------------------
+
+MEMBER_STATUSES = (PartyParticipantStatusEnum.ACCEPTED, PartyParticipantStatusEnum.ATTENDED)
+
+_indexes: "OrderedDict[str, MatchIndex]" = OrderedDict()
+_members: dict[str, set[str]] = {}
+_lock = threading.Lock()
+
+
+# 경로 파라미터로 받은 id 는 표기(대소문자, 하이픈)가 다를 수 있으므로 버전 키는 정규화한 id 로 만듭니다.
+def _version_key(party_id: str) -> str:
+    return f"party_items:{parse_id(party_id)}"
+
+
+def _members_key(party_id: str) -> str:
+    return f"party_members:{parse_id(party_id)}"
+
+
+def _current_versions(db: Session, party_ids: Iterable[str]) -> dict[str, tuple]:
+    """파티 id -> (아이템 범위 버전, 회원 버전)"""
+    party_ids = list(party_ids)
+    versions = {name: version for name, version, _ in etag.get_versions(
+        db, [key(party_id) for party_id in party_ids for key in (_version_key, _members_key)]
+    )}
+    return {party_id: (versions[_version_key(party_id)], versions[_members_key(party_id)]) for party_id in party_ids}
+
+
+# --- 버전 증가 (아이템 crud 의 commit 전에 호출) ---
+
+def item_scope(item) -> tuple[Optional[str], Optional[str]]:
+    """아이템이 파티 매칭 범위에 들어가는 근거: (교환 목록에 올린 소유자 id, 출품한 파티 id)"""
+    return (item.user_id if item.is_listed_for_exchange else None, item.submitted_party_id)
+
+
+def touch(db: Session, *scopes: tuple[Optional[str], Optional[str]]) -> set[str]:
+    """
+    변경 전/후 item_scope 를 받아, 범위가 바뀔 수 있는 파티(출품한 파티 + 소유자가 호스트/참가 확정인 파티)의
+    버전만 현재 트랜잭션 안에서 올립니다. 올린 파티 id 를 반환합니다. (item_changed 에 넘김)
+    """
+    owner_ids = {owner_id for owner_id, _ in scopes if owner_id}
+    party_ids = {party_id for _, party_id in scopes if party_id}
+    if owner_ids:
+        hosted = db.query(Party.id).filter(Party.host_id.in_(owner_ids))
+        joined = db.query(PartyParticipation.party_id)\
+            .filter(PartyParticipation.user_id.in_(owner_ids), PartyParticipation.status.in_(MEMBER_STATUSES))
+        party_ids.update(row[0] for row in hosted.union(joined).all())
+    if party_ids:
+        etag.bump_keys(db.connection(), [_version_key(party_id) for party_id in party_ids])
+    return party_ids
+
+
+def touch_members(db: Session, party_ids: Iterable[str]) -> None:
+    """
+    참가자 상태를 set-based UPDATE(query.update) 로 바꾼 경우 호출합니다. (commit 전)
+    ORM 객체로 바꾸는 경우는 _touch_flushed_members 가 flush 때 올립니다.
+    """
+    etag.bump_keys(db.connection(), [_members_key(party_id) for party_id in party_ids])
+
+
+@event.listens_for(Session, "after_flush")
+def _touch_flushed_members(session: Session, flush_context) -> None:
+    # 참가 신청/취소/상태 변경, 호스트 변경이 있었던 파티만 회원 버전을 올립니다.
+    party_ids = {
+        obj.party_id for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, PartyParticipation)
+    }
+    party_ids.update(
+        obj.id for obj in session.dirty
+        if isinstance(obj, Party) and inspect(obj).attrs.host_id.history.has_changes()
+    )
+    party_ids.discard(None)
+    if party_ids:
+        touch_members(session, party_ids)
+
+
+def _entry(row) -> ItemEntry:
+    return ItemEntry(
+        id=row.id, owner_id=row.user_id, owner_nickname=row.user_nickname,
+        category=row.category.value, size=row.size, name=row.name, image_url=row.image_url,
+    )
+
+
+ENTRY_COLUMNS = (
+    ClothingItem.id, ClothingItem.user_id, ClothingItem.user_nickname, ClothingItem.category,
+    ClothingItem.size, ClothingItem.name, ClothingItem.image_url,
+)
+
+
+def _in_scope(party_id: str, members: set[str], item: ClothingItem) -> bool:
+    if item.submitted_party_id == party_id and item.party_submission_status != PartySubmissionStatusEnum.REJECTED:
+        return True
+    return bool(item.is_listed_for_exchange) and item.user_id in members
+
+
+def _build(db: Session, party_id: str, versions: tuple) -> Optional[MatchIndex]:
+    host_id = db.query(Party.host_id).filter(Party.id == party_id).scalar()
+    if host_id is None:
+        return None
+    members = {host_id}
+    members.update(
+        row[0] for row in db.query(PartyParticipation.user_id)
+        .filter(PartyParticipation.party_id == party_id, PartyParticipation.status.in_(MEMBER_STATUSES))
+        .all()
+    )
+    # ix_clothing_items_user_id_id / ix_clothing_items_submitted_party_id_status_id 로 범위를 읽습니다.
+    rows = db.query(*ENTRY_COLUMNS).filter(or_(
+        (ClothingItem.user_id.in_(members)) & (ClothingItem.is_listed_for_exchange == True),
+        (ClothingItem.submitted_party_id == party_id)
+        & (ClothingItem.party_submission_status != PartySubmissionStatusEnum.REJECTED),
+    )).all()
+
+    index = MatchIndex(party_id, versions)
+    index.load(_entry(row) for row in rows)
+    metrics.incr("matching", "rebuild")
+    with _lock:
+        _indexes[party_id] = index
+        _members[party_id] = members
+        _indexes.move_to_end(party_id)
+        while len(_indexes) > config.MATCHING_MAX_PARTIES:
+            evicted, _ = _indexes.popitem(last=False)
+            _members.pop(evicted, None)
+    return index
+
+
+def get_index(db: Session, party_id: str) -> Optional[MatchIndex]:
+    """파티 매칭 인덱스 (버전이 바뀌었으면 다시 만듭니다). 파티가 없으면 None"""
+    versions = _current_versions(db, [party_id])[party_id]
+    with _lock:
+        index = _indexes.get(party_id)
+        if index is not None:
+            _indexes.move_to_end(party_id)
+    if index is not None and index.version == versions:
+        metrics.incr("matching", "hit")
+        return index
+    return _build(db, party_id, versions)
+
+
+def get_matches(
+    db: Session,
+    party_id: str,
+    user_id: str,
+    sizes: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    limit: int = 20,
+) -> Optional[List[Match]]:
+    try:
+        # 버전 키("party_items:<id>")가 저장된 id 와 같은 형식이 되도록 정규화합니다.
+        party_id = str(uuid.UUID(party_id))
+    except ValueError:
+        return None
+    index = get_index(db, party_id)
+    if index is None:
+        return None
+    return index.match(user_id, sizes=sizes, categories=categories, limit=limit)
+
+
+# --- 증분 갱신 (아이템 crud 의 commit 직후 호출) ---
+
+def _apply(db: Session, party_ids: set[str], update) -> None:
+    with _lock:
+        scopes = [(party_id, _indexes[party_id]) for party_id in party_ids if party_id in _indexes]
+    if not scopes:
+        return
+    versions = _current_versions(db, [party_id for party_id, _ in scopes])
+    for party_id, index in scopes:
+        current = versions[party_id]
+        if index.version != (current[0] - 1, current[1]):
+            continue
+        update(party_id, index)
+        index.version = current
+        metrics.incr("matching", "incremental")
+
+
+def item_changed(db: Session, item: ClothingItem, party_ids: set[str]) -> None:
+    """
+    이 워커가 방금 commit 한 아이템 변경을 인덱스에 반영합니다. party_ids 는 같은 트랜잭션의 touch() 반환값입니다.
+    그 사이 그 파티에 다른 쓰기(다른 워커 포함)가 있었다면 버전이 두 칸 이상 벌어지므로 반영하지 않고
+    다음 조회 때 다시 만들도록 둡니다.
+    """
+    entry = _entry(item)
+
+    def update(party_id: str, index: MatchIndex) -> None:
+        if _in_scope(party_id, _members.get(party_id, set()), item):
+            index.upsert(entry)
+        else:
+            index.remove(entry.id)
+
+    _apply(db, party_ids, update)
+
+
+def item_removed(db: Session, item_id: str, party_ids: set[str]) -> None:
+    """삭제 commit 직후 호출 (삭제된 객체 대신 id 를 받습니다)"""
+    _apply(db, party_ids, lambda party_id, index: index.remove(item_id))
+
+
+def stats() -> dict:
+    with _lock:
+        sizes = {party_id: len(index) for party_id, index in _indexes.items()}
+    return {
+        "parties": len(sizes),
+        "items": sum(sizes.values()),
+        "rebuilds": metrics.get_counter("matching", "rebuild"),
+        "incremental": metrics.get_counter("matching", "incremental"),
+        "hits": metrics.get_counter("matching", "hit"),
+    }
+
+
+metrics.register_collector("matching", stats)
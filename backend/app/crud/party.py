@@ -1,34 +1,57 @@
-import uuid
+import datetime
 import random
 import string
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc, asc
+import uuid
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy import or_, desc, asc, insert, update
 from typing import List, Optional
 
-from app.models import Party, PartyParticipation, User, PartyStatusEnum, PartyParticipantStatusEnum
+from app.models import Party, PartyParticipation, PartyPayout, User, Credit, CreditTypeEnum, PartyStatusEnum, PartyParticipantStatusEnum, FeedVerbEnum, ClothingItem, PartySubmissionStatusEnum
 from app.schemas import PartyCreate, PartyUpdate
+from app.core import config, events, jobs, metrics, fields as fieldsets
+from app.core import impact as impact_stats
+from app.core.ids import new_id
+from app.database import on_commit
+from app.crud import feed as crud_feed
+from app.crud import impact as crud_impact
+from app.crud import item as crud_item
+from app.crud import job as crud_job
+from app.crud import matching as crud_matching
+
+
+def party_topic(party_id: str) -> str:
+    try:
+        party_id = str(uuid.UUID(party_id))
+    except ValueError:
+        pass
+    return f"party:{party_id}"
+
+def publish_participant(party_id: str, user_id: str, status: Optional[PartyParticipantStatusEnum], nickname: Optional[str] = None) -> None:
+    """
+    참가자 상태 변경을 호스트 대시보드 스트림으로 보냅니다. (commit 이후 호출)
+    status 가 None 이면 참가 취소/내보내기입니다.
+    """
+    if status is None:
+        events.publish(party_topic(party_id), "participant_removed", {"user_id": user_id})
+        return
+    data = {"user_id": user_id, "status": status.value}
+    if nickname is not None:
+        data["nickname"] = nickname
+    events.publish(party_topic(party_id), "participant", data)
+
 
 # --------------------------------------------------------------------------
 # 조회 (Read)
 # --------------------------------------------------------------------------
 
 def get_party(db: Session, party_id: str) -> Party | None:
-    """ID로 단일 파티를 조회합니다."""
-    return db.query(Party).filter(Party.id == party_id).first()
-
-def get_parties(
-    db: Session, 
-    skip: int = 0, 
-    limit: int = 100, 
-    status: Optional[str] = None, 
-    search: Optional[str] = None
-) -> List[Party]:
-    """
-    파티 목록을 조회합니다. 
-    상태(status) 필터링과 검색(search) 기능을 포함합니다.
-    """
-    query = db.query(Party)
+    """ID로 단일 파티를 조회합니다. (participants 프로퍼티가 참가자마다 User 를 지연 로딩하지 않도록 함께 읽음)"""
+    return db.query(Party).options(
+        selectinload(Party.participations).joinedload(PartyParticipation.user)
+    ).filter(Party.id == party_id).first()
 
+def _parties_query(query, status: Optional[str] = None, search: Optional[str] = None):
+    """get_parties 의 상태 필터링 / 검색 조건을 적용합니다."""
     # 1. 상태 필터링
     if status:
         # Enum 값이 들어올 수도 있고 문자열이 들어올 수도 있으므로 처리
@@ -48,7 +71,88 @@ def get_parties(
         )
 
     # 날짜순 정렬 (가까운 날짜 먼저)
-    return query.order_by(Party.date.asc()).offset(skip).limit(limit).all()
+    return query.order_by(Party.date.asc())
+
+def get_parties(
+    db: Session, 
+    skip: int = 0, 
+    limit: int = 100, 
+    status: Optional[str] = None, 
+    search: Optional[str] = None
+) -> List[Party]:
+    """
+    파티 목록을 조회합니다. 
+    상태(status) 필터링과 검색(search) 기능을 포함합니다.
+    응답의 participants 프로퍼티를 위해 참가자와 닉네임을 IN 조회 한 번으로 함께 읽습니다. (파티 수와 관계없이 쿼리 2개)
+    """
+    query = _parties_query(
+        db.query(Party).options(selectinload(Party.participations).joinedload(PartyParticipation.user)),
+        status=status, search=search,
+    )
+    return query.offset(skip).limit(limit).all()
+
+# --- 빠른 직렬화 경로 (FAST_JSON) ---
+
+PARTY_COLUMNS = (
+    Party.title, Party.description, Party.date, Party.location, Party.image_url, Party.details,
+    Party.id, Party.host_id, Party.status, Party.invitation_code,
+)
+IMPACT_COLUMNS = (Party.impact_items_exchanged, Party.impact_water_saved, Party.impact_co2_reduced)
+
+def get_participants_rows(db: Session, party_ids: List[str]) -> dict[str, list[dict]]:
+    """
+    여러 파티의 참가자(PartyParticipantResponse 형태)를 한 번의 쿼리로 조회하여 파티 ID별로 묶습니다.
+    Party.participants 프로퍼티처럼 참가자마다 User 를 지연 로딩하지 않습니다.
+    """
+    grouped: dict[str, list[dict]] = {party_id: [] for party_id in party_ids}
+    if not party_ids:
+        return grouped
+
+    rows = db.query(
+        PartyParticipation.party_id, PartyParticipation.user_id, User.nickname, PartyParticipation.status
+    ).outerjoin(User, PartyParticipation.user_id == User.id)\
+     .filter(PartyParticipation.party_id.in_(party_ids))\
+     .all()
+
+    for party_id, user_id, nickname, status in rows:
+        grouped[party_id].append({
+            "user_id": user_id,
+            "nickname": nickname if nickname is not None else "Unknown",
+            "status": status
+        })
+    return grouped
+
+def get_parties_rows(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    fields: Optional[frozenset] = None
+) -> List[dict]:
+    """
+    get_parties 의 프로젝션 버전 (PartyResponse 형태의 dict 목록)
+    fields(?fields=) 를 주면 그 컬럼만 조회하고, participants 를 고르지 않으면 참가자 쿼리를 생략합니다.
+    """
+    columns = fieldsets.select(PARTY_COLUMNS, fields)
+    impact_columns = IMPACT_COLUMNS if fieldsets.wants(fields, "impact") else ()
+    query = _parties_query(db.query(*columns, *impact_columns), status=status, search=search)
+    rows = query.offset(skip).limit(limit).all()
+
+    with_participants = fieldsets.wants(fields, "participants")
+    participants = get_participants_rows(db, [row.id for row in rows]) if with_participants else {}
+    results = []
+    for row in rows:
+        data = {column.key: value for column, value in zip(columns, row)}
+        if with_participants:
+            data["participants"] = participants[row.id]
+        if impact_columns:
+            data["impact"] = impact_stats.from_columns(*row[len(columns):])
+        if fieldsets.wants(fields, "kit_details"):
+            # ORM 경로와 동일하게 kit_details 는 모델에 매핑된 속성이 없어 None
+            data["kit_details"] = None
+        results.append(data)
+    return results
 
 def get_party_by_invitation_code(db: Session, code: str) -> Party | None:
     """초대 코드로 파티를 조회합니다."""
@@ -61,13 +165,16 @@ def get_parties_for_user(db: Session, user_id: str) -> List[Party]:
     # 1. 내가 호스트인 파티
     # 2. 내가 참가자(PartyParticipation)로 등록된 파티
     # 이 두 가지 조건을 OR로 묶어서 조회
-    return db.query(Party).outerjoin(PartyParticipation, Party.id == PartyParticipation.party_id)\
+    # (outer join + distinct 대신 parties 한 테이블의 조건으로 묶어 host_id 인덱스와 PK 를 각각 사용)
+    joined_party_ids = db.query(PartyParticipation.party_id)\
+        .filter(PartyParticipation.user_id == user_id)
+    return db.query(Party)\
         .filter(
             or_(
                 Party.host_id == user_id,
-                PartyParticipation.user_id == user_id
+                Party.id.in_(joined_party_ids)
             )
-        ).distinct().order_by(Party.date.asc()).all()
+        ).order_by(Party.date.asc()).all()
 
 def get_participants(db: Session, party_id: str) -> List[PartyParticipation]:
     """
@@ -77,6 +184,7 @@ def get_participants(db: Session, party_id: str) -> List[PartyParticipation]:
     # User 테이블과 조인하여 참가자 정보와 유저 정보를 함께 로드
     participations = db.query(PartyParticipation)\
         .join(User, PartyParticipation.user_id == User.id)\
+        .options(contains_eager(PartyParticipation.user))\
         .filter(PartyParticipation.party_id == party_id)\
         .all()
     
@@ -89,6 +197,32 @@ def get_participants(db: Session, party_id: str) -> List[PartyParticipation]:
     return participations
 
 
+def set_participant_status(
+    db: Session, party_id: str, user_ids: List[str], before: PartyParticipantStatusEnum, status: PartyParticipantStatusEnum
+) -> List[str]:
+    """
+    상태가 아직 before 인 참가자만 status 로 바꾸고(compare-and-set) 실제로 바뀐 user_id 를 반환합니다. (commit 은 호출한 쪽)
+    crud/item.set_submission_status 와 같은 방식입니다.
+    """
+    rows = db.execute(
+        update(PartyParticipation)
+        .where(
+            PartyParticipation.party_id == party_id,
+            PartyParticipation.user_id.in_(user_ids),
+            PartyParticipation.status == before,
+        )
+        .values(status=status)
+        .returning(PartyParticipation.user_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    return [row[0] for row in rows]
+
+
+def get_participation(db: Session, party_id: str, user_id: str) -> Optional[PartyParticipation]:
+    """PK (party_id, user_id) 단건 조회"""
+    return db.get(PartyParticipation, (party_id, user_id))
+
+
 # --------------------------------------------------------------------------
 # 생성 (Create)
 # --------------------------------------------------------------------------
@@ -109,7 +243,7 @@ def create_party(db: Session, party: PartyCreate, host_id: str) -> Party:
 
     db_party = Party(
         **party_data,
-        id=str(uuid.uuid4()),
+        id=new_id(),
         host_id=host_id,
         status=PartyStatusEnum.PENDING_APPROVAL,
         invitation_code=invitation_code # [수정] DB에 저장할 때 필수로 들어감
@@ -143,8 +277,11 @@ def add_participant(db: Session, party_id: str, user_id: str, nickname: str) ->
     )
     
     db.add(db_participation)
+    party_title = db.query(Party.title).filter(Party.id == party_id).scalar()
+    crud_feed.record_activity(db, user_id, FeedVerbEnum.PARTY_JOINED, party_id, party_title)
     db.commit()
     db.refresh(db_participation)
+    publish_participant(party_id, user_id, db_participation.status, nickname)
     
     # Pydantic 응답용 닉네임 주입
     setattr(db_participation, 'nickname', nickname)
@@ -162,6 +299,8 @@ def update_party(db: Session, db_party: Party, party_in: PartyUpdate) -> Party:
     """
     # exclude_unset=True를 사용하여 사용자가 보낸 필드만 업데이트
     update_data = party_in.model_dump(exclude_unset=True)
+    # 임팩트는 출품 데이터로 계산하는 값이므로 직접 수정하지 않습니다. (app/crud/impact.py)
+    update_data.pop("impact", None)
     
     for field, value in update_data.items():
         setattr(db_party, field, value)
@@ -175,8 +314,11 @@ def update_party_status(db: Session, db_party: Party, status: PartyStatusEnum) -
     """
     파티의 상태를 변경합니다 (승인/취소/완료 등).
     """
+    was_completed = db_party.status == PartyStatusEnum.COMPLETED
     db_party.status = status
     db.add(db_party)
+    if status == PartyStatusEnum.COMPLETED and not was_completed:
+        enqueue_post_party_jobs(db, db_party.id)
     db.commit()
     db.refresh(db_party)
     return db_party
@@ -196,8 +338,10 @@ def remove_participant(db: Session, party_id: str, user_id: str) -> Optional[Par
     ).first()
 
     if db_participation:
+        crud_feed.delete_activities(db, party_id, actor_id=user_id)
         db.delete(db_participation)
         db.commit()
+        publish_participant(party_id, user_id, None)
         return db_participation
         
     return None
@@ -206,15 +350,205 @@ def remove_participant(db: Session, party_id: str, user_id: str) -> Optional[Par
 def check_in_participant(db: Session, party_id: str, user_id: str) -> Optional[PartyParticipation]:
     """
     QR 코드를 통해 파티 참가자의 상태를 'ATTENDED'로 변경합니다 (체크인).
+    bulk_check_in 과 같이 승인(ACCEPTED)된 참가자만 바꾸며, 대기/거절 참가자는 상태를 그대로 둔 채 돌려줍니다.
+    (호출하는 쪽에서 반환된 status 로 거절 여부를 판단합니다.) 명단에 없으면 None
     """
-    participation = db.query(PartyParticipation).filter(
+    participation = db.query(PartyParticipation).options(joinedload(PartyParticipation.user)).filter(
         PartyParticipation.party_id == party_id,
         PartyParticipation.user_id == user_id
     ).first()
+    if not participation:
+        return None
 
-    if participation:
-        participation.status = PartyParticipantStatusEnum.ATTENDED
+    if participation.status == PartyParticipantStatusEnum.ACCEPTED:
+        # 상태 조건을 다시 걸어 동시에 들어온 다른 체크인/상태 변경과 겹쳐도 한 번만 바뀝니다.
+        changed = db.query(PartyParticipation)\
+            .filter(
+                PartyParticipation.party_id == party_id,
+                PartyParticipation.user_id == user_id,
+                PartyParticipation.status == PartyParticipantStatusEnum.ACCEPTED,
+            )\
+            .update({PartyParticipation.status: PartyParticipantStatusEnum.ATTENDED}, synchronize_session=False)
+        if changed:
+            crud_matching.touch_members(db, [party_id])
         db.commit()
         db.refresh(participation)
-        return participation
-    return None
\ No newline at end of file
+        if changed:
+            publish_participant(party_id, user_id, participation.status)
+
+    # Pydantic 스키마(PartyParticipantResponse)가 nickname을 요구하므로 동적 할당
+    setattr(participation, 'nickname', participation.user.nickname if participation.user else "Unknown")
+    return participation
+
+
+def bulk_check_in(db: Session, party_id: str, user_ids: List[str]) -> dict:
+    """
+    여러 참가자를 한 번에 'ATTENDED' 로 변경합니다. (호스트 기기에서 모아 보낸 체크인)
+    상태 조회 1회 + UPDATE 1문장이며, 같은 배치를 다시 보내도 결과가 같습니다(멱등).
+    입장권은 상태를 담지 않으므로(거절 전에 발급된 토큰도 만료 전까지 유효) 승인(ACCEPTED)된 참가자만 바꾸고,
+    대기/거절 참가자는 not_accepted 로 돌려줍니다.
+    반환: {"checked_in": [...], "already_attended": [...], "not_accepted": [...], "not_registered": [...]}
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    statuses = dict(
+        db.query(PartyParticipation.user_id, PartyParticipation.status)
+        .filter(PartyParticipation.party_id == party_id, PartyParticipation.user_id.in_(user_ids))
+        .all()
+    ) if user_ids else {}
+
+    to_check_in = [user_id for user_id, status in statuses.items() if status == PartyParticipantStatusEnum.ACCEPTED]
+    if to_check_in:
+        # 상태 조건을 다시 걸어 동시에 들어온 다른 배치와 겹쳐도 한 번만 바뀝니다.
+        db.query(PartyParticipation)\
+            .filter(
+                PartyParticipation.party_id == party_id,
+                PartyParticipation.user_id.in_(to_check_in),
+                PartyParticipation.status == PartyParticipantStatusEnum.ACCEPTED,
+            )\
+            .update({PartyParticipation.status: PartyParticipantStatusEnum.ATTENDED}, synchronize_session=False)
+        crud_matching.touch_members(db, [party_id])
+        db.commit()
+        for user_id in to_check_in:
+            publish_participant(party_id, user_id, PartyParticipantStatusEnum.ATTENDED)
+
+    return {
+        "checked_in": to_check_in,
+        "already_attended": [user_id for user_id, status in statuses.items() if status == PartyParticipantStatusEnum.ATTENDED],
+        "not_accepted": [
+            user_id for user_id, status in statuses.items()
+            if status in (PartyParticipantStatusEnum.PENDING, PartyParticipantStatusEnum.REJECTED)
+        ],
+        "not_registered": [user_id for user_id in user_ids if user_id not in statuses],
+    }
+
+
+# --------------------------------------------------------------------------
+# 파티 종료 후 처리 (백그라운드 작업)
+# --------------------------------------------------------------------------
+
+# 파티 종료 후 처리 작업 (종류, 우선순위)
+POST_PARTY_JOBS = (
+    ("finalize_submissions", 50),
+    ("credit_payout", 100),
+    ("party_impact", 100),
+)
+LIFECYCLE_BATCH_SIZE = 500
+
+
+def enqueue_post_party_jobs(db: Session, party_id: str) -> None:
+    """파티가 COMPLETED 로 바뀌는 트랜잭션 안에서 호출합니다. (파티당 한 번만 들어가도록 dedupe_key 사용)"""
+    for kind, priority in POST_PARTY_JOBS:
+        crud_job.enqueue(db, kind, {"party_id": party_id}, priority=priority, dedupe_key=f"{kind}:{party_id}")
+
+
+def complete_due_parties(db: Session, today: Optional[datetime.date] = None) -> int:
+    """
+    날짜가 지난 UPCOMING 파티를 COMPLETED 로 바꾸고 종료 후 작업을 넣습니다. 바뀐 파티 수를 반환합니다. (commit 은 호출한 쪽)
+    (status, date) 인덱스 범위로 대상을 찾아 LIFECYCLE_BATCH_SIZE 개씩 한 번의 UPDATE 로 바꿉니다.
+    UPDATE 에 status 조건이 있으므로 여러 워커가 동시에 실행해도 같은 파티를 두 번 처리하지 않습니다.
+    """
+    today = today or datetime.date.today()
+    completed = 0
+    while True:
+        due_ids = [
+            row[0] for row in db.query(Party.id)
+            .filter(Party.status == PartyStatusEnum.UPCOMING, Party.date < today)
+            .order_by(Party.date)
+            .limit(LIFECYCLE_BATCH_SIZE)
+            .all()
+        ]
+        if not due_ids:
+            break
+        # 다른 워커와 겹쳐 같은 파티에 작업을 다시 넣더라도 dedupe_key 로 한 번만 들어갑니다.
+        db.query(Party)\
+            .filter(Party.id.in_(due_ids), Party.status == PartyStatusEnum.UPCOMING)\
+            .update({Party.status: PartyStatusEnum.COMPLETED}, synchronize_session=False)
+        changed_ids = [
+            row[0] for row in db.query(Party.id)
+            .filter(Party.id.in_(due_ids), Party.status == PartyStatusEnum.COMPLETED)
+            .all()
+        ]
+        for party_id in changed_ids:
+            enqueue_post_party_jobs(db, party_id)
+        completed += len(changed_ids)
+        if len(due_ids) < LIFECYCLE_BATCH_SIZE:
+            break
+    return completed
+
+
+@jobs.handler("party_lifecycle")
+def run_party_lifecycle(db: Session, payload: dict) -> None:
+    completed = complete_due_parties(db)
+    if completed:
+        metrics.incr("parties_auto_completed", amount=completed)
+
+
+jobs.periodic("party_lifecycle", config.PARTY_LIFECYCLE_INTERVAL)
+
+
+@jobs.handler("finalize_submissions")
+def finalize_submissions(db: Session, payload: dict) -> None:
+    """끝난 파티에 검토되지 않고 남은 출품(PENDING)을 한 번에 REJECTED 로 정리합니다."""
+    party_id = payload["party_id"]
+    pending = [
+        ClothingItem.submitted_party_id == party_id,
+        ClothingItem.party_submission_status == PartySubmissionStatusEnum.PENDING,
+    ]
+    item_ids = [row[0] for row in db.query(ClothingItem.id).filter(*pending).all()]
+    if not item_ids:
+        return
+    db.query(ClothingItem)\
+        .filter(ClothingItem.id.in_(item_ids), *pending)\
+        .update({ClothingItem.party_submission_status: PartySubmissionStatusEnum.REJECTED}, synchronize_session=False)
+    crud_matching.touch(db, (None, party_id))
+    # commit 은 작업 실행기가 하므로 그 뒤에 비웁니다. (commit 전에 지우면 그 사이 조회가 PENDING 상태로 다시 채움)
+    # 워커가 별도 프로세스(python -m app.worker)일 수 있어 로컬 discard 대신 세대를 올려 모든 워커의 항목을 무효화합니다.
+    on_commit(db, crud_item.item_detail_cache.invalidate)
+
+
+@jobs.handler("party_impact")
+def compute_party_impact(db: Session, payload: dict) -> None:
+    """종료된 파티의 임팩트를 출품 데이터로 다시 계산해 저장합니다. (진행 중 누적된 증분 값을 확정)"""
+    party_id = payload["party_id"]
+    if db.query(Party.id).filter(Party.id == party_id).first() is None:
+        return
+    crud_impact.recompute(db, [party_id])
+
+
+@jobs.handler("credit_payout")
+def pay_attendance_credits(db: Session, payload: dict) -> None:
+    """
+    출석(ATTENDED) 참가자에게 참가 크레딧을 한 번에 지급합니다. (작업 완료 표시와 같은 트랜잭션)
+    party_payouts 에 이미 지급 기록이 있는 사용자는 건너뛰므로, 작업이 다시 들어와도 두 번 지급하지 않습니다.
+    (동시에 두 작업이 같은 사용자에게 지급하려 하면 PK 충돌로 한쪽이 롤백되고 재시도 시 건너뜀)
+    """
+    party_id = payload["party_id"]
+    party = db.query(Party.title, Party.status).filter(Party.id == party_id).first()
+    if party is None or party.status != PartyStatusEnum.COMPLETED:
+        return
+    paid = db.query(PartyPayout.user_id).filter(PartyPayout.party_id == party_id)
+    attendee_ids = [
+        row[0] for row in db.query(PartyParticipation.user_id)
+        .filter(
+            PartyParticipation.party_id == party_id,
+            PartyParticipation.status == PartyParticipantStatusEnum.ATTENDED,
+            PartyParticipation.user_id.not_in(paid),
+        )
+        .all()
+    ]
+    if not attendee_ids:
+        return
+    now = datetime.datetime.utcnow()
+    credits = [
+        {
+            "id": new_id(), "date": now, "activity_name": f"파티 참가: {party.title}",
+            "type": CreditTypeEnum.EARNED_EVENT, "amount": config.PARTY_ATTENDANCE_CREDITS, "user_id": user_id,
+        }
+        for user_id in attendee_ids
+    ]
+    db.execute(insert(PartyPayout), [
+        {"party_id": party_id, "user_id": credit["user_id"], "credit_id": credit["id"], "paid_at": now}
+        for credit in credits
+    ])
+    db.execute(insert(Credit), credits)
+
@@ -1,21 +1,32 @@
 from typing import Optional, List
-import uuid
 
 from sqlalchemy.orm import Session
 
+import os
+
 from app import models, schemas
+from app.core import images, jobs, fields as fieldsets
+from app.core.ids import new_id
+from app.crud import feed as crud_feed
+from app.crud import job as crud_job
 
 
-def create_post(db: Session, post_create: schemas.PostCreate, user_id: str) -> models.Post:
-    """새 게시글을 생성하고 DB에 저장합니다."""
+def create_post(db: Session, post_create: schemas.PostCreate, user_id: str, image_source: Optional[str] = None) -> models.Post:
+    """
+    새 게시글을 생성하고 DB에 저장합니다.
+    image_source(업로드 원본 경로)가 있으면 같은 트랜잭션에서 이미지 변환 작업을 넣습니다.
+    """
     db_post = models.Post(
-        post_id=str(uuid.uuid4()),          # 고유 ID 생성
+        post_id=new_id(),          # 고유 ID 생성
         user_id=user_id,
         title=post_create.title,
         content=post_create.content,
         image_url=post_create.image_url,    # ← 여기! PostCreate에서 가져옴
     )
     db.add(db_post)
+    crud_feed.record_activity(db, user_id, models.FeedVerbEnum.POST_CREATED, db_post.post_id, db_post.title)
+    if image_source:
+        _enqueue_image_variants(db, db_post.post_id, image_source, db_post.image_url)
     db.commit()
     db.refresh(db_post)
     return db_post
@@ -37,8 +48,30 @@ def get_post_list(db: Session, skip: int = 0, limit: int = 10) -> List[models.Po
     )
 
 
-def update_post(db: Session, db_post: models.Post, post_update: schemas.PostUpdate) -> models.Post:
-    """기존 게시글을 업데이트합니다."""
+# --- 희소 필드셋 (?fields=) ---
+# 필요한 컬럼만 조회하여 schemas.Post 형태의 dict 로 반환합니다. (content 를 빼면 본문 Text 를 읽지 않음)
+
+POST_COLUMNS = (
+    models.Post.post_id, models.Post.user_id, models.Post.title, models.Post.content,
+    models.Post.image_url, models.Post.created_at, models.Post.updated_at,
+)
+
+
+def get_post_list_rows(db: Session, skip: int = 0, limit: int = 10, fields: Optional[frozenset] = None) -> List[dict]:
+    """get_post_list 의 프로젝션 버전"""
+    columns = fieldsets.select(POST_COLUMNS, fields)
+    rows = (
+        db.query(*columns)
+        .order_by(models.Post.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    return [{column.key: value for column, value in zip(columns, row)} for row in rows]
+
+
+def update_post(db: Session, db_post: models.Post, post_update: schemas.PostUpdate, image_source: Optional[str] = None) -> models.Post:
+    """기존 게시글을 업데이트합니다. (새 이미지 원본이 있으면 변환 작업을 함께 넣음)"""
     # 요청에서 실제로 넘어온 필드만 가져오기
     update_data = post_update.model_dump(exclude_unset=True)
 
@@ -46,6 +79,8 @@ def update_post(db: Session, db_post: models.Post, post_update: schemas.PostUpda
         setattr(db_post, key, value)
 
     db.add(db_post)
+    if image_source:
+        _enqueue_image_variants(db, db_post.post_id, image_source, db_post.image_url)
     db.commit()
     db.refresh(db_post)
     return db_post
@@ -53,5 +88,37 @@ def update_post(db: Session, db_post: models.Post, post_update: schemas.PostUpda
 
 def delete_post(db: Session, db_post: models.Post) -> None:
     """특정 게시글을 삭제합니다."""
+    crud_feed.delete_activities(db, db_post.post_id)
     db.delete(db_post)
     db.commit()
+
+
+# --------------------------------------------------------------------------
+# 이미지 변환 (백그라운드 작업)
+# --------------------------------------------------------------------------
+
+def _enqueue_image_variants(db: Session, post_id: str, source: str, original_url: str) -> None:
+    crud_job.enqueue(
+        db, "image_variants",
+        {"post_id": post_id, "source": source, "original_url": original_url},
+        priority=50,
+    )
+
+
+@jobs.handler("image_variants", visibility_timeout=120)
+def make_post_image_variants(db: Session, payload: dict) -> None:
+    """업로드 원본을 1080px JPEG + 썸네일로 변환하고 게시글 image_url 을 변환본으로 바꿉니다."""
+    source = payload["source"]
+    main_path = images.variant_path(source)
+    if os.path.exists(source):
+        main_path = images.make_variants(source)[0]
+    elif not os.path.exists(main_path):
+        return  # 원본도 변환본도 없음 (게시글 삭제 등)
+
+    # 그 사이 다른 이미지로 바뀌지 않은 경우에만 교체
+    db.query(models.Post)\
+        .filter(models.Post.post_id == payload["post_id"], models.Post.image_url == payload["original_url"])\
+        .update({models.Post.image_url: "/" + main_path.replace(os.sep, "/")}, synchronize_session=False)
+    if os.path.exists(source):
+        os.remove(source)
+
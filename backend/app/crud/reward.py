@@ -1,14 +1,20 @@
-import uuid, datetime
+import datetime
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.models import Reward
-from app.schemas import RewardCreate, RewardUpdate
+from app.schemas import RewardCreate, RewardUpdate, RewardResponse
+from app.core.cache import Cache, cached
+from app.core.ids import new_id
+
+# 리워드 목록 캐시 (관리자 생성/수정/삭제 시 무효화)
+reward_cache = Cache("rewards")
 
 # --- 조회 (Read) ---
 
-def get_rewards(db: Session) -> List[Reward]:
-    """교환 가능한 모든 리워드 상품 목록을 조회합니다."""
+@cached(reward_cache, List[RewardResponse])
+def get_rewards(db: Session) -> List[RewardResponse]:
+    """교환 가능한 모든 리워드 상품 목록을 조회합니다. (캐시됨)"""
     return db.query(Reward).all()
 
 def get_reward(db: Session, reward_id: str) -> Reward | None:
@@ -18,12 +24,13 @@ def get_reward(db: Session, reward_id: str) -> Reward | None:
 
 def create_reward(db: Session, reward: RewardCreate) -> Reward:
     db_reward = Reward(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         **reward.model_dump()
     )
     db.add(db_reward)
     db.commit()
     db.refresh(db_reward)
+    reward_cache.invalidate()
     return db_reward
 
 def update_reward(db: Session, reward_id: str, reward_in: RewardUpdate) -> Reward | None:
@@ -38,6 +45,7 @@ def update_reward(db: Session, reward_id: str, reward_in: RewardUpdate) -> Rewar
     db.add(db_reward)
     db.commit()
     db.refresh(db_reward)
+    reward_cache.invalidate()
     return db_reward
 
 def delete_reward(db: Session, reward_id: str) -> bool:
@@ -47,4 +55,5 @@ def delete_reward(db: Session, reward_id: str) -> bool:
     
     db.delete(db_reward)
     db.commit()
+    reward_cache.invalidate()
     return True
\ No newline at end of file
@@ -1,15 +1,30 @@
-import uuid
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, joinedload, selectinload, make_transient_to_detached
+from sqlalchemy import desc, func
 from typing import List, Optional
 
-from app.models import Story, Tag, User, PerformanceReport, Comment
+from app.models import Story, Tag, User, PerformanceReport, Comment, FeedVerbEnum, story_likes, story_tags
 from app.schemas import StoryCreate, StoryUpdate, PerformanceReportCreate, CommentCreate
+from app.core import fields as fieldsets
+from app.core.cache import Cache
+from app.core.ids import new_id
+from app.crud import feed as crud_feed
+
+# 태그 이름 -> id 캐시. DB에서 조회된(커밋된) 태그만 저장하므로
+# 롤백된 트랜잭션에서 만든 태그 id 가 캐시에 남지 않습니다.
+tag_cache = Cache("tags")
 
 # --- Helper Functions ---
 def get_or_create_tag(db: Session, name: str) -> Tag:
+    tag_id = tag_cache.get(name)
+    if tag_id is not None:
+        # 이미 존재하는 태그는 SELECT 없이 세션에 연결합니다.
+        db_tag = Tag(id=tag_id, name=name)
+        make_transient_to_detached(db_tag)
+        return db.merge(db_tag, load=False)
+
     db_tag = db.query(Tag).filter(Tag.name == name).first()
     if db_tag:
+        tag_cache.set(name, db_tag.id)
         return db_tag
     db_tag = Tag(name=name)
     db.add(db_tag)
@@ -18,18 +33,84 @@ def get_or_create_tag(db: Session, name: str) -> Tag:
 
 # --- Story CRUD ---
 def get_stories(db: Session, skip: int = 0, limit: int = 20) -> List[Story]:
+    # 컬렉션은 selectinload 로 따로 로드하여 limit 과 조인 행 폭증을 피하고,
+    # 좋아요 누른 유저는 liked_by(id 목록)만 필요하므로 id 컬럼만 로드합니다.
     return db.query(Story)\
-        .options(joinedload(Story.tags), joinedload(Story.likers))\
+        .options(selectinload(Story.tags), selectinload(Story.likers).load_only(User.id))\
         .order_by(Story.id.desc())\
         .offset(skip)\
         .limit(limit)\
         .all()
 
+# --- 빠른 직렬화 경로 (FAST_JSON) ---
+
+STORY_COLUMNS = (
+    Story.title, Story.excerpt, Story.content, Story.image_url,
+    Story.id, Story.user_id, Story.party_id, Story.author,
+)
+
+def get_stories_rows(db: Session, skip: int = 0, limit: int = 20, fields: Optional[frozenset] = None) -> List[dict]:
+    """
+    get_stories 의 프로젝션 버전 (StoryResponse 형태의 dict 목록)
+    태그와 좋아요는 연관 테이블에서 스토리 ID 목록으로 한 번씩만 조회하며 User 행은 읽지 않습니다.
+    fields(?fields=) 를 주면 그 컬럼만 조회하고, 고르지 않은 태그/좋아요 쿼리는 생략합니다.
+    (likes 만 고르면 좋아요는 id 목록 대신 스토리별 개수만 셉니다)
+    """
+    columns = fieldsets.select(STORY_COLUMNS, fields)
+    rows = db.query(*columns)\
+        .order_by(Story.id.desc())\
+        .offset(skip)\
+        .limit(limit)\
+        .all()
+    story_ids = [row.id for row in rows]
+
+    with_tags = fieldsets.wants(fields, "tags")
+    with_liked_by = fieldsets.wants(fields, "liked_by")
+    with_likes = fieldsets.wants(fields, "likes")
+    tags = {story_id: [] for story_id in story_ids}
+    liked_by = {story_id: [] for story_id in story_ids}
+    like_counts = {story_id: 0 for story_id in story_ids}
+    if story_ids and with_tags:
+        tag_rows = db.query(story_tags.c.story_id, Tag.name, Tag.id)\
+            .join(Tag, Tag.id == story_tags.c.tag_id)\
+            .filter(story_tags.c.story_id.in_(story_ids))\
+            .all()
+        for story_id, name, tag_id in tag_rows:
+            tags[story_id].append({"name": name, "id": tag_id})
+
+    if story_ids and with_liked_by:
+        like_rows = db.query(story_likes.c.story_id, story_likes.c.user_id)\
+            .filter(story_likes.c.story_id.in_(story_ids))\
+            .all()
+        for story_id, user_id in like_rows:
+            liked_by[story_id].append(user_id)
+            like_counts[story_id] += 1
+    elif story_ids and with_likes:
+        like_counts.update(
+            db.query(story_likes.c.story_id, func.count())
+            .filter(story_likes.c.story_id.in_(story_ids))
+            .group_by(story_likes.c.story_id)
+            .all()
+        )
+
+    results = []
+    for row in rows:
+        data = {column.key: value for column, value in zip(columns, row)}
+        if with_tags:
+            data["tags"] = tags[row.id]
+        if with_likes:
+            data["likes"] = like_counts[row.id]
+        if with_liked_by:
+            data["liked_by"] = liked_by[row.id]
+        results.append(data)
+    return results
+
 def get_story(db: Session, story_id: str) -> Story | None:
+    # 컬렉션 셋을 한 번에 JOIN 하면 행이 (댓글 x 태그 x 좋아요) 만큼 늘어나므로 태그/좋아요는 IN 조회로 따로 읽습니다.
     return db.query(Story).options(
         joinedload(Story.comments),
-        joinedload(Story.tags),
-        joinedload(Story.likers)
+        selectinload(Story.tags),
+        selectinload(Story.likers)
     ).filter(Story.id == story_id).first()
 
 def create_story(db: Session, story: StoryCreate, user_id: str, author_nickname: str) -> Story:
@@ -38,7 +119,7 @@ def create_story(db: Session, story: StoryCreate, user_id: str, author_nickname:
     
     db_story = Story(
         **story_data,
-        id=str(uuid.uuid4()),
+        id=new_id(),
         user_id=user_id,
         author=author_nickname
     )
@@ -50,6 +131,7 @@ def create_story(db: Session, story: StoryCreate, user_id: str, author_nickname:
             db_story.tags.append(db_tag)
         
     db.add(db_story)
+    crud_feed.record_activity(db, user_id, FeedVerbEnum.STORY_CREATED, db_story.id, db_story.title)
     db.commit()
     db.refresh(db_story)
     return db_story
@@ -75,6 +157,7 @@ def update_story(db: Session, db_story: Story, story_in: StoryUpdate) -> Story:
 def delete_story(db: Session, story_id: str) -> bool:
     db_story = db.query(Story).filter(Story.id == story_id).first()
     if db_story:
+        crud_feed.delete_activities(db, db_story.id)
         db.delete(db_story)
         db.commit()
         return True
@@ -99,9 +182,12 @@ def toggle_like(db: Session, story_id: str, user_id: str) -> Story | None:
     return story
 
 # --- Comment CRUD ---
-def create_comment(db: Session, comment: CommentCreate, story_id: str, user_id: str, author_nickname: str) -> Comment:
+def create_comment(db: Session, comment: CommentCreate, story_id: str, user_id: str, author_nickname: str) -> Comment | None:
+    """스토리에 댓글을 작성합니다. 스토리가 없으면 None (API 레벨에서 404 처리)"""
+    if db.query(Story.id).filter(Story.id == story_id).first() is None:
+        return None
     db_comment = Comment(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         text=comment.text,
         story_id=story_id,
         user_id=user_id,
@@ -122,7 +208,7 @@ def get_reports(db: Session, skip: int = 0, limit: int = 20) -> List[Performance
 
 def create_report(db: Session, report: PerformanceReportCreate) -> PerformanceReport:
     db_report = PerformanceReport(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         title=report.title,
         date=report.date,
         excerpt=report.excerpt
@@ -1,9 +1,14 @@
-import uuid
+from typing import Optional
+
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 from passlib.context import CryptContext
 
-from app.models import User
+from app.models import User, user_neighbors
 from app.schemas import UserCreate, UserUpdate
+from app.core import config, etag
+from app.core.ids import new_id
+from app.crud import feed as crud_feed
 
 # 비밀번호 해싱을 위한 설정
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
@@ -37,7 +42,7 @@ def create_user(db: Session, user: UserCreate) -> User:
     hashed_password = get_password_hash(user.password)
     
     db_user = User(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         email=user.email,
         nickname=user.nickname,
         hashed_password=hashed_password, # 모델에 이 필드가 있어야 함
@@ -58,10 +63,14 @@ def update_user(db: Session, db_user: User, user_in: UserUpdate) -> User:
     # Pydantic 모델에서 업데이트할 데이터만 가져옵니다 (None 값 제외)
     update_data = user_in.model_dump(exclude_unset=True)
     
+    nickname_changed = "nickname" in update_data and update_data["nickname"] != db_user.nickname
     for key, value in update_data.items():
         setattr(db_user, key, value)
         
     db.add(db_user)
+    if nickname_changed:
+        # 파티 상세/참가자 응답의 닉네임이 바뀌므로 그 ETag 만 무효화합니다. (users 테이블은 추적하지 않음)
+        etag.bump(db.connection(), ["party_participations"])
     db.commit()
     db.refresh(db_user)
     return db_user
@@ -71,6 +80,42 @@ def get_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
     """사용자 목록을 조회합니다."""
     return db.query(User).offset(skip).limit(limit).all()
 
+# --- 빠른 직렬화 경로 (FAST_JSON) ---
+
+USER_COLUMNS = (
+    User.nickname, User.email, User.phone_number, User.id, User.is_admin,
+    User.following_count, User.follower_count,
+)
+
+def get_users_rows(db: Session, skip: int = 0, limit: int = 100) -> list[dict]:
+    """
+    get_users 의 프로젝션 버전 (UserResponse 형태의 dict 목록)
+    이웃 목록은 User 객체를 로드하지 않고 user_neighbors 에서 사용자별 앞 USER_NEIGHBORS_PREVIEW 개의 id 만 한 번에 조회합니다.
+    """
+    rows = db.query(*USER_COLUMNS).offset(skip).limit(limit).all()
+    neighbors = {row.id: [] for row in rows}
+    if neighbors:
+        ranked = select(
+            user_neighbors.c.user_id,
+            user_neighbors.c.neighbor_id,
+            func.row_number().over(
+                partition_by=user_neighbors.c.user_id, order_by=user_neighbors.c.neighbor_id
+            ).label("rank"),
+        ).where(user_neighbors.c.user_id.in_(list(neighbors))).subquery()
+        neighbor_rows = db.query(ranked.c.user_id, ranked.c.neighbor_id)\
+            .filter(ranked.c.rank <= config.USER_NEIGHBORS_PREVIEW)\
+            .order_by(ranked.c.user_id, ranked.c.neighbor_id)\
+            .all()
+        for user_id, neighbor_id in neighbor_rows:
+            neighbors[user_id].append(neighbor_id)
+
+    results = []
+    for row in rows:
+        data = {column.key: value for column, value in zip(USER_COLUMNS, row)}
+        data["neighbors"] = neighbors[row.id]
+        results.append(data)
+    return results
+
 # [추가] 로그인 검증 (이메일과 비밀번호 확인)
 def authenticate_user(db: Session, email: str, password: str) -> User | None:
     user = get_user_by_email(db, email)
@@ -80,30 +125,125 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
         return None
     return user
 
+# --- 이웃 (팔로우 그래프) ---
+# 이웃 관계는 user_neighbors 에 직접 insert / delete 하고, 실제로 행이 바뀐 경우에만
+# 양쪽 사용자의 이웃 수를 같은 트랜잭션에서 증감합니다. (neighbors 컬렉션을 로드하지 않음)
+
+def _insert_ignore(db: Session, table, values: dict) -> int:
+    """이미 있는 행이면 무시하는 insert. 새로 들어간 행 수(0 또는 1)를 반환합니다."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return db.execute(insert(table).values(**values).on_conflict_do_nothing()).rowcount
+
+
+def _adjust_neighbor_counts(db: Session, user_id: str, neighbor_id: str, delta: int) -> None:
+    db.query(User).filter(User.id == user_id)\
+        .update({User.following_count: User.following_count + delta}, synchronize_session=False)
+    db.query(User).filter(User.id == neighbor_id)\
+        .update({User.follower_count: User.follower_count + delta}, synchronize_session=False)
+
+
+def _neighbor_status(db: Session, user_id: str, neighbor_id: str, is_neighbor: bool) -> dict:
+    counts = dict(
+        db.query(User.id, User.following_count).filter(User.id == user_id).all()
+        + db.query(User.id, User.follower_count).filter(User.id == neighbor_id).all()
+    )
+    return {
+        "user_id": user_id,
+        "neighbor_id": neighbor_id,
+        "is_neighbor": is_neighbor,
+        "following_count": counts.get(user_id, 0),
+        "neighbor_follower_count": counts.get(neighbor_id, 0),
+    }
+
+
+def _user_exists(db: Session, user_id: str) -> bool:
+    return db.query(User.id).filter(User.id == user_id).first() is not None
+
+
 # [추가] 이웃 추가 (팔로우)
-def add_neighbor(db: Session, db_user: User, neighbor_id: str) -> User:
-    # 팔로우할 대상 조회s
-    neighbor = get_user(db, neighbor_id)
-    if not neighbor:
+def add_neighbor(db: Session, user_id: str, neighbor_id: str) -> dict | None:
+    """이웃을 추가합니다. 대상 사용자가 없으면 None. 이미 이웃이면 아무것도 바꾸지 않습니다."""
+    if not _user_exists(db, neighbor_id):
         return None
-    
-    # 이미 이웃인지 확인 (SQLAlchemy 관계 객체에서 확인 가능)
-    if neighbor not in db_user.neighbors:
-        db_user.neighbors.append(neighbor)
-        db.commit()
-        db.refresh(db_user)
-    
-    return db_user
+    if _insert_ignore(db, user_neighbors, {"user_id": user_id, "neighbor_id": neighbor_id}):
+        _adjust_neighbor_counts(db, user_id, neighbor_id, 1)
+    db.commit()
+    return _neighbor_status(db, user_id, neighbor_id, True)
 
 # [추가] 이웃 삭제 (언팔로우)
-def remove_neighbor(db: Session, db_user: User, neighbor_id: str) -> User:
-    neighbor = get_user(db, neighbor_id)
-    if not neighbor:
+def remove_neighbor(db: Session, user_id: str, neighbor_id: str) -> dict | None:
+    """이웃을 삭제합니다. 대상 사용자가 없으면 None."""
+    if not _user_exists(db, neighbor_id):
         return None
+    deleted = db.execute(
+        user_neighbors.delete().where(
+            user_neighbors.c.user_id == user_id,
+            user_neighbors.c.neighbor_id == neighbor_id,
+        )
+    ).rowcount
+    if deleted:
+        _adjust_neighbor_counts(db, user_id, neighbor_id, -1)
+        # 이미 타임라인에 복사된 그 이웃의 활동도 같은 트랜잭션에서 지웁니다.
+        crud_feed.remove_actor_entries(db, user_id, neighbor_id)
+    db.commit()
+    return _neighbor_status(db, user_id, neighbor_id, False)
 
-    if neighbor in db_user.neighbors:
-        db_user.neighbors.remove(neighbor)
-        db.commit()
-        db.refresh(db_user)
-        
-    return db_user
\ No newline at end of file
+
+def _id_page(query, column, cursor: Optional[str], limit: int) -> dict:
+    """column 순서의 keyset 페이지네이션 (cursor = 이전 페이지의 마지막 id)"""
+    if cursor:
+        query = query.filter(column > cursor)
+    ids = [row[0] for row in query.order_by(column).limit(limit + 1).all()]
+    has_more = len(ids) > limit
+    ids = ids[:limit]
+    return {"items": ids, "next_cursor": ids[-1] if has_more else None}
+
+
+def get_neighbor_ids(db: Session, user_id: str, cursor: Optional[str] = None, limit: int = 50) -> dict:
+    """user_id 가 추가한 이웃 id 목록 (PK (user_id, neighbor_id) 범위 스캔)"""
+    query = db.query(user_neighbors.c.neighbor_id).filter(user_neighbors.c.user_id == user_id)
+    return _id_page(query, user_neighbors.c.neighbor_id, cursor, limit)
+
+
+def get_all_neighbor_ids(db: Session, user_id: str) -> list[str]:
+    """user_id 가 추가한 이웃 id 전체 (본인 응답용. 다른 사용자 응답은 User.neighbor_ids 로 일부만 담음)"""
+    rows = db.query(user_neighbors.c.neighbor_id)\
+        .filter(user_neighbors.c.user_id == user_id)\
+        .order_by(user_neighbors.c.neighbor_id)\
+        .all()
+    return [row[0] for row in rows]
+
+
+def get_follower_ids(db: Session, user_id: str, cursor: Optional[str] = None, limit: int = 50) -> dict:
+    """user_id 를 이웃으로 추가한 사용자 id 목록 (ix_user_neighbors_neighbor_id_user_id 범위 스캔)"""
+    query = db.query(user_neighbors.c.user_id).filter(user_neighbors.c.neighbor_id == user_id)
+    return _id_page(query, user_neighbors.c.user_id, cursor, limit)
+
+
+def get_mutual_neighbor_ids(db: Session, user_id: str, cursor: Optional[str] = None, limit: int = 50) -> dict:
+    """
+    서로이웃 id 목록 (내가 추가했고, 상대도 나를 추가한 사용자)
+    내 이웃을 PK 로 범위 스캔하고, 역방향 관계는 상대의 PK (user_id, neighbor_id) 로 한 건씩 확인합니다.
+    """
+    mine = user_neighbors.alias("mine")
+    theirs = user_neighbors.alias("theirs")
+    query = db.query(mine.c.neighbor_id)\
+        .join(theirs, and_(theirs.c.user_id == mine.c.neighbor_id, theirs.c.neighbor_id == mine.c.user_id))\
+        .filter(mine.c.user_id == user_id)
+    return _id_page(query, mine.c.neighbor_id, cursor, limit)
+
+
+def recount_neighbors(db: Session) -> None:
+    """user_neighbors 기준으로 모든 사용자의 이웃 수를 다시 계산합니다. (대량 적재 후 사용)"""
+    following = select(func.count()).select_from(user_neighbors)\
+        .where(user_neighbors.c.user_id == User.id).scalar_subquery()
+    followers = select(func.count()).select_from(user_neighbors)\
+        .where(user_neighbors.c.neighbor_id == User.id).scalar_subquery()
+    db.query(User).update(
+        {User.following_count: following, User.follower_count: followers}, synchronize_session=False
+    )
+    db.commit()
@@ -1,23 +1,102 @@
 # 데이터베이스 연결설정
 # 일단 로컬이나 소규모에서는 sqlite 이후 postgresql/mysql로 변경
 # app/database.py
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 # 1. SQLite 데이터베이스 파일 경로를 지정합니다.
 #    이 코드는 백엔드 프로젝트의 루트 폴더에 'ot-gil.db'라는 파일을 생성하여 데이터베이스로 사용합니다.
-SQLALCHEMY_DATABASE_URL = "sqlite:///./ot-gil.db"
+#    DATABASE_URL 환경변수가 있으면 그 값을 사용합니다. (벤치마크/시드 데이터용 DB 분리)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ot-gil.db")
 
-# 2. 데이터베이스 엔진을 생성합니다.
+# 2. 데이터베이스 엔진은 import 시점이 아니라 처음 필요할 때(앱 lifespan 시작 시) 생성합니다.
 #    'connect_args={"check_same_thread": False}'는 SQLite를 사용할 때만 필요한 옵션입니다.
 #    FastAPI가 여러 스레드에서 데이터베이스에 안전하게 접근할 수 있도록 허용해줍니다.
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+_engine = None
+
+
+def get_engine():
+    """엔진을 (한 번만) 생성하고 SessionLocal 에 연결합니다."""
+    global _engine
+    if _engine is None:
+        connect_args = {"check_same_thread": False} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else {}
+        _engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args=connect_args)
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
 
-# 3. 데이터베이스 세션 생성을 위한 클래스를 만듭니다.
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def dispose_engine() -> None:
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
+
+
+# 3. 데이터베이스 세션 생성을 위한 클래스를 만듭니다. (bind 는 get_engine() 에서 연결)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
 
 # 4. SQLAlchemy 모델들이 상속받을 Base 클래스를 만듭니다.
 Base = declarative_base()
+
+
+# commit 이 끝난 뒤 실행할 작업 (캐시 무효화 등). commit 을 호출하는 쪽(작업 실행기 등)을 몰라도 등록할 수 있고,
+# commit 전에 지운 캐시를 다른 요청이 옛 데이터로 다시 채우는 일이 없습니다. 롤백되면 버립니다.
+def on_commit(session: Session, fn) -> None:
+    session.info.setdefault("on_commit", []).append(fn)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session: Session) -> None:
+    for fn in session.info.pop("on_commit", []):
+        fn()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_on_commit(session: Session) -> None:
+    session.info.pop("on_commit", None)
+
+
+# 5. 스키마 버전 확인
+#    테이블 생성/변경은 Alembic 마이그레이션(backend/alembic)으로만 합니다.
+#    앱은 시작 시 DB의 리비전이 코드의 head 리비전과 같은지만 확인합니다.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ALEMBIC_INI = os.path.join(BACKEND_DIR, "alembic.ini")
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    cfg = Config(ALEMBIC_INI)
+    cfg.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    cfg.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
+    return cfg
+
+
+def head_revision() -> str:
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(engine) -> str | None:
+    from alembic.runtime.migration import MigrationContext
+
+    with engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def verify_schema_revision(engine) -> None:
+    """DB 스키마가 최신 마이그레이션과 다르면 SchemaVersionError 를 발생시킵니다. (DDL 은 실행하지 않음)"""
+    current, head = current_revision(engine), head_revision()
+    if current != head:
+        raise SchemaVersionError(
+            f"DB 스키마 리비전({current})이 코드의 head 리비전({head})과 다릅니다. "
+            f"backend 폴더에서 'alembic upgrade head' 를 실행하세요."
+        )
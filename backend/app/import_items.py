@@ -0,0 +1,67 @@
+"""
+아이템 일괄 등록 CLI (POST /items/import 와 같은 검증/저장 경로)
+
+    python -m app.import_items --user-id <사용자 ID> items.csv
+    python -m app.import_items --user-id <사용자 ID> --party-id <파티 ID> intake.ndjson
+    python -m app.import_items --user-id <사용자 ID> --format ndjson - < items.jsonl
+
+실패한 행은 "행 번호: 오류" 로 stderr 에 출력하고, 하나라도 있으면 exit code 1 로 끝납니다.
+"""
+import argparse
+import io
+import sys
+
+from app.core import item_import
+from app.database import SessionLocal, get_engine, verify_schema_revision
+from app.models import User, Party, PartyStatusEnum
+from app.crud import item as crud_item
+
+
+def open_input(path: str):
+    # 엑셀에서 저장한 CSV 의 BOM 은 utf-8-sig 가 제거합니다.
+    if path == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", errors="replace", newline="")
+    return open(path, encoding="utf-8-sig", errors="replace", newline="")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="아이템 일괄 등록")
+    parser.add_argument("path", help="CSV / NDJSON 파일 경로 ('-' 이면 표준 입력)")
+    parser.add_argument("--user-id", required=True, help="아이템을 등록할 사용자 ID")
+    parser.add_argument("--party-id", default=None, help="출품(PENDING)할 파티 ID")
+    parser.add_argument("--format", choices=item_import.FORMATS, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or item_import.format_for(args.path)
+    if fmt is None:
+        parser.error("--format 을 지정하거나 .csv / .ndjson / .jsonl 파일을 주세요.")
+
+    verify_schema_revision(get_engine())
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == args.user_id).first()
+        if user is None:
+            parser.error(f"사용자를 찾을 수 없습니다: {args.user_id}")
+        if args.party_id is not None:
+            status = db.query(Party.status).filter(Party.id == args.party_id).scalar()
+            if status != PartyStatusEnum.UPCOMING:
+                parser.error(f"진행 예정인 파티가 아닙니다: {args.party_id}")
+
+        with open_input(args.path) as lines:
+            result = crud_item.import_items(
+                db, item_import.parse_records(lines, fmt), user.id, user.nickname,
+                party_id=args.party_id, chunk_size=args.chunk_size,
+            )
+    finally:
+        db.close()
+
+    for error in result["errors"]:
+        print(f"{error['row']}: {error['error']}", file=sys.stderr)
+    print(f"[import] imported {result['imported']} (goodbye tags {result['goodbye_tags']}), failed {result['failed']}")
+    if result["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
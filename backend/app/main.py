@@ -1,22 +1,52 @@
-import os
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import StatementError
 
 # 가정: app/api/routers/ 디렉토리 내에 7개의 파일을 생성
 from app.api.routers import user, item, party, community, maker, credit, admin,reward, story, clothing, post
 
-# 가정: app/database.py에 Base와 engine이 정의되어 있음
-from app.database import Base, engine
+# 엔진은 lifespan 에서 생성하고, 스키마는 Alembic 마이그레이션으로 관리합니다.
+# (import 시점의 create_all 제거: 워커마다 DDL 검사를 하지 않고 동시 기동 시 DDL 경합도 없음)
+from app.database import get_engine, dispose_engine, verify_schema_revision, SchemaVersionError
 from app import models
+from app.core import config, jobs
+from app.core.ids import MalformedIdError
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.responses import ORJSONResponse
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    engine = get_engine()
+    if config.SCHEMA_CHECK != "off":
+        try:
+            verify_schema_revision(engine)
+        except SchemaVersionError:
+            if config.SCHEMA_CHECK == "strict":
+                raise
+            logger.warning("스키마 리비전 불일치", exc_info=True)
+    # 백그라운드 작업 워커 (JOB_WORKERS=0 이면 별도 프로세스 'python -m app.worker' 로 실행)
+    jobs.start_runner()
+    yield
+    jobs.stop_runner()
+    dispose_engine()
 
-# 애플리케이션 시작 시 데이터베이스 테이블 생성 (개발용)
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="ot-gil",
     description="지속가능한 의류 교환을 위한 플랫폼",
     version="1.0.0",
+    # FAST_JSON 사용 시 모든 응답을 orjson 으로 인코딩
+    default_response_class=ORJSONResponse if config.FAST_JSON else JSONResponse,
+    lifespan=lifespan,
 )
 origins = [
     "http://localhost:3000", # 리액트/뷰 프론트엔드 개발 서버 주소
@@ -24,6 +54,11 @@ origins = [
     # "https://your-frontend-domain.com" # 나중에 배포하면 실제 도메인 추가
 ]
 # --- 미들웨어 설정 ---
+# Idempotency-Key (재시도된 적립/교환/등록 요청을 한 번만 실행). 나중에 추가한 CORS 가 바깥에서 감쌉니다.
+app.add_middleware(IdempotencyMiddleware)
+# 응답 압축 (br/gzip, COMPRESS_MIN_BYTES 이상). Idempotency 바깥에 두어 저장/재생되는 응답은 압축 전 원본입니다.
+if config.COMPRESSION:
+    app.add_middleware(CompressionMiddleware)
 # CORS (Cross-Origin Resource Sharing) 설정
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +68,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- 예외 처리 ---
+@app.exception_handler(StatementError)
+async def malformed_id_handler(request: Request, exc: StatementError):
+    """
+    UUID 형식이 아닌 id(경로/쿼리 파라미터 등)는 CompactUUID 바인딩에서 거절됩니다.
+    그런 id 와 일치하는 행은 있을 수 없으므로 404 로 응답하고, 그 밖의 문장 오류는 그대로 500 입니다.
+    """
+    if isinstance(exc.orig, MalformedIdError):
+        return JSONResponse(status_code=404, content={"detail": "찾을 수 없습니다. (올바른 id 형식이 아닙니다)"})
+    raise exc
+
 # /static URL로 static 디렉토리 서빙
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -1,14 +1,49 @@
 # SQL Alchemy 데이터 베이스 모델 
 import enum
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Table, Enum as DBEnum, JSON
-from sqlalchemy.orm import relationship, declarative_base
+import uuid
+from sqlalchemy import Column, Integer, String, Text, Boolean, Date, DateTime, ForeignKey, Table, Index, Enum as DBEnum, JSON, LargeBinary
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import relationship, object_session
 from sqlalchemy.sql import func
 import datetime
-from app.database import Base
 
-# SQLAlchemy Base 클래스 생성
-Base = declarative_base()
+# SQLAlchemy Base 클래스는 app/database.py 에 하나만 정의합니다.
 from app.database import Base
+from app.core import config, impact as impact_stats
+from app.core.ids import parse_id
+# --- 컬럼 타입 ---
+class CompactUUID(TypeDecorator):
+    """
+    id 컬럼 타입. 파이썬/API 에서는 지금처럼 UUID 문자열을 쓰고,
+    DB 에는 16바이트로 저장합니다. (PostgreSQL: 네이티브 uuid, 그 외: BLOB(16))
+    36자 문자열 대비 PK/FK 인덱스와 조인 페이지가 절반 이하로 줄어듭니다.
+    새 id 는 app.core.ids.new_id() (시간 순서 UUIDv7) 로 만듭니다.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # UUID 형식이 아닌 값은 조회 조건이든 저장(INSERT/UPDATE/executemany)이든 MalformedIdError 로 막습니다.
+        # (NULL 로 바인딩하면 잘못된 id 가 조용히 NULL 로 저장됨) 요청에서 온 경우 main.py 에서 404 로 바꿉니다.
+        parsed = parse_id(value)
+        return str(parsed) if dialect.name == "postgresql" else parsed.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(uuid.UUID(bytes=bytes(value)))
+        return str(value)
+
+
 # --- Enum 정의 ---
 # TypeScript: export type ClothingCategory = 'TSHIRT' | 'JEANS' | 'DRESS' | 'JACKET' | 'ACCESSORY';
 class ClothingCategoryEnum(enum.Enum):
@@ -51,20 +86,36 @@ class PartyStatusEnum(enum.Enum):
     COMPLETED = 'COMPLETED'
     REJECTED = 'REJECTED'
 
+# 이웃 피드 활동 종류
+class FeedVerbEnum(enum.Enum):
+    STORY_CREATED = 'STORY_CREATED'
+    ITEM_LISTED = 'ITEM_LISTED'
+    POST_CREATED = 'POST_CREATED'
+    PARTY_JOINED = 'PARTY_JOINED'
+
+# 백그라운드 작업 상태
+class JobStatusEnum(enum.Enum):
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+
 # User.neighbors (self-referential many-to-many)
 user_neighbors = Table(
     'user_neighbors',
     Base.metadata,
-    Column('user_id', String, ForeignKey('users.id'), primary_key=True),
-    Column('neighbor_id', String, ForeignKey('users.id'), primary_key=True)
+    Column('user_id', CompactUUID, ForeignKey('users.id'), primary_key=True),
+    Column('neighbor_id', CompactUUID, ForeignKey('users.id'), primary_key=True),
+    # PK (user_id, neighbor_id) 는 "내가 추가한 이웃", 이 인덱스는 "나를 추가한 사용자" 조회용
+    Index('ix_user_neighbors_neighbor_id_user_id', 'neighbor_id', 'user_id'),
 )
 
 # Story.likedBy (Story <-> User)
 story_likes = Table(
     'story_likes',
     Base.metadata,
-    Column('story_id', String, ForeignKey('stories.id'), primary_key=True),
-    Column('user_id', String, ForeignKey('users.id'), primary_key=True)
+    Column('story_id', CompactUUID, ForeignKey('stories.id'), primary_key=True),
+    Column('user_id', CompactUUID, ForeignKey('users.id'), primary_key=True)
 )
 
 # Story.tags (Story <-> Tag)
@@ -72,7 +123,7 @@ story_likes = Table(
 story_tags = Table(
     'story_tags',
     Base.metadata,
-    Column('story_id', String, ForeignKey('stories.id'), primary_key=True),
+    Column('story_id', CompactUUID, ForeignKey('stories.id'), primary_key=True),
     Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True)
 )
 # --- 모델 정의 ---
@@ -80,12 +131,15 @@ story_tags = Table(
 class User(Base):
     __tablename__ = 'users'
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     nickname = Column(String, unique=True, nullable=False)
     email = Column(String, unique=True, nullable=False)
     phone_number = Column(String, nullable=True)
     is_admin = Column(Boolean, default=False)
     hashed_password = Column(String, nullable=False)
+    # 이웃 수 (이웃 추가/삭제 시 crud_user 에서 함께 증감)
+    following_count = Column(Integer, nullable=False, default=0, server_default='0')
+    follower_count = Column(Integer, nullable=False, default=0, server_default='0')
     # Relationships
     # `neighbors` (self-referential many-to-many)
     neighbors = relationship(
@@ -115,10 +169,36 @@ class User(Base):
     posts = relationship('Post', back_populates='user', cascade="all, delete-orphan")
     #  cascade="all, delete-orphan" : 사용자가 삭제될 때 해당 사용자의 모든 게시글도 함께 삭제
 
+    @property
+    def neighbor_ids(self) -> list[str]:
+        """
+        응답에 담을 이웃 id (앞에서부터 USER_NEIGHBORS_PREVIEW 개). 전체는 following_count / 페이지네이션 API.
+        neighbors 관계와 달리 User 객체를 로드하지 않고 user_neighbors 에서 id 만 조회합니다.
+        """
+        session = object_session(self)
+        if session is None or 'neighbors' in self.__dict__:
+            return sorted(neighbor.id for neighbor in self.neighbors)[:config.USER_NEIGHBORS_PREVIEW]
+        rows = session.query(user_neighbors.c.neighbor_id)\
+            .filter(user_neighbors.c.user_id == self.id)\
+            .order_by(user_neighbors.c.neighbor_id)\
+            .limit(config.USER_NEIGHBORS_PREVIEW)\
+            .all()
+        return [row[0] for row in rows]
+
 class ClothingItem(Base):
     __tablename__ = 'clothing_items'
+    __table_args__ = (
+        # 내 옷장 목록 (user_id 필터 + id 정렬)
+        Index('ix_clothing_items_user_id_id', 'user_id', 'id'),
+        # 관리자 출품 승인 대기 목록 (상태 필터 + id 순 페이지네이션)
+        Index('ix_clothing_items_submission_status_id', 'party_submission_status', 'id'),
+        # 파티별 출품 아이템 (임팩트 집계, 파티별 승인 대기 목록)
+        Index('ix_clothing_items_submitted_party_id_status_id', 'submitted_party_id', 'party_submission_status', 'id'),
+        # 교환 가능 목록
+        Index('ix_clothing_items_is_listed_for_exchange', 'is_listed_for_exchange'),
+    )
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     category = Column(DBEnum(ClothingCategoryEnum), nullable=False)
@@ -129,8 +209,8 @@ class ClothingItem(Base):
     party_submission_status = Column(DBEnum(PartySubmissionStatusEnum), nullable=True)
     
     # Foreign Keys
-    user_id = Column(String, ForeignKey('users.id'), nullable=False)
-    submitted_party_id = Column(String, ForeignKey('parties.id'), nullable=True)
+    user_id = Column(CompactUUID, ForeignKey('users.id'), nullable=False)
+    submitted_party_id = Column(CompactUUID, ForeignKey('parties.id'), nullable=True)
     
     # Relationships
     # ClothingItem -> User (Many-to-One)
@@ -148,7 +228,7 @@ class GoodbyeTag(Base):
     __tablename__ = 'goodbye_tags'
     
     # 1:1 관계를 위해 ClothingItem의 ID를 PK/FK로 사용
-    clothing_item_id = Column(String, ForeignKey('clothing_items.id'), primary_key=True)
+    clothing_item_id = Column(CompactUUID, ForeignKey('clothing_items.id'), primary_key=True)
     
     met_when = Column(String)
     met_where = Column(String)
@@ -165,7 +245,7 @@ class HelloTag(Base):
     __tablename__ = 'hello_tags'
     
     # 1:1 관계를 위해 ClothingItem의 ID를 PK/FK로 사용
-    clothing_item_id = Column(String, ForeignKey('clothing_items.id'), primary_key=True)
+    clothing_item_id = Column(CompactUUID, ForeignKey('clothing_items.id'), primary_key=True)
 
     received_from = Column(String)
     received_at = Column(String)
@@ -178,20 +258,69 @@ class HelloTag(Base):
 
 class Credit(Base):
     __tablename__ = 'credits'
+    __table_args__ = (
+        # 잔액 합계 / 내역 최신순 조회
+        Index('ix_credits_user_id_date', 'user_id', 'date'),
+        # 관리자 일별 활동 통계 (기간 조회)
+        Index('ix_credits_date', 'date'),
+        # 한 기록은 한 번만 되돌림
+        Index('ix_credits_reverses_id', 'reverses_id', unique=True),
+    )
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     date = Column(DateTime, default=datetime.datetime.utcnow)
     activity_name = Column(String, nullable=False)
     type = Column(DBEnum(CreditTypeEnum), nullable=False)
     amount = Column(Integer, nullable=False)
     
     # Foreign Key
-    user_id = Column(String, ForeignKey('users.id'), nullable=False)
+    user_id = Column(CompactUUID, ForeignKey('users.id'), nullable=False)
+    # 되돌리기(보정) 기록이면 되돌린 원래 기록의 id. 기록은 삭제하지 않고 반대 금액의 기록을 추가합니다.
+    # (원래 기록이 보관(archive)되어 테이블에서 빠질 수 있으므로 FK 는 두지 않음, 한 기록은 한 번만 되돌림)
+    reverses_id = Column(CompactUUID, nullable=True)
     
     # Relationship
     user = relationship('User', back_populates='credits')
 
 
+class CreditSnapshot(Base):
+    """
+    사용자별 월말 잔액. period_end(다음 달 1일 0시, UTC) 이전 모든 기록의 합입니다.
+    잔액/내역 조회는 가장 최근 스냅샷 + 그 이후 기록만 읽습니다. (app/crud/credit.py)
+    그 달에 기록이 없던 사용자는 행이 없습니다.
+    """
+    __tablename__ = 'credit_snapshots'
+
+    user_id = Column(CompactUUID, ForeignKey('users.id'), primary_key=True)
+    period_end = Column(DateTime, primary_key=True)
+    balance = Column(Integer, nullable=False)
+
+
+class CreditArchive(Base):
+    """credits 테이블에서 압축 파일로 옮긴 달 (period_start ~ 다음 달 1일)"""
+    __tablename__ = 'credit_archives'
+
+    period_start = Column(DateTime, primary_key=True)
+    path = Column(String, nullable=False)
+    entries = Column(Integer, nullable=False)
+    total_amount = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+
+
+class PartyPayout(Base):
+    """
+    파티 참가 크레딧 지급 기록 (파티 + 사용자당 한 번)
+    작업 큐의 dedupe_key 는 DONE 작업이 정리되면 사라지고 크레딧 기록은 보관(archive)될 수 있으므로,
+    파티가 다시 COMPLETED 로 바뀌어도 두 번 지급하지 않도록 이 표를 기준으로 합니다.
+    """
+    __tablename__ = 'party_payouts'
+
+    party_id = Column(CompactUUID, ForeignKey('parties.id'), primary_key=True)
+    user_id = Column(CompactUUID, ForeignKey('users.id'), primary_key=True)
+    credit_id = Column(CompactUUID, nullable=False)
+    paid_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+
+
 class Tag(Base):
     __tablename__ = 'tags'
     
@@ -204,8 +333,12 @@ class Tag(Base):
 
 class Story(Base):
     __tablename__ = 'stories'
+    __table_args__ = (
+        Index('ix_stories_party_id', 'party_id'),
+        Index('ix_stories_user_id', 'user_id'),
+    )
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     title = Column(String, nullable=False)
     author = Column(String, nullable=False)
     excerpt = Column(Text)
@@ -214,8 +347,8 @@ class Story(Base):
     # `likes: number`는 `likedBy` 배열의 길이로 계산되므로, DB에는 저장하지 않는 것이 정규화에 맞습니다.
     
     # Foreign Keys
-    user_id = Column(String, ForeignKey('users.id'), nullable=False)
-    party_id = Column(String, ForeignKey('parties.id'), nullable=False)
+    user_id = Column(CompactUUID, ForeignKey('users.id'), nullable=False)
+    party_id = Column(CompactUUID, ForeignKey('parties.id'), nullable=False)
     
     # Relationships
     user = relationship('User', back_populates='stories')
@@ -231,7 +364,7 @@ class Story(Base):
 class Reward(Base):
     __tablename__ = 'rewards'
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(Text)
     cost = Column(Integer, nullable=False)
@@ -241,15 +374,19 @@ class Reward(Base):
 
 class Comment(Base):
     __tablename__ = 'comments'
+    __table_args__ = (
+        # 스토리 상세의 댓글 로딩
+        Index('ix_comments_story_id_timestamp', 'story_id', 'timestamp'),
+    )
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     author_nickname = Column(String, nullable=False) # TS 인터페이스에 명시됨
     text = Column(Text, nullable=False)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)
     
     # Foreign Keys
-    story_id = Column(String, ForeignKey('stories.id'), nullable=False)
-    user_id = Column(String, ForeignKey('users.id'), nullable=False)
+    story_id = Column(CompactUUID, ForeignKey('stories.id'), nullable=False)
+    user_id = Column(CompactUUID, ForeignKey('users.id'), nullable=False)
     
     # Relationships
     story = relationship('Story', back_populates='comments')
@@ -259,7 +396,7 @@ class Comment(Base):
 class Maker(Base):
     __tablename__ = 'makers'
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     name = Column(String, nullable=False)
     specialty = Column(String)
     location = Column(String)
@@ -272,15 +409,18 @@ class Maker(Base):
 
 class MakerProduct(Base):
     __tablename__ = 'maker_products'
+    __table_args__ = (
+        Index('ix_maker_products_maker_id', 'maker_id'),
+    )
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(Text)
     price = Column(Integer, nullable=False) # in OL credits
     image_url = Column(String)
     
     # Foreign Key
-    maker_id = Column(String, ForeignKey('makers.id'), nullable=False)
+    maker_id = Column(CompactUUID, ForeignKey('makers.id'), nullable=False)
     
     # Relationship
     maker = relationship('Maker', back_populates='products')
@@ -289,9 +429,13 @@ class MakerProduct(Base):
 # PartyParticipant는 M2M 관계에 추가 데이터(status)가 있는 'Association Object'입니다.
 class PartyParticipation(Base):
     __tablename__ = 'party_participations'
+    __table_args__ = (
+        # PK (party_id, user_id) 는 party_id 로 시작하므로 사용자 기준 조회용 인덱스를 따로 둡니다.
+        Index('ix_party_participations_user_id_status', 'user_id', 'status'),
+    )
     
-    party_id = Column(String, ForeignKey('parties.id'), primary_key=True)
-    user_id = Column(String, ForeignKey('users.id'), primary_key=True)
+    party_id = Column(CompactUUID, ForeignKey('parties.id'), primary_key=True)
+    user_id = Column(CompactUUID, ForeignKey('users.id'), primary_key=True)
     status = Column(DBEnum(PartyParticipantStatusEnum), nullable=False, default=PartyParticipantStatusEnum.PENDING)
     
     # Relationships
@@ -301,8 +445,14 @@ class PartyParticipation(Base):
 
 class Party(Base):
     __tablename__ = 'parties'
+    __table_args__ = (
+        # 상태별 목록 (상태 필터 + 날짜 정렬)
+        Index('ix_parties_status_date', 'status', 'date'),
+        Index('ix_parties_date', 'date'),
+        Index('ix_parties_host_id', 'host_id'),
+    )
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(Text)
     date = Column(Date, nullable=False)
@@ -314,7 +464,7 @@ class Party(Base):
     invitation_code = Column(String, unique=True, nullable=False)
     
     # Foreign Key
-    host_id = Column(String, ForeignKey('users.id'), nullable=False)
+    host_id = Column(CompactUUID, ForeignKey('users.id'), nullable=False)
     
     # Embedded Fields from TS (ImpactStats, kitDetails)
     # nullable=True로 설정하여 선택적(optional) 속성을 반영합니다.
@@ -352,11 +502,16 @@ class Party(Base):
             })
         return results
 
+    @property
+    def impact(self):
+        """PartyResponse.impact: 출품 데이터로 계산해 저장한 임팩트 컬럼 (app/crud/impact.py)"""
+        return impact_stats.from_columns(self.impact_items_exchanged, self.impact_water_saved, self.impact_co2_reduced)
+
 # 뉴스레터
 class PerformanceReport(Base):
     __tablename__ = 'performance_reports'
     
-    id = Column(String, primary_key=True)
+    id = Column(CompactUUID, primary_key=True)
     title = Column(String, nullable=False)
     date = Column(Date, nullable=False)
     excerpt = Column(Text)
@@ -369,10 +524,10 @@ class PerformanceReport(Base):
 class Post(Base):
     __tablename__ = 'posts'
 
-    # post_id는 UUID를 사용하여 String 타입으로 정의
-    post_id = Column(String, primary_key=True, index=True) 
-    # user_id는 User.id(String)를 참조하는 외래 키
-    user_id = Column(String, ForeignKey('users.id', ondelete='CASCADE'), nullable=False) 
+    # post_id는 UUID 문자열 (DB 에는 CompactUUID 로 16바이트 저장)
+    post_id = Column(CompactUUID, primary_key=True, index=True) 
+    # user_id는 User.id 를 참조하는 외래 키
+    user_id = Column(CompactUUID, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True) 
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     image_url = Column(String, nullable=True)
@@ -382,3 +537,105 @@ class Post(Base):
     # Relationship
     user = relationship('User', back_populates='posts')
     # Post 모델에 대한 댓글(Comment)이 있다면 여기에 추가 가능
+
+
+# 조건부 GET(ETag/Last-Modified)을 위한 테이블별 버전 카운터
+# 추적 대상 테이블에 쓰기가 발생하면 같은 트랜잭션 안에서 version 이 1씩 증가합니다. (app/core/etag.py)
+class TableVersion(Base):
+    __tablename__ = 'table_versions'
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+
+
+# --- 이웃 피드 ---
+# 활동(Activity)은 한 번만 저장하고, 일반 사용자의 활동은 작성 시점에 이웃들의 타임라인(FeedEntry)에
+# id 만 복사합니다 (fan-out-on-write). 이웃 수가 FEED_FANOUT_LIMIT 를 넘는 사용자의 활동은 복사하지 않고
+# 피드 조회 시 activities 에서 직접 읽습니다 (fan-out-on-read). (app/crud/feed.py)
+class Activity(Base):
+    __tablename__ = 'activities'
+    __table_args__ = (
+        # fan-out-on-read: 특정 사용자들의 최신 활동
+        Index('ix_activities_actor_id_id', 'actor_id', 'id'),
+        # 원본 삭제 시 활동 정리
+        Index('ix_activities_object_id', 'object_id'),
+    )
+
+    # UUIDv7 이므로 id 순서 = 생성 순서 (피드 커서로 사용)
+    id = Column(CompactUUID, primary_key=True)
+    actor_id = Column(CompactUUID, ForeignKey('users.id'), nullable=False)
+    verb = Column(DBEnum(FeedVerbEnum), nullable=False)
+    object_id = Column(CompactUUID, nullable=False)  # 스토리 / 아이템 / 게시글 / 파티 id
+    summary = Column(String, nullable=True)  # 목록 표시용 제목 (작성 시점 값)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    fanned_out = Column(Boolean, nullable=False, default=True)
+
+    actor = relationship('User')
+
+
+class FeedEntry(Base):
+    __tablename__ = 'feed_entries'
+
+    # PK (owner_id, activity_id) 가 곧 "내 타임라인 최신순" 인덱스입니다.
+    owner_id = Column(CompactUUID, ForeignKey('users.id'), primary_key=True)
+    # 활동이 삭제되면 조회 시 조인에서 빠지므로 FK 를 두지 않습니다. (삭제 시 팔로워 수만큼 지우지 않도록)
+    activity_id = Column(CompactUUID, primary_key=True)
+
+
+# --- 백그라운드 작업 큐 ---
+# 요청 경로에서 미룬 작업(이미지 변환, 크레딧 지급, 통계 집계)을 같은 DB 에 저장하고
+# app/core/jobs.py 의 워커 풀이 가져가 실행합니다.
+class Job(Base):
+    __tablename__ = 'jobs'
+    __table_args__ = (
+        # 가져갈 작업 찾기: 상태별로 우선순위 -> 실행 예정 시각 순
+        Index('ix_jobs_status_priority_run_at', 'status', 'priority', 'run_at'),
+    )
+
+    id = Column(CompactUUID, primary_key=True)
+    kind = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    priority = Column(Integer, nullable=False, default=100)  # 작을수록 먼저
+    status = Column(DBEnum(JobStatusEnum), nullable=False, default=JobStatusEnum.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+    locked_until = Column(DateTime, nullable=True)  # RUNNING 인데 이 시각이 지나면 다른 워커가 다시 가져감
+    locked_by = Column(String, nullable=True)
+    # 같은 키의 작업은 하나만 (예: "credit_payout:<party_id>")
+    dedupe_key = Column(String, unique=True, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class StatRollup(Base):
+    """관리자 통계처럼 전체를 훑어야 하는 집계 결과 (rollup_refresh 작업이 갱신)"""
+    __tablename__ = 'stat_rollups'
+
+    name = Column(String, primary_key=True)
+    payload = Column(JSON, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key 헤더로 받은 요청의 처리 결과 (app/core/idempotency.py)
+    status_code 가 NULL 이면 아직 처리 중이며, locked_until 이 지나면 다른 요청이 이어받습니다.
+    """
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+
+    # sha256(사용자 + 메서드 + 경로 + 키) 앞 16바이트
+    key = Column(LargeBinary(16), primary_key=True)
+    # sha256(요청 본문) 앞 16바이트: 같은 키로 다른 요청을 보내면 거절
+    fingerprint = Column(LargeBinary(16), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    content_type = Column(String, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=False)
@@ -1,8 +1,21 @@
-from pydantic import BaseModel, EmailStr, field_validator, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, EmailStr, field_validator, Field, AliasChoices, AfterValidator
+from typing import Optional, List, Dict, Any, Annotated
 from pydantic import BaseModel, computed_field
 import datetime
 import enum
+import uuid
+
+
+# --- 요청 본문의 id ---
+def _canonical_id(value: str) -> str:
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        raise ValueError("올바른 id 형식이 아닙니다.")
+
+# 저장되는 id 는 여기서 검증합니다(422). 검증하지 않아도 id 컬럼 타입(CompactUUID)이 바인딩 시 거절하지만
+# 그때는 요청 본문이 아니라 "찾을 수 없음"(404) 으로 응답됩니다.
+EntityId = Annotated[str, AfterValidator(_canonical_id)]
 
 # --- Enums ---
 class ClothingCategoryEnum(str, enum.Enum):
@@ -106,6 +119,17 @@ class ClothingItemResponse(ClothingItemBase):
     class Config:
         from_attributes = True
 
+class ItemImportRowError(BaseModel):
+    row: int
+    error: str
+
+class ItemImportResult(BaseModel):
+    imported: int
+    goodbye_tags: int
+    failed: int
+    truncated: bool
+    errors: List[ItemImportRowError]
+
 
 # --- User Schemas ---
 
@@ -133,7 +157,12 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     id: str
     is_admin: Optional[bool] = False
-    neighbors: Optional[List[str]] = []
+    # ORM 객체에서는 User.neighbor_ids (id 만 조회) 를 사용합니다.
+    # 다른 사용자 응답에는 앞에서부터 USER_NEIGHBORS_PREVIEW 개까지만 담기므로(전체 수는 following_count),
+    # 전체 목록은 GET /users/{user_id}/neighbors (페이지네이션) 로 받으세요. /users/me 는 전체를 담습니다.
+    neighbors: Optional[List[str]] = Field(default=[], validation_alias=AliasChoices('neighbor_ids', 'neighbors'))
+    following_count: int = 0
+    follower_count: int = 0
 
     # [중요] 이웃 객체를 ID 문자열 리스트로 변환하는 Validator 추가
     @field_validator('neighbors', mode='before')
@@ -149,6 +178,41 @@ class UserResponse(UserBase):
     class Config:
         from_attributes = True
 
+class NeighborStatus(BaseModel):
+    """이웃 추가/삭제 결과"""
+    user_id: str
+    neighbor_id: str
+    is_neighbor: bool
+    following_count: int        # user_id 가 추가한 이웃 수
+    neighbor_follower_count: int  # neighbor_id 를 이웃으로 추가한 사용자 수
+
+class NeighborPage(BaseModel):
+    """이웃 id 목록 한 페이지. next_cursor 를 cursor 로 넘기면 다음 페이지를 조회합니다."""
+    items: List[str]
+    next_cursor: Optional[str] = None
+
+# --- Feed Schemas ---
+
+class FeedVerbEnum(str, enum.Enum):
+    STORY_CREATED = 'STORY_CREATED'
+    ITEM_LISTED = 'ITEM_LISTED'
+    POST_CREATED = 'POST_CREATED'
+    PARTY_JOINED = 'PARTY_JOINED'
+
+class FeedItemResponse(BaseModel):
+    id: str
+    actor_id: str
+    actor_nickname: str
+    verb: FeedVerbEnum
+    object_id: str
+    summary: Optional[str] = None
+    created_at: datetime.datetime
+
+class FeedPage(BaseModel):
+    """피드 한 페이지. next_cursor 를 cursor 로 넘기면 더 오래된 활동을 조회합니다."""
+    items: List[FeedItemResponse]
+    next_cursor: Optional[str] = None
+
 # --- Credit Schemas ---
 
 class CreditBase(BaseModel):
@@ -157,18 +221,20 @@ class CreditBase(BaseModel):
     amount: int
 
 class EarnRequest(BaseModel):
-    user_id: str
+    user_id: EntityId
     amount: int
     activity_name: Optional[str] = "Earned credit"
     type: Optional[CreditTypeEnum] = CreditTypeEnum.EARNED_EVENT
 
 class CreditCreate(CreditBase):
-    user_id: str
+    user_id: EntityId
 
 class CreditResponse(CreditBase):
     id: str
     user_id: str
     date: datetime.datetime
+    # 취소(보정) 기록이면 취소한 원래 기록의 id
+    reverses_id: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -180,6 +246,17 @@ class UserCreditBalanceResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class CreditStatementResponse(BaseModel):
+    """한 달의 크레딧 명세 (기초 잔액 + 그 달의 기록 = 기말 잔액)"""
+    user_id: str
+    period_start: datetime.datetime
+    period_end: datetime.datetime
+    opening_balance: int
+    closing_balance: int
+    # 압축 보관된 달이면 True (기록은 보관 파일에서 읽음)
+    archived: bool
+    entries: List[CreditResponse]
+
 # 순환 참조 해결을 위해 UserResponseWithItems는 아래에 정의
 class UserResponseWithItems(UserResponse):
     items: List[ClothingItemResponse] = []
@@ -214,7 +291,7 @@ class StoryBase(BaseModel):
     image_url: str
 
 class StoryCreate(StoryBase):
-    party_id: str
+    party_id: EntityId
     tags: List[str]
 
 class StoryUpdate(BaseModel):
@@ -230,20 +307,23 @@ class StoryResponse(StoryBase):
     party_id: str
     author: str
     tags: List[TagResponse] = []
-    
-    @computed_field
-    @property
-    def likes(self) -> int:
-        if hasattr(self, 'likers'):
-            return len(self.likers)
-        return 0
+    # ORM 객체에서는 likers 관계를, dict 에서는 liked_by 키를 읽습니다.
+    liked_by: List[str] = Field(default=[], validation_alias=AliasChoices('likers', 'liked_by'))
+
+    # 좋아요 누른 유저 객체를 ID 문자열 리스트로 변환 (UserResponse.neighbors 와 동일한 방식)
+    @field_validator('liked_by', mode='before')
+    @classmethod
+    def transform_likers(cls, v):
+        if not v:
+            return []
+        if isinstance(v, list) and len(v) > 0 and hasattr(v[0], 'id'):
+            return [user.id for user in v]
+        return v
 
     @computed_field
     @property
-    def liked_by(self) -> List[str]:
-        if hasattr(self, 'likers'):
-            return [user.id for user in self.likers]
-        return []
+    def likes(self) -> int:
+        return len(self.liked_by)
 
     class Config:
         from_attributes = True
@@ -255,7 +335,7 @@ class CommentBase(BaseModel):
     text: str
 
 class CommentCreate(CommentBase):
-    story_id: str
+    story_id: EntityId
 
 class CommentResponse(CommentBase):
     id: str
@@ -385,6 +465,66 @@ class PartyParticipantResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# --- Check-in Schemas ---
+
+class QRTokenResponse(BaseModel):
+    """QR 코드에 담을 서명 토큰 (expires_at: unix 초)"""
+    token: str
+    expires_at: int
+
+class PartyTicketResponse(QRTokenResponse):
+    """참가자 입장권 QR 토큰"""
+
+class CheckInRosterEntry(BaseModel):
+    user_id: str
+    nickname: str
+    status: PartyParticipantStatusEnum
+    signature: str  # 이 참가자 입장권 토큰의 서명 부분 (현장 검증용)
+
+class CheckInRosterResponse(BaseModel):
+    """호스트 기기가 미리 받아두는 체크인 명단"""
+    party_id: str
+    expires_at: int
+    entries: List[CheckInRosterEntry]
+
+class CheckInBatch(BaseModel):
+    tokens: List[str] = Field(..., max_length=500)
+
+class CheckInRejected(BaseModel):
+    token: str
+    reason: str
+
+class CheckInBatchResult(BaseModel):
+    checked_in: List[str] = []
+    already_attended: List[str] = []
+    not_accepted: List[str] = []  # 대기/거절 상태라 체크인하지 않은 참가자
+    not_registered: List[str] = []
+    rejected: List[CheckInRejected] = []
+
+# --- Matching Schemas ---
+
+class MatchItemResponse(BaseModel):
+    id: str
+    owner_id: str
+    owner_nickname: str
+    name: str
+    category: ClothingCategoryEnum
+    size: Optional[str] = None
+    image_url: str
+
+    class Config:
+        from_attributes = True
+
+class MatchResponse(BaseModel):
+    """교환 후보. two_way 이면 상대도 swap_with 의 내 옷을 입을 수 있는 사이즈입니다."""
+    item: MatchItemResponse
+    score: float
+    two_way: bool
+    swap_with: List[str] = []
+
+    class Config:
+        from_attributes = True
+
 class PartyBase(BaseModel):
     title: str
     description: str
@@ -455,6 +595,35 @@ class CategoryDistribution(BaseModel):
     class Config:
         from_attributes = True
 
+class PendingItemPage(BaseModel):
+    """출품 승인 대기 아이템 한 페이지. next_cursor 를 cursor 로 넘기면 다음 페이지를 조회합니다."""
+    items: List[ClothingItemResponse]
+    next_cursor: Optional[str] = None
+
+class ItemModeration(BaseModel):
+    item_id: str
+    status: PartySubmissionStatusEnum
+
+class ItemModerationBatch(BaseModel):
+    items: List[ItemModeration] = Field(..., max_length=500)
+
+class ParticipantModeration(BaseModel):
+    user_id: str
+    status: PartyParticipantStatusEnum
+
+class ParticipantModerationBatch(BaseModel):
+    participants: List[ParticipantModeration] = Field(..., max_length=500)
+
+class ModerationOutcome(BaseModel):
+    id: str
+    status: str
+    # updated: 변경됨 / unchanged: 이미 그 상태 / not_found: 대상 없음
+    outcome: str
+
+class ModerationBatchResult(BaseModel):
+    updated: int
+    results: List[ModerationOutcome]
+
 
 # --- 순환 참조(ForwardRef) 업데이트 ---
 MakerResponse.model_rebuild()
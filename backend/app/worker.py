@@ -0,0 +1,36 @@
+"""
+백그라운드 작업 워커 (API 프로세스와 따로 실행할 때)
+
+    JOB_WORKERS=0 uvicorn app.main:app        # API 프로세스에서는 작업을 실행하지 않음
+    python -m app.worker --workers 4          # 작업 전용 프로세스 (여러 개 띄워도 안전)
+"""
+import argparse
+import logging
+import signal
+import threading
+
+from app.core import config, jobs
+from app.database import get_engine, verify_schema_revision
+# 작업 함수 등록 (@jobs.handler)
+from app.crud import admin, credit, idempotency, party, post  # noqa: F401
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="백그라운드 작업 워커")
+    parser.add_argument("--workers", type=int, default=max(config.JOB_WORKERS, 1))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    verify_schema_revision(get_engine())
+
+    stopped = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stopped.set())
+
+    jobs.start_runner(args.workers)
+    stopped.wait()
+    jobs.stop_runner()
+
+
+if __name__ == "__main__":
+    main()
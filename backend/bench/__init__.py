@@ -0,0 +1,44 @@
+"""
+부하 테스트 / 벤치마크 도구 모음
+
+backend 폴더에서 모듈로 실행합니다. (추가 의존성: httpx)
+
+    # 1. 벤치마크 전용 DB에 합성 데이터 생성
+    python -m bench.seed --database-url sqlite:///./bench.db --profile small
+
+    # 2. 앱을 프로세스 내부에서 구동하여 주요 라우트 측정 -> JSON 저장
+    python -m bench.loadtest --database-url sqlite:///./bench.db --output bench/results/base.json
+
+    # 3. 두 실행 결과 비교 (회귀 발생 시 exit code 1)
+    python -m bench.compare bench/results/base.json bench/results/new.json
+
+    # 목록 API 직렬화 경로 비교 (기존 vs FAST_JSON)
+    python -m bench.serialization --database-url sqlite:///./bench.db
+
+    # CRUD 쿼리 실행 계획 검사 (풀 스캔 발견 시 exit code 1)
+    python -m bench.explain --database-url sqlite:///./bench.db
+
+    # PK 형식별 삽입 속도 / 인덱스 크기 비교 (uuid4 문자열 vs UUIDv7 16바이트)
+    python -m bench.ids --rows 1000000
+
+    # 이웃 피드 fan-out-on-write / fan-out-on-read 비교 (이웃 10k 명)
+    python -m bench.feed --followers 10000
+
+    # 파티 교환 매칭 인덱스 조회 / 증분 갱신 지연 (DB 불필요)
+    python -m bench.matching --items 5000
+
+    # 관리자 내보내기 최대 메모리 비교 (yield_per 스트리밍 vs .all())
+    python -m bench.export --database-url sqlite:///./bench.db
+
+    # 아이템 일괄 등록 처리량 비교 (행마다 commit vs 청크 executemany, 10k 행)
+    python -m bench.item_import --items 10000
+
+    # 라우트별 SQL 쿼리 수 검사 (N+1 / 별칭 경로 불일치 시 exit code 1)
+    python -m bench.queries --database-url sqlite:///./bench.db
+
+    # 응답 압축 전송 바이트 / 지연 비교 (identity vs gzip vs br)
+    python -m bench.compression --database-url sqlite:///./bench.db
+
+    # import app.main 콜드 스타트 시간 예산 검사 (초과 시 exit code 1)
+    python -m bench.coldstart --budget-ms 1000
+"""
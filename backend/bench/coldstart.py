@@ -0,0 +1,73 @@
+"""
+콜드 스타트(import) 시간 예산 검사
+
+새 프로세스에서 `import app.main` 에 걸리는 시간을 여러 번 측정하여 중앙값이 예산을 넘으면 실패(exit 1)합니다.
+import 시점에는 DB 연결/DDL 이 없어야 하므로, 이 값이 커지면 무거운 모듈 import 나 모듈 수준 작업이 추가된 것입니다.
+
+    python -m bench.coldstart --runs 5 --budget-ms 1000
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$")
+
+
+def measure_once() -> tuple[float, list[tuple[int, str]]]:
+    """(app.main 누적 import 시간 ms, [(누적 us, 모듈명), ...]) 를 반환합니다."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"[coldstart] import app.main 실패\n{proc.stderr[-2000:]}")
+
+    modules = []
+    total_us = None
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, name = int(match.group(2)), match.group(3)
+        modules.append((cumulative, name))
+        if name.strip() == "app.main":
+            total_us = cumulative
+    if total_us is None:
+        raise SystemExit("[coldstart] importtime 출력에서 app.main 을 찾지 못했습니다.")
+    return total_us / 1000, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="import app.main 콜드 스타트 시간 예산 검사")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000.0)
+    parser.add_argument("--top", type=int, default=15, help="출력할 느린 모듈 수")
+    args = parser.parse_args(argv)
+
+    timings, slowest = [], []
+    for _ in range(args.runs):
+        total_ms, modules = measure_once()
+        timings.append(total_ms)
+        slowest = modules
+
+    median = statistics.median(timings)
+    print(f"[coldstart] import app.main  median {median:.1f} ms  "
+          f"(min {min(timings):.1f} / max {max(timings):.1f}, runs={args.runs}, budget={args.budget_ms:.0f} ms)")
+    print("  느린 import (누적, 마지막 실행 기준)")
+    # 최상위 모듈만 보면 어떤 의존성이 무거운지 바로 보입니다. (들여쓰기 없는 줄)
+    top_level = [(us, name) for us, name in slowest if not name.startswith(" ")]
+    for us, name in sorted(top_level, reverse=True)[:args.top]:
+        print(f"    {us / 1000:8.1f} ms  {name}")
+
+    if median > args.budget_ms:
+        print(f"[coldstart] FAIL: 예산 {args.budget_ms:.0f} ms 초과")
+        sys.exit(1)
+    print("[coldstart] OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+두 부하 테스트 결과(JSON)를 비교하여 성능 회귀를 찾습니다.
+
+    python -m bench.compare bench/results/base.json bench/results/new.json --threshold 10
+
+p95 지연시간이 threshold(%) 이상 늘었거나 처리량이 threshold(%) 이상 줄어든
+시나리오가 하나라도 있으면 exit code 1 로 종료합니다.
+"""
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pct_change(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before * 100.0
+
+
+def compare(base: dict, new: dict, threshold: float) -> list[str]:
+    """회귀가 발생한 시나리오 이름 목록을 반환하며 비교표를 출력합니다."""
+    regressions = []
+    print(f"{'scenario':<18}{'rps':>22}{'p50 ms':>22}{'p95 ms':>22}{'p99 ms':>22}")
+    for name, before in base["results"].items():
+        after = new["results"].get(name)
+        if after is None:
+            print(f"{name:<18}  (새 결과에 없음)")
+            continue
+
+        rps = pct_change(before["throughput_rps"], after["throughput_rps"])
+        cells = [f"{before['throughput_rps']:.0f}->{after['throughput_rps']:.0f} ({rps:+.1f}%)"]
+        for key in ("p50", "p95", "p99"):
+            b, a = before["latency_ms"][key], after["latency_ms"][key]
+            cells.append(f"{b:.2f}->{a:.2f} ({pct_change(b, a):+.1f}%)")
+        print(f"{name:<18}" + "".join(f"{cell:>22}" for cell in cells))
+
+        p95 = pct_change(before["latency_ms"]["p95"], after["latency_ms"]["p95"])
+        if p95 > threshold or rps < -threshold or after["errors"] > before["errors"]:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="부하 테스트 결과 비교")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 변화율(%%)")
+    args = parser.parse_args(argv)
+
+    regressions = compare(load(args.baseline), load(args.candidate), args.threshold)
+    if regressions:
+        print(f"\n[compare] 회귀 발생: {', '.join(regressions)}")
+        sys.exit(1)
+    print("\n[compare] 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
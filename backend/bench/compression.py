@@ -0,0 +1,88 @@
+"""
+응답 압축 벤치마크 (identity vs gzip vs br)
+
+시드 데이터가 들어 있는 DB 에 대해 앱을 httpx ASGITransport 로 구동하고, 큰 목록 라우트를
+Accept-Encoding 별로 --iterations 번 호출하여 전송 바이트 / 압축률 / 요청당 지연을 비교합니다.
+ETag 가 붙은 라우트(/stories/, /makers/ 등)는 두 번째 요청부터 압축 바이트 캐시(compressed_responses)를 씁니다.
+
+    python -m bench.seed --database-url sqlite:///./bench.db --profile small
+    python -m bench.compression --database-url sqlite:///./bench.db --iterations 50
+    python -m bench.compression --database-url sqlite:///./bench.db --output bench/results/compression.json
+
+br 은 brotli 패키지가 설치되어 있을 때만 측정합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+ROUTES = {
+    "parties": "/parties/",
+    "stories": "/stories/?limit=100",
+    "items": "/items/?limit=100",
+    "makers": "/makers/",
+    "posts": "/posts/?limit=100",
+}
+
+
+async def measure(client, path: str, encoding: str, iterations: int) -> dict:
+    timings = []
+    response = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = await client.get(path, headers={"Accept-Encoding": encoding})
+        timings.append(time.perf_counter() - started)
+    return {
+        "status": response.status_code,
+        "content_encoding": response.headers.get("content-encoding"),
+        "wire_bytes": response.num_bytes_downloaded,
+        "body_bytes": len(response.content),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+    }
+
+
+async def run(routes: dict, encodings: list[str], iterations: int) -> dict:
+    import httpx
+    from app.main import app
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, path in routes.items():
+            results[name] = {encoding: await measure(client, path, encoding, iterations) for encoding in encodings}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--route", action="append", choices=sorted(ROUTES))
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.core import cache, compression
+
+    encodings = ["identity", *reversed(compression.available_encodings())]
+    routes = {name: path for name, path in ROUTES.items() if not args.route or name in args.route}
+    results = asyncio.run(run(routes, encodings, args.iterations))
+
+    for name, by_encoding in results.items():
+        identity = by_encoding["identity"]["wire_bytes"] or 1
+        for encoding, result in by_encoding.items():
+            print(f"  {name:<8} {encoding:<9} HTTP {result['status']}  {result['wire_bytes']:>9} B "
+                  f"({result['wire_bytes'] / identity:6.1%})  {result['median_ms']:8.3f} ms")
+    compressed_cache = cache.stats().get(compression.compressed_cache.name)
+    print(f"  compressed_responses cache: {compressed_cache}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"iterations": args.iterations, "results": results, "cache": compressed_cache}, f, indent=2)
+        print(f"[compression] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
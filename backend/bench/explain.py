@@ -0,0 +1,248 @@
+"""
+CRUD 쿼리 실행 계획(EXPLAIN QUERY PLAN) 검사
+
+시드 데이터가 들어 있는 DB 에서 CRUD 조회 함수를 실제로 호출하여 실행되는 SQL 을 모두 수집하고,
+각 SQL 의 실행 계획에 테이블 풀 스캔이 있으면 실패(exit 1)합니다.
+관계(relationship) lazy load 로 나가는 쿼리도 함께 검사합니다.
+
+    python -m bench.seed --database-url sqlite:///./bench.db --profile small
+    python -m bench.explain --database-url sqlite:///./bench.db
+    python -m bench.explain --database-url sqlite:///./bench.db --case items_by_user --verbose
+
+전체 목록 조회처럼 풀 스캔이 의도된 경우는 Case.allow_scan 에 테이블을 명시합니다.
+"""
+import argparse
+import datetime
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Callable
+
+SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS (\w+))?$")
+POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable  # (db, ids) -> None
+    # 풀 스캔을 허용하는 테이블 (전체 집계/전체 목록 등 의도된 스캔)
+    allow_scan: frozenset = field(default_factory=frozenset)
+
+
+def _touch(objs, *attrs):
+    """관계 속성에 접근하여 lazy load 쿼리를 발생시킵니다."""
+    for obj in objs if isinstance(objs, list) else [objs]:
+        if obj is None:
+            continue
+        for attr in attrs:
+            getattr(obj, attr)
+
+
+def build_cases() -> list[Case]:
+    from app.crud import (
+        admin as crud_admin, credit as crud_credit, job as crud_job, feed as crud_feed, impact as crud_impact, item as crud_item, maker as crud_maker, matching as crud_matching,
+        party as crud_party, post as crud_post, reward as crud_reward, story as crud_story,
+        user as crud_user,
+    )
+
+    def scan(*tables):
+        return frozenset(tables)
+
+    return [
+        # --- users ---
+        Case("user_by_id", lambda db, ids: _touch(
+            crud_user.get_user(db, ids["user"]), "items", "credits", "hosted_parties",
+            "party_participations", "neighbors", "posts", "stories")),
+        Case("user_by_email", lambda db, ids: crud_user.get_user_by_email(db, ids["email"])),
+        Case("user_by_nickname", lambda db, ids: crud_user.get_user_by_nickname(db, ids["nickname"])),
+        Case("users", lambda db, ids: crud_user.get_users(db, limit=100), scan("users")),
+        Case("users_rows", lambda db, ids: crud_user.get_users_rows(db, limit=100), scan("users")),
+        Case("neighbor_ids", lambda db, ids: crud_user.get_neighbor_ids(db, ids["user"])),
+        Case("follower_ids", lambda db, ids: crud_user.get_follower_ids(db, ids["user"])),
+        Case("mutual_neighbor_ids", lambda db, ids: crud_user.get_mutual_neighbor_ids(db, ids["user"])),
+        Case("feed", lambda db, ids: crud_feed.get_feed(db, ids["user"])),
+        # --- items ---
+        Case("item", lambda db, ids: _touch(crud_item.get_item(db, ids["item"]), "goodbye_tag", "hello_tag")),
+        Case("items_for_exchange", lambda db, ids: _touch(
+            crud_item.get_items_for_exchange(db, limit=20), "goodbye_tag", "hello_tag")),
+        Case("items_for_exchange_rows", lambda db, ids: crud_item.get_items_for_exchange_rows(db, limit=20)),
+        Case("item_detail", lambda db, ids: crud_item.get_item_detail.uncached(db, ids["item"])),
+        Case("items_by_user", lambda db, ids: _touch(
+            crud_item.get_items_by_user(db, ids["item_owner"]), "goodbye_tag", "hello_tag")),
+        Case("items_by_user_rows", lambda db, ids: crud_item.get_items_by_user_rows(db, ids["item_owner"])),
+        Case("items_for_exchange_rows_summary", lambda db, ids: crud_item.get_items_for_exchange_rows(db, limit=20, tags="summary")),
+        # --- parties ---
+        Case("party", lambda db, ids: _touch(crud_party.get_party(db, ids["party"]), "participants", "stories")),
+        Case("parties_by_status", lambda db, ids: crud_party.get_parties(db, status="UPCOMING", limit=100)),
+        Case("parties_rows_by_status", lambda db, ids: crud_party.get_parties_rows(db, status="UPCOMING", limit=100)),
+        # 상태 필터 없이 날짜순 -> ix_parties_date 스캔(LIMIT), LIKE 검색은 인덱스로 처리할 수 없음
+        Case("parties", lambda db, ids: crud_party.get_parties(db, limit=100)),
+        Case("parties_search", lambda db, ids: crud_party.get_parties(db, search="파티", limit=100), scan("parties")),
+        Case("party_by_invitation_code", lambda db, ids: crud_party.get_party_by_invitation_code(db, ids["invitation_code"])),
+        Case("parties_for_user", lambda db, ids: crud_party.get_parties_for_user(db, ids["participant"])),
+        Case("participants", lambda db, ids: crud_party.get_participants(db, ids["party"])),
+        # 매칭 인덱스 빌드: (user_id IN 참가자 AND 교환 등록) OR (출품 파티) -> 두 인덱스의 OR 스캔
+        Case("party_match_index", lambda db, ids: crud_matching._build(db, ids["party"], ())),
+        Case("party_impact", lambda db, ids: crud_impact.compute(db, [ids["party"]])),
+        # --- stories / comments ---
+        Case("stories", lambda db, ids: crud_story.get_stories(db, limit=20)),
+        Case("stories_rows", lambda db, ids: crud_story.get_stories_rows(db, limit=20)),
+        Case("story", lambda db, ids: crud_story.get_story(db, ids["story"])),
+        Case("reports", lambda db, ids: crud_story.get_reports(db), scan("performance_reports")),
+        # --- credits ---
+        Case("credit_balance", lambda db, ids: crud_credit.get_user_credit_balance(db, ids["credit_owner"])),
+        Case("credits_by_user", lambda db, ids: crud_credit.get_credits_by_user(db, ids["credit_owner"], limit=100)),
+        Case("credit_statement", lambda db, ids: crud_credit.get_monthly_statement(db, ids["credit_owner"], datetime.datetime.utcnow())),
+        # --- posts ---
+        Case("post", lambda db, ids: crud_post.get_post(db, ids["post"])),
+        Case("posts", lambda db, ids: crud_post.get_post_list(db)),
+        # --- catalog (캐시 미적용 원본 함수로 검사) ---
+        Case("rewards", lambda db, ids: crud_reward.get_rewards.uncached(db), scan("rewards")),
+        Case("makers", lambda db, ids: crud_maker.get_makers.uncached(db), scan("makers")),
+        Case("maker", lambda db, ids: crud_maker.get_maker.uncached(db, ids["maker"])),
+        # --- admin ---
+        Case("admin_overall_stats", lambda db, ids: crud_admin.get_overall_stats(db), scan("users", "clothing_items", "parties")),
+        # 지역별 전체 집계라 세 테이블 모두 한 번씩 훑음
+        Case("admin_group_performance", lambda db, ids: crud_admin.get_group_performance(db),
+             scan("parties", "party_participations", "clothing_items")),
+        Case("admin_daily_activity", lambda db, ids: crud_admin.get_daily_activity(db)),
+        Case("admin_category_distribution", lambda db, ids: crud_admin.get_category_distribution(db), scan("clothing_items")),
+        Case("job_queue_stats", lambda db, ids: crud_job.queue_stats(db), scan("jobs")),
+        Case("admin_pending_party_items", lambda db, ids: crud_admin.get_pending_party_items(db)),
+        Case("admin_pending_party_items_for_party", lambda db, ids: crud_admin.get_pending_party_items(db, party_id=ids["party"])),
+    ]
+
+
+def sample_ids(db) -> dict:
+    """검사에 사용할 실제 id 를 시드 데이터에서 하나씩 고릅니다."""
+    from app.models import User, ClothingItem, Party, PartyParticipation, Story, Credit, Post, Maker
+
+    def first(*columns):
+        return db.query(*columns).limit(1).first()
+
+    user = first(User.id, User.email, User.nickname)
+    if user is None:
+        sys.exit("[explain] 데이터가 없습니다. 먼저 python -m bench.seed 를 실행하세요.")
+    item = first(ClothingItem.id, ClothingItem.user_id)
+    party = first(Party.id, Party.invitation_code)
+    participation = first(PartyParticipation.user_id)
+    credit = first(Credit.user_id)
+    return {
+        "user": user.id, "email": user.email, "nickname": user.nickname,
+        "item": item.id if item else "", "item_owner": item.user_id if item else user.id,
+        "party": party.id if party else "", "invitation_code": party.invitation_code if party else "",
+        "participant": participation.user_id if participation else user.id,
+        "credit_owner": credit.user_id if credit else user.id,
+        "story": (first(Story.id) or [""])[0],
+        "post": (first(Post.post_id) or [""])[0],
+        "maker": (first(Maker.id) or [""])[0],
+    }
+
+
+def capture_statements(engine, fn) -> list[tuple[str, object]]:
+    """fn() 실행 중 engine 으로 나간 (SQL, 파라미터) 목록"""
+    from sqlalchemy import event
+
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def explain(engine, statement, parameters) -> list[str]:
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        cursor.execute(prefix + statement, parameters)
+        rows = cursor.fetchall()
+        return [row[-1] if engine.dialect.name == "sqlite" else row[0] for row in rows]
+    finally:
+        raw.close()
+
+
+def full_scans(dialect: str, plan: list[str], tables: set[str]) -> set[str]:
+    """실행 계획에서 풀 스캔된 실제 테이블 이름 (서브쿼리 임시 결과 스캔은 제외)"""
+    found = set()
+    for line in plan:
+        match = SQLITE_FULL_SCAN.match(line.strip()) if dialect == "sqlite" else POSTGRES_FULL_SCAN.search(line)
+        if not match:
+            continue
+        name = match.group(1)
+        # SQLAlchemy 별칭(users_1 등)은 원래 테이블 이름으로 되돌립니다.
+        base = re.sub(r"_\d+$", "", name)
+        if name in tables:
+            found.add(name)
+        elif base in tables:
+            found.add(base)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CRUD 쿼리 실행 계획 풀 스캔 검사")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--case", action="append", help="특정 케이스만 검사 (여러 번 지정 가능)")
+    parser.add_argument("--verbose", action="store_true", help="모든 SQL 과 실행 계획 출력")
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.database import Base, SessionLocal, get_engine
+    from app import models  # noqa: F401
+
+    engine = get_engine()
+    tables = set(Base.metadata.tables)
+    cases = [c for c in build_cases() if not args.case or c.name in args.case]
+
+    setup = SessionLocal()
+    try:
+        ids = sample_ids(setup)
+    finally:
+        setup.close()
+
+    failures = 0
+    for case in cases:
+        db = SessionLocal()
+        try:
+            statements = capture_statements(engine, lambda: case.run(db, ids))
+        finally:
+            db.rollback()
+            db.close()
+
+        problems = []
+        for statement, parameters in statements:
+            plan = explain(engine, statement, parameters)
+            scanned = full_scans(engine.dialect.name, plan, tables) - case.allow_scan
+            if scanned:
+                problems.append((statement, plan, scanned))
+            if args.verbose:
+                print(f"\n--- {case.name}\n{statement}")
+                for line in plan:
+                    print(f"    {line}")
+
+        status = "FAIL" if problems else "ok"
+        print(f"  {status:<4} {case.name:<30} {len(statements):>2} queries")
+        for statement, plan, scanned in problems:
+            failures += 1
+            print(f"       full scan: {', '.join(sorted(scanned))}")
+            print("       " + " ".join(statement.split())[:300])
+            for line in plan:
+                print(f"         {line}")
+
+    if failures:
+        print(f"[explain] FAIL: 풀 스캔 쿼리 {failures}개")
+        sys.exit(1)
+    print(f"[explain] OK ({len(cases)} cases)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+관리자 내보내기 메모리 벤치마크 (스트리밍 vs 전체 조회)
+
+같은 데이터셋을 두 방식으로 CSV 로 만들 때의 최대 메모리(tracemalloc)와 처리량을 비교합니다.
+- stream: crud_export.iter_rows (yield_per) -> export.encode_rows, 청크는 바로 버림
+- all:    같은 쿼리를 .all() 로 모두 읽은 뒤 인코딩해 한 번에 합침
+
+    python -m bench.export --database-url sqlite:///./bench.db
+    python -m bench.export --database-url sqlite:///./bench.db --gzip --output bench/results/export.json
+
+스트리밍 경로의 최대 메모리는 행 수와 관계없이 거의 일정해야 합니다.
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+
+def measure(fn) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows, size = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "rows": rows,
+        "bytes": size,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+        "peak_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="관리자 내보내기 메모리 벤치마크")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.core import export
+    from app.crud import export as crud_export
+    from app.database import SessionLocal, get_engine
+    get_engine()
+
+    def encoded(chunks):
+        return export.gzip_chunks(chunks) if args.gzip else chunks
+
+    results = {}
+    for name, spec in crud_export.DATASETS.items():
+        def stream(name=name, spec=spec):
+            counter = {"rows": 0}
+
+            def rows():
+                for row in crud_export.iter_rows(name):
+                    counter["rows"] += 1
+                    yield row
+            size = sum(len(chunk) for chunk in encoded(export.encode_rows(rows(), spec.column_names, "csv")))
+            return counter["rows"], size
+
+        def materialized(spec=spec):
+            db = SessionLocal()
+            try:
+                rows = spec.query(db).all()
+                payload = b"".join(encoded(export.encode_rows(rows, spec.column_names, "csv")))
+                return len(rows), len(payload)
+            finally:
+                db.close()
+
+        result = {"stream": measure(stream), "all": measure(materialized)}
+        results[name] = result
+        print(f"  {name:<13} rows {result['stream']['rows']:>8}   "
+              f"stream peak {result['stream']['peak_mb']:>7.2f} MB   all peak {result['all']['peak_mb']:>7.2f} MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"gzip": args.gzip, "results": results}, f, indent=2)
+        print(f"[export] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+이웃 피드 벤치마크 (fan-out-on-write vs fan-out-on-read)
+
+이웃이 --followers 명인 사용자 한 명이 활동을 올릴 때의 쓰기 지연과,
+그 이웃들이 피드를 읽을 때의 지연을 두 방식으로 측정합니다.
+FEED_FANOUT_LIMIT 를 바꿔 같은 데이터에서 push / pull 경로를 각각 강제합니다.
+
+    python -m bench.feed --followers 10000
+    python -m bench.feed --followers 10000 --output bench/results/feed.json
+
+측정용 DB 는 매번 새로 만듭니다. (--database-url 의 파일이 있으면 지워집니다)
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+from bench.loadtest import percentile
+
+
+def latency_summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def prepare_database(database_url: str, followers: int, seed: int) -> tuple[str, list[str]]:
+    from alembic import command
+    from app.database import SessionLocal, get_engine, alembic_config
+    from app.models import User, user_neighbors
+    from app.crud.user import recount_neighbors
+    from bench.seed import make_uuid
+
+    if database_url.startswith("sqlite:///"):
+        path = database_url[len("sqlite:///"):]
+        if os.path.exists(path):
+            os.remove(path)
+    get_engine()
+    command.upgrade(alembic_config(), "head")
+
+    rng = random.Random(seed)
+    actor_id = make_uuid(rng)
+    follower_ids = [make_uuid(rng) for _ in range(followers)]
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(User, [
+            {"id": user_id, "nickname": f"feed{i}", "email": f"feed{i}@bench.otgil", "hashed_password": "-"}
+            for i, user_id in enumerate([actor_id] + follower_ids)
+        ])
+        db.execute(user_neighbors.insert(), [{"user_id": user_id, "neighbor_id": actor_id} for user_id in follower_ids])
+        db.commit()
+        recount_neighbors(db)
+    finally:
+        db.close()
+    return actor_id, follower_ids
+
+
+def run_mode(actor_id: str, follower_ids: list[str], activities: int, reads: int, seed: int) -> dict:
+    from app.database import SessionLocal
+    from app.models import FeedVerbEnum
+    from app.crud import feed as crud_feed
+    from bench.seed import make_uuid
+
+    rng = random.Random(seed)
+    writes = []
+    db = SessionLocal()
+    try:
+        for i in range(activities):
+            started = time.perf_counter()
+            crud_feed.record_activity(db, actor_id, FeedVerbEnum.POST_CREATED, make_uuid(rng), f"게시글 {i}")
+            db.commit()
+            writes.append(time.perf_counter() - started)
+    finally:
+        db.close()
+
+    first_pages, next_pages = [], []
+    for _ in range(reads):
+        db = SessionLocal()
+        try:
+            reader = rng.choice(follower_ids)
+            started = time.perf_counter()
+            page = crud_feed.get_feed(db, reader, limit=20)
+            first_pages.append(time.perf_counter() - started)
+            if page["next_cursor"]:
+                started = time.perf_counter()
+                crud_feed.get_feed(db, reader, cursor=page["next_cursor"], limit=20)
+                next_pages.append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+    return {
+        "write": latency_summary(writes),
+        "read_first_page": latency_summary(first_pages),
+        "read_next_page": latency_summary(next_pages) if next_pages else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="이웃 피드 fan-out 방식 비교")
+    parser.add_argument("--database-url", default="sqlite:///./bench-feed.db")
+    parser.add_argument("--followers", type=int, default=10_000)
+    parser.add_argument("--activities", type=int, default=100, help="모드별 작성할 활동 수")
+    parser.add_argument("--reads", type=int, default=500, help="모드별 피드 조회 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.core import config
+
+    actor_id, follower_ids = prepare_database(args.database_url, args.followers, args.seed)
+
+    results = {}
+    # push: 제한을 이웃 수 이상으로 두어 타임라인에 복사 / pull: 제한을 낮춰 조회 시 읽기
+    for mode, limit in (("fan_out_on_write", args.followers), ("fan_out_on_read", args.followers - 1)):
+        config.FEED_FANOUT_LIMIT = limit
+        result = run_mode(actor_id, follower_ids, args.activities, args.reads, args.seed)
+        results[mode] = result
+        print(f"  {mode:<17} write p50 {result['write']['p50_ms']:8.2f} ms  p95 {result['write']['p95_ms']:8.2f} ms   "
+              f"read p50 {result['read_first_page']['p50_ms']:6.2f} ms  p95 {result['read_first_page']['p95_ms']:6.2f} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"followers": args.followers, "activities": args.activities, "results": results}, f, indent=2)
+        print(f"[feed] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
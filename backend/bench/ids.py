@@ -0,0 +1,118 @@
+"""
+PK 형식별 삽입 속도 / 인덱스 크기 비교 벤치마크
+
+credits 테이블과 같은 모양(PK + user_id 외래 키 + (user_id, date) 인덱스)의 임시 SQLite DB 를
+id 형식만 바꿔 여러 개 만들고, 같은 수의 행을 넣어 삽입 속도와 테이블/인덱스 크기를 비교합니다.
+
+    python -m bench.ids --rows 200000
+    python -m bench.ids --rows 1000000 --output bench/results/ids.json
+
+    uuid4_text : 변경 전 (36자 문자열, 무작위 순서)
+    uuid7_text : 시간 순서만 적용 (36자 문자열)
+    uuid7_blob : 변경 후 (16바이트, 시간 순서) - models.CompactUUID
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+
+from app.core.ids import uuid7
+
+BATCH_SIZE = 10_000
+
+VARIANTS = {
+    "uuid4_text": ("TEXT", lambda: str(uuid.uuid4())),
+    "uuid7_text": ("TEXT", lambda: str(uuid7())),
+    "uuid7_blob": ("BLOB", lambda: uuid7().bytes),
+}
+
+
+def run_variant(path: str, column_type: str, make_id, rows: int, users: int, lookups: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute(f"""
+        CREATE TABLE credits (
+            id {column_type} PRIMARY KEY,
+            date TIMESTAMP,
+            activity_name TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            user_id {column_type} NOT NULL
+        )""")
+    conn.execute("CREATE INDEX ix_credits_user_id_date ON credits (user_id, date)")
+
+    user_ids = [make_id() for _ in range(users)]
+    start_date = datetime.datetime(2025, 1, 1)
+    inserted_ids = []
+
+    started = time.perf_counter()
+    for offset in range(0, rows, BATCH_SIZE):
+        batch = []
+        for i in range(offset, min(offset + BATCH_SIZE, rows)):
+            row_id = make_id()
+            inserted_ids.append(row_id)
+            batch.append((row_id, (start_date + datetime.timedelta(seconds=i)).isoformat(" "),
+                          "의류 교환", rng.randint(-500, 500), rng.choice(user_ids)))
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO credits (id, date, activity_name, amount, user_id) VALUES (?, ?, ?, ?, ?)", batch)
+        conn.execute("COMMIT")
+    insert_seconds = time.perf_counter() - started
+
+    sample = rng.sample(inserted_ids, min(lookups, len(inserted_ids)))
+    started = time.perf_counter()
+    for row_id in sample:
+        conn.execute("SELECT amount FROM credits WHERE id = ?", (row_id,)).fetchone()
+    lookup_seconds = time.perf_counter() - started
+
+    sizes = dict(conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall())
+    pk_index = next((name for name in sizes if name.startswith("sqlite_autoindex_credits")), None)
+    conn.close()
+
+    return {
+        "insert_rows_per_sec": round(rows / insert_seconds, 1),
+        "lookups_per_sec": round(len(sample) / lookup_seconds, 1) if sample else None,
+        "table_bytes": sizes.get("credits", 0),
+        "pk_index_bytes": sizes.get(pk_index, 0),
+        "user_date_index_bytes": sizes.get("ix_credits_user_id_date", 0),
+        "file_bytes": os.path.getsize(path),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PK 형식별 삽입 속도 / 인덱스 크기 비교")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (column_type, make_id) in VARIANTS.items():
+            result = run_variant(os.path.join(tmp, f"{name}.db"), column_type, make_id,
+                                 args.rows, args.users, args.lookups, args.seed)
+            results[name] = result
+            print(f"  {name:<11} insert {result['insert_rows_per_sec']:>10,.0f} rows/s  "
+                  f"lookup {result['lookups_per_sec']:>9,.0f}/s  "
+                  f"table {result['table_bytes'] / 2**20:7.1f} MiB  "
+                  f"pk {result['pk_index_bytes'] / 2**20:6.1f} MiB  "
+                  f"(user_id,date) {result['user_date_index_bytes'] / 2**20:6.1f} MiB")
+
+    before, after = results["uuid4_text"], results["uuid7_blob"]
+    print(f"[ids] uuid7_blob vs uuid4_text: insert x{after['insert_rows_per_sec'] / before['insert_rows_per_sec']:.2f}, "
+          f"pk index x{after['pk_index_bytes'] / before['pk_index_bytes']:.2f}, "
+          f"file x{after['file_bytes'] / before['file_bytes']:.2f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"rows": args.rows, "users": args.users, "results": results}, f, indent=2)
+        print(f"[ids] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
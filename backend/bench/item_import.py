@@ -0,0 +1,167 @@
+"""
+아이템 일괄 등록 벤치마크 (행마다 commit vs 청크 단위 executemany)
+
+--items 행(절반은 Goodbye Tag 포함, 1% 는 일부러 잘못된 행)의 CSV 를 만들어 두 방식으로 등록합니다.
+- per_row: create_user_item + create_goodbye_tag (아이템마다 commit/refresh 2~3 번), --per-row-items 행만 측정
+- bulk:    item_import.parse_records -> crud_item.import_items (IMPORT_CHUNK_SIZE 행씩 insert/commit)
+
+    python -m bench.item_import --items 10000
+    python -m bench.item_import --items 10000 --chunk-size 1000 --output bench/results/item_import.json
+
+측정용 DB 는 매번 새로 만듭니다. (--database-url 의 파일이 있으면 지워집니다)
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import time
+
+CATEGORIES = ("티셔츠", "바지", "드레스", "자켓", "악세서리")
+HEADER = (
+    "name", "description", "category", "size", "image_url",
+    "goodbye_met_when", "goodbye_met_where", "goodbye_why_got", "goodbye_worn_count",
+    "goodbye_why_let_go", "goodbye_final_message",
+)
+
+
+def make_rows(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        row = {
+            "name": f"옷 {i}", "description": "일괄 등록 벤치마크", "category": rng.choice(CATEGORIES),
+            "size": rng.choice(("S", "M", "L")), "image_url": f"/static/items/{i}.jpg",
+        }
+        if i % 2 == 0:
+            row.update({
+                "goodbye_met_when": "2023-05", "goodbye_met_where": "서울", "goodbye_why_got": "선물",
+                "goodbye_worn_count": str(rng.randint(1, 50)), "goodbye_why_let_go": "작아져서",
+                "goodbye_final_message": "잘 지내",
+            })
+        if i % 100 == 99:
+            row["category"] = "모자"  # 검증 실패 행
+        rows.append(row)
+    return rows
+
+
+def to_csv(rows: list[dict]) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=HEADER)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def prepare_database(database_url: str) -> tuple[str, str]:
+    from alembic import command
+    from app.database import SessionLocal, get_engine, alembic_config
+    from app.models import User
+    from app.core.ids import new_id
+
+    if database_url.startswith("sqlite:///"):
+        path = database_url[len("sqlite:///"):]
+        if os.path.exists(path):
+            os.remove(path)
+    get_engine()
+    command.upgrade(alembic_config(), "head")
+
+    user_id = new_id()
+    db = SessionLocal()
+    try:
+        db.add(User(id=user_id, nickname="intake", email="intake@bench.otgil", hashed_password="-"))
+        db.commit()
+    finally:
+        db.close()
+    return user_id, "intake"
+
+
+def run_per_row(rows: list[dict], user_id: str, nickname: str) -> dict:
+    from pydantic import ValidationError
+    from app.database import SessionLocal
+    from app.schemas import ClothingItemCreate, GoodbyeTagCreate
+    from app.crud import item as crud_item
+
+    imported = failed = 0
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        for row in rows:
+            tag = {key[len("goodbye_"):]: value for key, value in row.items() if key.startswith("goodbye_")}
+            try:
+                item_in = ClothingItemCreate.model_validate(row)
+                tag_in = GoodbyeTagCreate.model_validate(tag) if tag else None
+            except ValidationError:
+                failed += 1
+                continue
+            db_item = crud_item.create_user_item(db, item_in, user_id, nickname)
+            if tag_in is not None:
+                crud_item.create_goodbye_tag(db, db_item, tag_in)
+            imported += 1
+    finally:
+        db.close()
+    return summary(imported, failed, time.perf_counter() - started)
+
+
+def run_bulk(payload: str, user_id: str, nickname: str, chunk_size: int) -> dict:
+    from app.core import item_import
+    from app.database import SessionLocal
+    from app.crud import item as crud_item
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        lines = io.StringIO(payload, newline="")
+        result = crud_item.import_items(
+            db, item_import.parse_records(lines, "csv"), user_id, nickname, chunk_size=chunk_size,
+        )
+    finally:
+        db.close()
+    return summary(result["imported"], result["failed"], time.perf_counter() - started)
+
+
+def summary(imported: int, failed: int, elapsed: float) -> dict:
+    rows = imported + failed
+    return {
+        "rows": rows,
+        "imported": imported,
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="아이템 일괄 등록 벤치마크")
+    parser.add_argument("--database-url", default="sqlite:///./bench-import.db")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--per-row-items", type=int, default=1_000, help="행마다 commit 하는 방식으로 측정할 행 수")
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.core import config
+
+    chunk_size = args.chunk_size or config.IMPORT_CHUNK_SIZE
+    user_id, nickname = prepare_database(args.database_url)
+    rows = make_rows(args.items, args.seed)
+
+    results = {
+        "per_row": run_per_row(rows[:args.per_row_items], user_id, nickname),
+        "bulk": run_bulk(to_csv(rows), user_id, nickname, chunk_size),
+    }
+    for mode, result in results.items():
+        print(f"  {mode:<8} rows {result['rows']:>7}  imported {result['imported']:>7}  failed {result['failed']:>5}  "
+              f"{result['seconds']:8.3f} s  {result['rows_per_sec']:>10} rows/s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"items": args.items, "chunk_size": chunk_size, "results": results}, f, indent=2)
+        print(f"[item_import] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+프로세스 내부 부하 테스트 하네스
+
+FastAPI 앱을 httpx ASGITransport 로 직접 구동하여 (네트워크/uvicorn 제외)
+주요 라우트의 p50/p95/p99 지연시간과 처리량을 측정하고 JSON으로 저장합니다.
+먼저 bench.seed 로 같은 DB에 데이터를 생성해 두어야 합니다.
+
+    python -m bench.loadtest --database-url sqlite:///./bench.db --requests 500 --concurrency 8
+    python -m bench.loadtest --scenario items --scenario stories
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "bench", "results")
+
+
+@dataclass
+class Scenario:
+    """측정할 라우트 하나. build(ctx, rng) 는 httpx request kwargs 를 반환합니다."""
+    name: str
+    method: str
+    path: str
+    build: Callable[["Context", random.Random], dict] = field(default=lambda ctx, rng: {})
+
+
+@dataclass
+class Context:
+    """시나리오가 공유하는 시드 데이터 정보 (토큰, 로그인 계정 등)"""
+    tokens: list[str]
+    emails: list[str]
+
+    def auth(self, rng: random.Random) -> dict:
+        return {"Authorization": f"Bearer {rng.choice(self.tokens)}"}
+
+
+def _login_form(ctx: Context, rng: random.Random) -> dict:
+    from bench.seed import BENCH_PASSWORD
+    return {"data": {"username": rng.choice(ctx.emails), "password": BENCH_PASSWORD}}
+
+
+def _page(ctx: Context, rng: random.Random) -> dict:
+    return {"params": {"skip": rng.randrange(0, 200), "limit": 20}}
+
+
+SCENARIOS = [
+    Scenario("items", "GET", "/items/", _page),
+    Scenario("parties", "GET", "/parties/"),
+    Scenario("stories", "GET", "/stories/", _page),
+    Scenario("credits_balance", "GET", "/credits/my-balance", lambda ctx, rng: {"headers": ctx.auth(rng)}),
+    Scenario("users_login", "POST", "/users/login", _login_form),
+    Scenario("users", "GET", "/users/", lambda ctx, rng: {"params": {"skip": rng.randrange(0, 1000), "limit": 100}}),
+    Scenario("posts", "GET", "/posts/", lambda ctx, rng: {"params": {"skip": rng.randrange(0, 200), "limit": 10}}),
+]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """nearest-rank 방식의 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: list[float], errors: int, wall_seconds: float) -> dict:
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        "requests": count,
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 4),
+        "throughput_rps": round(count / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": {
+            "min": round(values[0] * 1000, 3) if values else 0.0,
+            "mean": round(sum(values) / count * 1000, 3) if values else 0.0,
+            "p50": round(percentile(values, 50) * 1000, 3),
+            "p95": round(percentile(values, 95) * 1000, 3),
+            "p99": round(percentile(values, 99) * 1000, 3),
+            "max": round(values[-1] * 1000, 3) if values else 0.0,
+        },
+    }
+
+
+async def run_scenario(client, scenario: Scenario, ctx: Context, total: int, concurrency: int,
+                       warmup: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    for _ in range(warmup):
+        await client.request(scenario.method, scenario.path, **scenario.build(ctx, rng))
+
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            kwargs = scenario.build(ctx, rng)
+            started = time.perf_counter()
+            response = await client.request(scenario.method, scenario.path, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def build_context(sample_users: int) -> Context:
+    from app.database import SessionLocal, get_engine
+    from app.models import User
+    from app.core.security import create_access_token
+
+    get_engine()
+    db = SessionLocal()
+    try:
+        users = db.query(User.id, User.email).order_by(User.nickname).limit(sample_users).all()
+    finally:
+        db.close()
+    if not users:
+        sys.exit("[loadtest] 유저가 없습니다. 먼저 python -m bench.seed 를 실행하세요.")
+    return Context(
+        tokens=[create_access_token(subject=user_id) for user_id, _ in users],
+        emails=[email for _, email in users],
+    )
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main_async(args) -> dict:
+    import httpx
+    from app.main import app
+
+    ctx = build_context(args.sample_users)
+    selected = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for index, scenario in enumerate(selected):
+            # 로그인은 argon2 검증 비용이 커서 요청 수를 줄여 측정합니다.
+            total = args.requests if scenario.name != "users_login" else max(1, args.requests // 10)
+            result = await run_scenario(client, scenario, ctx, total, args.concurrency,
+                                        args.warmup, args.seed + index)
+            results[scenario.name] = {"method": scenario.method, "path": scenario.path, **result}
+            lat = result["latency_ms"]
+            print(f"  {scenario.name:<16} {result['throughput_rps']:>9.1f} req/s  "
+                  f"p50 {lat['p50']:>8.2f}ms  p95 {lat['p95']:>8.2f}ms  p99 {lat['p99']:>8.2f}ms  "
+                  f"errors {result['errors']}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주요 라우트 부하 테스트")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 측정 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--sample-users", type=int, default=200, help="토큰/로그인에 사용할 유저 수")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--fast-json", action="store_true", help="FAST_JSON 빠른 직렬화 경로로 측정")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: bench/results/loadtest-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    # app 은 import 시점에 DB URL 과 static 디렉토리(상대경로)를 사용합니다.
+    os.environ["DATABASE_URL"] = args.database_url
+    if args.fast_json:
+        os.environ["FAST_JSON"] = "1"
+    os.chdir(BACKEND_DIR)
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+
+    print(f"[loadtest] {args.database_url} requests={args.requests} concurrency={args.concurrency}")
+    results = asyncio.run(main_async(args))
+
+    started_at = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    report = {
+        "meta": {
+            "started_at": started_at,
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database_url": args.database_url,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "fast_json": args.fast_json,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"loadtest-{started_at}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[loadtest] saved {output}")
+
+
+if __name__ == "__main__":
+    main()
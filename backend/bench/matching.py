@@ -0,0 +1,98 @@
+"""
+파티 교환 매칭 인덱스 벤치마크
+
+--items 개 아이템이 나온 파티(참가자 --owners 명)의 인덱스를 메모리에 만들고
+매칭 조회 / 증분 갱신 지연을 측정합니다. (DB 없이 app.core.matching 만 사용)
+목표: 수천 개 아이템 파티에서 매칭 조회 p95 < 50 ms
+
+    python -m bench.matching --items 5000
+    python -m bench.matching --items 20000 --owners 2000 --output bench/results/matching.json
+"""
+import argparse
+import json
+import random
+import time
+
+from app.core.matching import ItemEntry, MatchIndex
+from bench.feed import latency_summary
+from bench.seed import make_uuid
+
+CATEGORIES = ["티셔츠", "바지", "드레스", "자켓", "악세서리"]
+SIZES = ["XS", "S", "M", "L", "XL", "FREE"]
+
+
+def make_entries(rng: random.Random, items: int, owners: int) -> tuple[list[str], list[ItemEntry]]:
+    owner_ids = [make_uuid(rng) for _ in range(owners)]
+    # 사람마다 주로 입는 사이즈 1~2개
+    owner_sizes = {owner_id: rng.sample(SIZES, rng.randint(1, 2)) for owner_id in owner_ids}
+    entries = []
+    for i in range(items):
+        owner_id = rng.choice(owner_ids)
+        entries.append(ItemEntry(
+            id=make_uuid(rng), owner_id=owner_id, owner_nickname=f"user{owner_id[:6]}",
+            category=rng.choice(CATEGORIES), size=rng.choice(owner_sizes[owner_id]),
+            name=f"아이템 {i}", image_url=f"/static/images/{i}.jpg",
+        ))
+    return owner_ids, entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="파티 교환 매칭 인덱스 벤치마크")
+    parser.add_argument("--items", type=int, default=5_000)
+    parser.add_argument("--owners", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    owner_ids, entries = make_entries(rng, args.items, args.owners)
+
+    started = time.perf_counter()
+    index = MatchIndex("bench")
+    index.load(entries)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    default_queries, filtered_queries = [], []
+    two_way_hits = 0
+    for _ in range(args.queries):
+        user_id = rng.choice(owner_ids)
+        started = time.perf_counter()
+        matches = index.match(user_id, limit=args.limit)
+        default_queries.append(time.perf_counter() - started)
+        two_way_hits += sum(1 for match in matches if match.two_way)
+
+        started = time.perf_counter()
+        index.match(user_id, sizes=rng.sample(SIZES, 2), categories=rng.sample(CATEGORIES, 2), limit=args.limit)
+        filtered_queries.append(time.perf_counter() - started)
+
+    updates = []
+    for _ in range(args.queries):
+        victim = rng.choice(entries)
+        started = time.perf_counter()
+        index.remove(victim.id)
+        index.upsert(victim)
+        updates.append(time.perf_counter() - started)
+
+    results = {
+        "build_ms": round(build_ms, 3),
+        "match_own_sizes": latency_summary(default_queries),
+        "match_filtered": latency_summary(filtered_queries),
+        "update": latency_summary(updates),
+        "two_way_ratio": round(two_way_hits / (args.queries * args.limit), 4),
+    }
+    print(f"  build {results['build_ms']:8.2f} ms ({args.items} items, {args.owners} owners)")
+    for name in ("match_own_sizes", "match_filtered", "update"):
+        print(f"  {name:<16} p50 {results[name]['p50_ms']:7.3f} ms  p95 {results[name]['p95_ms']:7.3f} ms  "
+              f"max {results[name]['max_ms']:7.3f} ms")
+    print(f"[matching] two-way share of returned candidates: {results['two_way_ratio']:.1%}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"items": args.items, "owners": args.owners, "results": results}, f, indent=2)
+        print(f"[matching] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+라우트별 SQL 쿼리 수 검사 (N+1 / 경로 별칭 불일치)
+
+시드 데이터가 들어 있는 DB 에 대해 앱을 httpx ASGITransport 로 구동하고, 요청 하나가 실행한 SELECT 수를 셉니다.
+- 목록 라우트는 limit 을 바꿔 두 번 호출하여 쿼리 수가 페이지 크기에 따라 늘면 실패 (N+1)
+- 같은 핸들러를 공유하는 별칭 경로(/community/stories 등)는 정식 경로와 쿼리 수가 다르면 실패
+
+    python -m bench.seed --database-url sqlite:///./bench.db --profile small
+    python -m bench.queries --database-url sqlite:///./bench.db
+    python -m bench.queries --database-url sqlite:///./bench.db --fast-json --output bench/results/queries.json
+
+상세 응답 캐시(get_item_detail 등)가 결과를 바꾸지 않도록 각 경로의 첫 요청만 셉니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+SMALL_PAGE, LARGE_PAGE = 5, 20
+
+
+@dataclass
+class Case:
+    name: str
+    path: str  # sample_ids 키로 포맷 ("/stories/{story}")
+    # 페이지 크기 파라미터 이름. 있으면 SMALL_PAGE / LARGE_PAGE 로 두 번 호출해 비교
+    page_param: Optional[str] = None
+    auth: bool = False
+    # 같은 핸들러의 정식 경로 케이스 이름 (쿼리 수가 같아야 함)
+    alias_of: Optional[str] = None
+    params: Optional[dict] = None
+
+
+CASES = [
+    # --- items (crud/item 하나로 /items, /clothing 모두 처리) ---
+    Case("items", "/items/", page_param="limit"),
+    Case("items_tags_summary", "/items/", page_param="limit", params={"tags": "summary"}),
+    Case("my_items", "/items/my-items", auth=True),
+    Case("my_items_tags_none", "/items/my-items", auth=True, params={"tags": "none"}),
+    Case("item_detail", "/clothing/{item}"),
+    # --- stories (routers/story 하나를 /stories, /community/stories 에 붙임) ---
+    Case("stories", "/stories/", page_param="limit"),
+    Case("community_stories", "/community/stories", page_param="limit", alias_of="stories"),
+    Case("story", "/stories/{story}"),
+    Case("stories_fields", "/stories/", page_param="limit", params={"fields": "id,title,excerpt,likes"}),
+    Case("community_story", "/community/stories/{story}", alias_of="story"),
+    # --- 그 밖의 목록 ---
+    Case("parties", "/parties/", page_param="limit"),
+    Case("parties_fields", "/parties/", page_param="limit", params={"fields": "id,title,date,image_url"}),
+    Case("party", "/parties/{party}"),
+    Case("posts", "/posts/", page_param="limit"),
+    Case("makers", "/makers/"),
+]
+
+
+async def count_queries(client, engine, method: str, path: str, **kwargs) -> tuple[int, int]:
+    """(응답 코드, 요청 하나가 실행한 SELECT 수)"""
+    from sqlalchemy import event
+
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = await client.request(method, path, **kwargs)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return response.status_code, len(captured)
+
+
+async def run(cases: list[Case], ids: dict, token: str) -> dict:
+    import httpx
+    from app.database import get_engine
+    from app.main import app
+
+    engine = get_engine()
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for case in cases:
+            path = case.path.format(**ids)
+            headers = {"Authorization": f"Bearer {token}"} if case.auth else {}
+            params = case.params or {}
+            if case.page_param:
+                status, small = await count_queries(client, engine, "GET", path, headers=headers,
+                                                    params={**params, case.page_param: SMALL_PAGE})
+                _, large = await count_queries(client, engine, "GET", path, headers=headers,
+                                               params={**params, case.page_param: LARGE_PAGE})
+            else:
+                status, small = await count_queries(client, engine, "GET", path, headers=headers, params=params)
+                large = small
+            results[case.name] = {"path": path, "status": status, "queries": small, "queries_large_page": large}
+    return results
+
+
+def check(cases: list[Case], results: dict) -> list[str]:
+    problems = []
+    for case in cases:
+        result = results[case.name]
+        if result["status"] >= 400:
+            problems.append(f"{case.name}: HTTP {result['status']}")
+            continue
+        if result["queries_large_page"] > result["queries"]:
+            problems.append(f"{case.name}: limit {SMALL_PAGE} -> {LARGE_PAGE} 에서 쿼리 "
+                            f"{result['queries']} -> {result['queries_large_page']} (N+1)")
+        if case.alias_of and case.alias_of in results and results[case.alias_of]["queries"] != result["queries"]:
+            problems.append(f"{case.name}: {case.alias_of} 와 쿼리 수가 다름 "
+                            f"({results[case.alias_of]['queries']} vs {result['queries']})")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라우트별 SQL 쿼리 수 검사")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--case", action="append", choices=[c.name for c in CASES])
+    parser.add_argument("--fast-json", action="store_true", help="FAST_JSON 빠른 직렬화 경로로 검사")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    if args.fast_json:
+        os.environ["FAST_JSON"] = "1"
+    from app.database import SessionLocal
+    from bench.explain import sample_ids
+    from bench.loadtest import build_context
+
+    token = build_context(1).tokens[0]
+    db = SessionLocal()
+    try:
+        ids = sample_ids(db)
+    finally:
+        db.close()
+
+    cases = [c for c in CASES if not args.case or c.name in args.case]
+    results = asyncio.run(run(cases, ids, token))
+    for case in cases:
+        result = results[case.name]
+        print(f"  {case.name:<18} {result['path'][:40]:<40} HTTP {result['status']}  "
+              f"queries {result['queries']:>3}  (limit {LARGE_PAGE}: {result['queries_large_page']})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"fast_json": args.fast_json, "results": results}, f, indent=2)
+        print(f"[queries] saved {args.output}")
+
+    problems = check(cases, results)
+    for problem in problems:
+        print(f"  FAIL {problem}")
+    if problems:
+        sys.exit(1)
+    print(f"[queries] OK ({len(cases)} cases)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+합성 데이터 생성기 (부하 테스트용)
+
+기존 SQLAlchemy 모델을 그대로 사용하여 실제 서비스와 비슷한 분포의 데이터를 대량으로 넣습니다.
+같은 --seed 값이면 항상 같은 데이터(같은 ID)가 생성되므로 실행 간 결과 비교가 가능합니다.
+
+    python -m bench.seed --database-url sqlite:///./bench.db --profile full
+    python -m bench.seed --database-url sqlite:///./bench.db --profile small --users 5000
+"""
+import argparse
+import datetime
+import itertools
+import os
+import random
+import string
+import time
+import uuid
+
+# 모든 시드 유저가 공유하는 비밀번호 (로그인 시나리오에서 사용)
+BENCH_PASSWORD = "bench-password"
+BENCH_EMAIL_DOMAIN = "bench.otgil"
+
+PROFILES = {
+    # 로컬에서 빠르게 돌려볼 수 있는 크기
+    "small": dict(
+        users=2_000, items=20_000, credits=100_000, parties=200,
+        participants_per_party=150, stories=1_000, max_likes=1_000,
+        comments=5_000, posts=2_000, neighbors_per_user=5,
+    ),
+    # 운영 규모 목표치
+    "full": dict(
+        users=100_000, items=1_000_000, credits=5_000_000, parties=5_000,
+        participants_per_party=400, stories=20_000, max_likes=5_000,
+        comments=100_000, posts=50_000, neighbors_per_user=10,
+    ),
+}
+
+CHUNK_SIZE = 10_000
+TAG_NAMES = ["빈티지", "데님", "업사이클", "미니멀", "스트릿", "오피스룩", "캠퍼스", "여름", "겨울", "교환후기"]
+LOCATIONS = ["서울 성동구", "서울 마포구", "서울 강남구", "부산 해운대구", "대전 유성구", "광주 동구"]
+SIZES = ["XS", "S", "M", "L", "XL", "FREE"]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 생성")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    # 프로필 값을 개별적으로 덮어쓸 수 있습니다.
+    for key in PROFILES["small"]:
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+# 시드 id 의 기준 시각 (2025-01-01 UTC). 생성 순서대로 1ms 씩 증가시킵니다.
+SEED_EPOCH_MS = 1_735_689_600_000
+_id_sequence = itertools.count()
+
+
+def make_uuid(rng: random.Random) -> str:
+    """rng 기반 UUIDv7 문자열 (재현 가능, 서비스의 app.core.ids.new_id 와 같은 배치)"""
+    ms = SEED_EPOCH_MS + next(_id_sequence)
+    value = ms << 80 | 0x7 << 76 | rng.getrandbits(12) << 64 | 0b10 << 62 | rng.getrandbits(62)
+    return str(uuid.UUID(int=value))
+
+
+def invitation_code(i: int) -> str:
+    """인덱스를 6자리 36진수로 변환하여 유일한 초대 코드를 만듭니다."""
+    chars = string.digits + string.ascii_uppercase
+    code = ""
+    for _ in range(6):
+        i, r = divmod(i, 36)
+        code = chars[r] + code
+    return code
+
+
+def chunked(rows, size=CHUNK_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Seeder:
+    def __init__(self, db, rng: random.Random, counts: dict):
+        self.db = db
+        self.rng = rng
+        self.counts = counts
+        self.user_ids: list[str] = []
+        self.party_ids: list[str] = []
+        self.story_ids: list[str] = []
+
+    def _insert(self, label, model_or_table, rows):
+        """chunk 단위로 insert + commit 하여 메모리를 일정하게 유지합니다."""
+        from app.database import Base
+
+        started = time.perf_counter()
+        total = 0
+        for batch in chunked(rows):
+            if isinstance(model_or_table, type) and issubclass(model_or_table, Base):
+                self.db.bulk_insert_mappings(model_or_table, batch)
+            else:
+                self.db.execute(model_or_table.insert(), batch)
+            self.db.commit()
+            total += len(batch)
+        print(f"  {label:<22} {total:>10,} rows  {time.perf_counter() - started:7.1f}s")
+
+    # --- 엔티티별 생성 ---
+
+    def users(self):
+        from app.models import User
+        from app.crud.user import get_password_hash
+
+        # argon2 해시는 느리므로 한 번만 계산하여 모든 유저가 공유합니다.
+        hashed = get_password_hash(BENCH_PASSWORD)
+        self.user_ids = [make_uuid(self.rng) for _ in range(self.counts["users"])]
+
+        def rows():
+            for i, user_id in enumerate(self.user_ids):
+                yield {
+                    "id": user_id,
+                    "nickname": f"user{i}",
+                    "email": f"user{i}@{BENCH_EMAIL_DOMAIN}",
+                    "phone_number": f"010-{i // 10000 % 10000:04d}-{i % 10000:04d}",
+                    "is_admin": i == 0,
+                    "hashed_password": hashed,
+                }
+
+        self._insert("users", User, rows())
+
+    def neighbors(self):
+        from app.models import user_neighbors
+
+        rng, ids, per_user = self.rng, self.user_ids, self.counts["neighbors_per_user"]
+
+        def rows():
+            for user_id in ids:
+                for neighbor_id in set(rng.sample(ids, min(per_user, len(ids)))):
+                    if neighbor_id != user_id:
+                        yield {"user_id": user_id, "neighbor_id": neighbor_id}
+
+        self._insert("user_neighbors", user_neighbors, rows())
+        # 대량 insert 는 crud_user.add_neighbor 를 거치지 않으므로 이웃 수를 한 번에 다시 계산합니다.
+        from app.crud.user import recount_neighbors
+        recount_neighbors(self.db)
+
+    def parties(self):
+        from app.models import Party, PartyStatusEnum
+
+        rng = self.rng
+        today = datetime.date.today()
+        statuses = [PartyStatusEnum.UPCOMING] * 5 + [PartyStatusEnum.COMPLETED] * 4 + \
+                   [PartyStatusEnum.PENDING_APPROVAL, PartyStatusEnum.REJECTED]
+        self.party_ids = [make_uuid(rng) for _ in range(self.counts["parties"])]
+
+        def rows():
+            for i, party_id in enumerate(self.party_ids):
+                status = rng.choice(statuses)
+                offset = rng.randint(1, 180)
+                date = today - datetime.timedelta(days=offset) if status == PartyStatusEnum.COMPLETED \
+                    else today + datetime.timedelta(days=offset)
+                yield {
+                    "id": party_id,
+                    "title": f"21% 파티 #{i}",
+                    "description": "옷장 속 잠든 옷을 교환하는 파티입니다. " * rng.randint(2, 10),
+                    "date": date,
+                    "location": rng.choice(LOCATIONS),
+                    "image_url": f"/static/parties/{i}.jpg",
+                    "details": ["1인당 최대 5벌", "세탁 후 지참"],
+                    "status": status,
+                    "invitation_code": invitation_code(i),
+                    "host_id": rng.choice(self.user_ids),
+                }
+
+        self._insert("parties", Party, rows())
+
+    def participations(self):
+        from app.models import PartyParticipation, PartyParticipantStatusEnum
+
+        rng = self.rng
+        statuses = list(PartyParticipantStatusEnum)
+        per_party = min(self.counts["participants_per_party"], len(self.user_ids))
+
+        def rows():
+            for party_id in self.party_ids:
+                size = rng.randint(per_party // 2, per_party)
+                for user_id in rng.sample(self.user_ids, size):
+                    yield {"party_id": party_id, "user_id": user_id, "status": rng.choice(statuses)}
+
+        self._insert("party_participations", PartyParticipation, rows())
+
+    def items(self):
+        from app.models import ClothingItem, GoodbyeTag, ClothingCategoryEnum, PartySubmissionStatusEnum
+
+        rng = self.rng
+        categories = list(ClothingCategoryEnum)
+        submission_statuses = list(PartySubmissionStatusEnum)
+        tagged_item_ids = []
+
+        def rows():
+            for i in range(self.counts["items"]):
+                item_id = make_uuid(rng)
+                owner = rng.randrange(len(self.user_ids))
+                submitted = rng.random() < 0.2
+                if rng.random() < 0.3:
+                    tagged_item_ids.append(item_id)
+                yield {
+                    "id": item_id,
+                    "name": f"아이템 {i}",
+                    "description": "상태 좋은 옷입니다.",
+                    "category": rng.choice(categories),
+                    "size": rng.choice(SIZES),
+                    "image_url": f"/static/items/{i}.jpg",
+                    "user_nickname": f"user{owner}",
+                    "user_id": self.user_ids[owner],
+                    "is_listed_for_exchange": rng.random() < 0.4,
+                    "party_submission_status": rng.choice(submission_statuses) if submitted else None,
+                    "submitted_party_id": rng.choice(self.party_ids) if submitted and self.party_ids else None,
+                }
+
+        self._insert("clothing_items", ClothingItem, rows())
+
+        def tag_rows():
+            for item_id in tagged_item_ids:
+                yield {
+                    "clothing_item_id": item_id,
+                    "met_when": "2021년 봄",
+                    "met_where": "동네 편집숍",
+                    "why_got": "색감이 마음에 들어서 " * rng.randint(1, 20),
+                    "worn_count": rng.randint(0, 50),
+                    "why_let_go": "사이즈가 맞지 않아서",
+                    "final_message": "새 주인에게 사랑받길!",
+                }
+
+        self._insert("goodbye_tags", GoodbyeTag, tag_rows())
+
+    def credits(self):
+        from app.models import Credit, CreditTypeEnum
+
+        rng = self.rng
+        now = datetime.datetime.utcnow()
+        earn_types = [CreditTypeEnum.EARNED_CLOTHING, CreditTypeEnum.EARNED_EVENT]
+        spend_types = [CreditTypeEnum.SPENT_REWARD, CreditTypeEnum.SPENT_OFFSET, CreditTypeEnum.SPENT_MAKER_PURCHASE]
+
+        def rows():
+            for _ in range(self.counts["credits"]):
+                earned = rng.random() < 0.75
+                yield {
+                    "id": make_uuid(rng),
+                    "date": now - datetime.timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+                    "activity_name": "의류 교환 적립" if earned else "리워드 교환",
+                    "type": rng.choice(earn_types if earned else spend_types),
+                    "amount": rng.randint(10, 500) if earned else -rng.randint(10, 300),
+                    "user_id": rng.choice(self.user_ids),
+                }
+
+        self._insert("credits", Credit, rows())
+
+    def stories(self):
+        from app.models import Story, Tag, Comment, story_likes, story_tags
+
+        rng = self.rng
+        self.db.bulk_insert_mappings(Tag, [{"id": i + 1, "name": name} for i, name in enumerate(TAG_NAMES)])
+        self.db.commit()
+
+        owners = {}
+        self.story_ids = [make_uuid(rng) for _ in range(self.counts["stories"])]
+
+        def rows():
+            for i, story_id in enumerate(self.story_ids):
+                owner = rng.randrange(len(self.user_ids))
+                owners[story_id] = owner
+                yield {
+                    "id": story_id,
+                    "title": f"교환 후기 #{i}",
+                    "author": f"user{owner}",
+                    "excerpt": "파티에서 만난 옷 이야기",
+                    "content": "오늘 파티에서 멋진 자켓을 만났어요. " * rng.randint(10, 60),
+                    "image_url": f"/static/stories/{i}.jpg",
+                    "user_id": self.user_ids[owner],
+                    "party_id": rng.choice(self.party_ids),
+                }
+
+        self._insert("stories", Story, rows())
+
+        def like_rows():
+            max_likes = min(self.counts["max_likes"], len(self.user_ids))
+            for story_id in self.story_ids:
+                # 소수의 인기 스토리에 좋아요가 몰리는 분포 (수천 개)
+                size = max_likes if rng.random() < 0.02 else rng.randint(0, max(1, max_likes // 50))
+                for user_id in rng.sample(self.user_ids, size):
+                    yield {"story_id": story_id, "user_id": user_id}
+
+        self._insert("story_likes", story_likes, like_rows())
+
+        def tag_rows():
+            for story_id in self.story_ids:
+                for tag_id in rng.sample(range(1, len(TAG_NAMES) + 1), rng.randint(1, 3)):
+                    yield {"story_id": story_id, "tag_id": tag_id}
+
+        self._insert("story_tags", story_tags, tag_rows())
+
+        def comment_rows():
+            now = datetime.datetime.utcnow()
+            for _ in range(self.counts["comments"]):
+                author = rng.randrange(len(self.user_ids))
+                yield {
+                    "id": make_uuid(rng),
+                    "author_nickname": f"user{author}",
+                    "text": "좋은 이야기 감사합니다!",
+                    "timestamp": now - datetime.timedelta(minutes=rng.randint(0, 60 * 24 * 90)),
+                    "story_id": rng.choice(self.story_ids),
+                    "user_id": self.user_ids[author],
+                }
+
+        self._insert("comments", Comment, comment_rows())
+
+    def posts(self):
+        from app.models import Post
+
+        rng = self.rng
+        now = datetime.datetime.utcnow()
+
+        def rows():
+            for i in range(self.counts["posts"]):
+                created = now - datetime.timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+                yield {
+                    "post_id": make_uuid(rng),
+                    "user_id": rng.choice(self.user_ids),
+                    "title": f"게시글 {i}",
+                    "content": "옷 관리 팁을 공유합니다. " * rng.randint(5, 40),
+                    "image_url": None,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+
+        self._insert("posts", Post, rows())
+
+    def catalog(self):
+        from app.models import Reward, Maker, MakerProduct, RewardTypeEnum
+
+        rng = self.rng
+        self._insert("rewards", Reward, (
+            {
+                "id": make_uuid(rng), "name": f"리워드 {i}", "description": "친환경 굿즈",
+                "cost": rng.randint(100, 2000), "image_url": f"/static/rewards/{i}.jpg",
+                "type": rng.choice(list(RewardTypeEnum)),
+            } for i in range(50)
+        ))
+        maker_ids = [make_uuid(rng) for _ in range(30)]
+        self._insert("makers", Maker, (
+            {
+                "id": maker_id, "name": f"메이커 {i}", "specialty": "업사이클링",
+                "location": rng.choice(LOCATIONS), "bio": "버려지는 옷에 새 생명을 " * 5,
+                "image_url": f"/static/makers/{i}.jpg",
+            } for i, maker_id in enumerate(maker_ids)
+        ))
+        self._insert("maker_products", MakerProduct, (
+            {
+                "id": make_uuid(rng), "name": f"굿즈 {i}", "description": "업사이클 에코백",
+                "price": rng.randint(100, 3000), "image_url": f"/static/products/{i}.jpg",
+                "maker_id": rng.choice(maker_ids),
+            } for i in range(300)
+        ))
+
+    def run(self):
+        self.users()
+        self.neighbors()
+        self.parties()
+        self.participations()
+        self.items()
+        self.credits()
+        self.stories()
+        self.posts()
+        self.catalog()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    counts = dict(PROFILES[args.profile])
+    for key in counts:
+        override = getattr(args, key)
+        if override is not None:
+            counts[key] = override
+
+    # app.database 는 import 시점에 DATABASE_URL 을 읽으므로 먼저 설정합니다.
+    os.environ["DATABASE_URL"] = args.database_url
+    from alembic import command
+    from sqlalchemy import text
+    from app.database import Base, get_engine, SessionLocal, alembic_config
+    from app import models  # noqa: F401  (테이블 메타데이터 등록)
+
+    print(f"[seed] {args.database_url} profile={args.profile} seed={args.seed}")
+    engine = get_engine()
+    # 기존 데이터를 지우고 마이그레이션으로 스키마를 새로 만듭니다. (운영과 같은 스키마로 측정)
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    command.upgrade(alembic_config(), "head")
+
+    db = SessionLocal()
+    if engine.dialect.name == "sqlite":
+        # 대량 적재 중에는 fsync를 생략하여 시드 시간을 줄입니다. (벤치마크 DB 전용)
+        db.execute(text("PRAGMA journal_mode=WAL"))
+        db.execute(text("PRAGMA synchronous=OFF"))
+
+    started = time.perf_counter()
+    try:
+        Seeder(db, random.Random(args.seed), counts).run()
+    finally:
+        db.close()
+    print(f"[seed] done in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+목록 API 직렬화 경로 비교 벤치마크
+
+기존 경로(ORM 조회 -> from_attributes 검증 -> JSON 인코딩)와
+FAST_JSON 경로(컬럼 프로젝션 -> orjson 인코딩), 희소 필드셋 경로(?fields= 목록 화면용 필드만 프로젝션)의
+처리량 / 응답 바이트 / 최대 메모리(tracemalloc)를 HTTP 계층 없이 비교합니다.
+
+    python -m bench.serialization --database-url sqlite:///./bench.db --iterations 200
+
+전체 요청 단위 비교는 bench.loadtest 를 --fast-json 유무로 두 번 실행한 뒤 bench.compare 로 확인합니다.
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+# 희소 필드셋 경로에서 쓰는 목록 화면용 필드 (제목/썸네일 위주)
+SPARSE_FIELDS = {
+    "items": "id,name,category,size,image_url",
+    "parties": "id,title,date,location,image_url",
+    "stories": "id,title,excerpt,image_url,likes",
+    "posts": "post_id,title,image_url,created_at",
+    "makers": "id,name,specialty,image_url",
+}
+
+
+def measure(fn, iterations: int) -> dict:
+    """fn() 은 (직렬화된 bytes, 행 수) 를 반환합니다."""
+    fn()  # warmup
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rows = size = 0
+    started = time.perf_counter()
+    for _ in range(iterations):
+        payload, count = fn()
+        rows += count
+        size += len(payload)
+    elapsed = time.perf_counter() - started
+    return {
+        "ops_per_sec": round(iterations / elapsed, 2),
+        "rows_per_sec": round(rows / elapsed, 2),
+        "ms_per_op": round(elapsed / iterations * 1000, 3),
+        "bytes_per_op": size // iterations,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def build_cases(limit: int):
+    from typing import List
+    from pydantic import TypeAdapter
+    from app import schemas
+    from app.core import fields as fieldsets
+    from app.crud import (
+        item as crud_item, maker as crud_maker, party as crud_party, post as crud_post, story as crud_story,
+        user as crud_user,
+    )
+
+    def legacy(schema, fetch):
+        adapter = TypeAdapter(List[schema])
+
+        def run(db):
+            objs = fetch(db)
+            validated = adapter.validate_python(objs, from_attributes=True)
+            return json.dumps(adapter.dump_python(validated, mode="json")).encode(), len(objs)
+        return run
+
+    def fast(fetch):
+        import orjson
+
+        def run(db):
+            rows = fetch(db)
+            return orjson.dumps(rows), len(rows)
+        return run
+
+    def sparse(name, schema, fetch, always=("id",)):
+        import orjson
+
+        fields = fieldsets.parse(SPARSE_FIELDS[name], schema, always)
+
+        def run(db):
+            rows = fetch(db, fields)
+            return orjson.dumps(fieldsets.serialize(schema, fields, rows)), len(rows)
+        return run
+
+    return {
+        "items": (
+            legacy(schemas.ClothingItemResponse, lambda db: crud_item.get_items_for_exchange(db, limit=limit)),
+            fast(lambda db: crud_item.get_items_for_exchange_rows(db, limit=limit)),
+            sparse("items", schemas.ClothingItemResponse,
+                   lambda db, fields: crud_item.get_items_for_exchange_rows(db, limit=limit, fields=fields)),
+        ),
+        "parties": (
+            legacy(schemas.PartyResponse, lambda db: crud_party.get_parties(db, status="UPCOMING", limit=limit)),
+            fast(lambda db: crud_party.get_parties_rows(db, status="UPCOMING", limit=limit)),
+            sparse("parties", schemas.PartyResponse,
+                   lambda db, fields: crud_party.get_parties_rows(db, status="UPCOMING", limit=limit, fields=fields)),
+        ),
+        "stories": (
+            legacy(schemas.StoryResponse, lambda db: crud_story.get_stories(db, limit=limit)),
+            fast(lambda db: crud_story.get_stories_rows(db, limit=limit)),
+            sparse("stories", schemas.StoryResponse,
+                   lambda db, fields: crud_story.get_stories_rows(db, limit=limit, fields=fields)),
+        ),
+        "posts": (
+            legacy(schemas.Post, lambda db: crud_post.get_post_list(db, limit=limit)),
+            fast(lambda db: crud_post.get_post_list_rows(db, limit=limit)),
+            sparse("posts", schemas.Post,
+                   lambda db, fields: crud_post.get_post_list_rows(db, limit=limit, fields=fields), ("post_id",)),
+        ),
+        "makers": (
+            legacy(schemas.MakerResponse, lambda db: crud_maker.get_makers.uncached(db)),
+            fast(lambda db: crud_maker.get_makers_rows(db)),
+            sparse("makers", schemas.MakerResponse, lambda db, fields: crud_maker.get_makers_rows(db, fields)),
+        ),
+        "users": (
+            legacy(schemas.UserResponse, lambda db: crud_user.get_users(db, limit=limit)),
+            fast(lambda db: crud_user.get_users_rows(db, limit=limit)),
+            None,
+        ),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="직렬화 경로 비교 벤치마크")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", "sqlite:///./bench.db"))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=100, help="한 번에 조회할 행 수")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    from app.database import SessionLocal, get_engine
+    get_engine()
+
+    results = {}
+    for name, (legacy_fn, fast_fn, sparse_fn) in build_cases(args.limit).items():
+        result = {}
+        runs = (("legacy", legacy_fn), ("fast_json", fast_fn), ("sparse", sparse_fn))
+        for label, fn in [(label, fn) for label, fn in runs if fn is not None]:
+            # 매 반복마다 새 세션을 사용하여 identity map 재사용 효과를 배제합니다.
+            def once(fn=fn):
+                db = SessionLocal()
+                try:
+                    return fn(db)
+                finally:
+                    db.close()
+            result[label] = measure(once, args.iterations)
+        result["speedup"] = round(result["fast_json"]["ops_per_sec"] / result["legacy"]["ops_per_sec"], 2)
+        results[name] = result
+        print(f"  {name:<8} legacy {result['legacy']['ops_per_sec']:>8.1f} ops/s   "
+              f"fast_json {result['fast_json']['ops_per_sec']:>8.1f} ops/s   x{result['speedup']}")
+        if "sparse" in result:
+            print(f"  {'':<8} bytes/page {result['fast_json']['bytes_per_op']:>9} -> {result['sparse']['bytes_per_op']:>9} (sparse)   "
+                  f"peak {result['fast_json']['peak_kb']:>8.1f} KB -> {result['sparse']['peak_kb']:>8.1f} KB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"limit": args.limit, "iterations": args.iterations, "results": results}, f, indent=2)
+        print(f"[serialization] saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -390,7 +390,7 @@ const App: React.FC = () => {
     // [API 4] Community: Stories & Reports
     const fetchStories = useCallback(async () => {
         try {
-            const response = await fetch("http://localhost:8000/community/stories");
+            const response = await fetch("http://localhost:8000/stories/");
             if (response.ok) {
                 const data = await response.json();
                 // Backend snake_case -> Frontend camelCase
@@ -429,7 +429,7 @@ const App: React.FC = () => {
     // 특정 스토리의 상세 정보(댓글 포함)를 가져오는 함수
     const fetchStoryDetail = useCallback(async (storyId: string) => {
         try {
-            const response = await fetch(`http://localhost:8000/community/stories/${storyId}`);
+            const response = await fetch(`http://localhost:8000/stories/${storyId}`);
             if (response.ok) {
                 const data = await response.json();
                 // 댓글 데이터 매핑
@@ -805,13 +805,13 @@ const App: React.FC = () => {
         try {
             let response;
             if (storyData.id) { // Update
-                response = await fetch(`http://localhost:8000/community/stories/${storyData.id}`, {
+                response = await fetch(`http://localhost:8000/stories/${storyData.id}`, {
                     method: "PATCH",
                     headers: { "Content-Type": "application/json", "Authorization": `Bearer ${token}` },
                     body: JSON.stringify(payload)
                 });
             } else { // Create
-                response = await fetch("http://localhost:8000/community/stories", {
+                response = await fetch("http://localhost:8000/stories/", {
                     method: "POST",
                     headers: { "Content-Type": "application/json", "Authorization": `Bearer ${token}` },
                     body: JSON.stringify(payload)
@@ -837,7 +837,7 @@ const App: React.FC = () => {
         
         const token = localStorage.getItem('access_token');
         try {
-            const response = await fetch(`http://localhost:8000/community/stories/${storyId}`, {
+            const response = await fetch(`http://localhost:8000/stories/${storyId}`, {
                 method: "DELETE",
                 headers: { "Authorization": `Bearer ${token}` }
             });
@@ -866,7 +866,7 @@ const App: React.FC = () => {
         }
         const token = localStorage.getItem('access_token');
         try {
-            const response = await fetch(`http://localhost:8000/community/stories/${storyId}/like`, {
+            const response = await fetch(`http://localhost:8000/stories/${storyId}/like`, {
                 method: "POST",
                 headers: { "Authorization": `Bearer ${token}` }
             });
@@ -885,7 +885,7 @@ const App: React.FC = () => {
         if (!currentUser) return;
         const token = localStorage.getItem('access_token');
         try {
-            const response = await fetch(`http://localhost:8000/community/stories/${storyId}/comments`, {
+            const response = await fetch(`http://localhost:8000/stories/${storyId}/comments`, {
                 method: "POST",
                 headers: { 
                     "Content-Type": "application/json",